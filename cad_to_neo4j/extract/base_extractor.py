@@ -11,21 +11,29 @@ Classes:
 import logging
 import traceback
 
-from typing import Optional, Dict, List, Any, Callable
+from typing import Optional, Dict, List, Any, Callable, Tuple
 import inspect
 
 import adsk.core
 
 from ..utils.extraction_utils import nested_getattr, nested_hasattr
 from ..utils.extraction_utils import helper_extraction_error
+from ..utils.extraction_utils import collection_tokens
+from ..utils.extraction_utils import materialise, parallel_map
 from ..utils.logger_utils import logger_utility
 
 __all__ = ['BaseExtractor']
 
+# The class hierarchy only depends on the Fusion class, not on the instance,
+# so it is computed once per class and reused for every extracted object.
+_CLASS_HIERARCHY_CACHE: Dict[type, Tuple[str, ...]] = {}
+
 
 class BaseExtractor(object):
     """Base class for extracting basic properties from CAD objects."""
 
+    __slots__ = ('_obj', '_type')
+
     def __init__(self, obj: adsk.core.Base):
         """Initialises the BaseExtractor with a CAD object.
 
@@ -34,7 +42,44 @@ class BaseExtractor(object):
         """
         self._obj = obj
         self._type = None  # Initialise the type to None
-        self.logger: logging.Logger = logger_utility.logger
+
+    @classmethod
+    def extract_many(cls, objs: Any) -> List[Optional[Dict[str, Any]]]:
+        """Extracts the information of every object in a collection.
+
+        The collection is read across the API once and each object is
+        extracted with this class, without dispatching on its type.
+
+        Args:
+            objs: A Fusion collection (or any iterable) of CAD objects that
+                this extractor handles.
+
+        Returns:
+            List[Optional[Dict[str, Any]]]: The extracted information, in
+                collection order.
+        """
+        return list(parallel_map(cls._extract_one, materialise(objs)))
+
+    @classmethod
+    def _extract_one(cls, obj: adsk.core.Base) -> Optional[Dict[str, Any]]:
+        """Extracts the information of a single CAD object.
+
+        Args:
+            obj: The CAD object to extract information from.
+
+        Returns:
+            Optional[Dict[str, Any]]: The extracted information.
+        """
+        return cls(obj).extract_info()
+
+    @property
+    def logger(self) -> logging.Logger:
+        """The application logger shared by all extractors.
+
+        Returns:
+            logging.Logger: The logger configured by logger_utility.
+        """
+        return logger_utility.logger
 
     def extract_info(self) -> Dict[str, Optional[str]]:
         """Extracts basic information (name, type, id token) of the CAD object.
@@ -94,7 +139,8 @@ class BaseExtractor(object):
             int: The timeline index of the Sketch object, or None if not
             available.
         """
-        return nested_getattr(self._obj, 'timelineObject.index', None)
+        timeline_object = getattr(self._obj, 'timelineObject', None)
+        return getattr(timeline_object, 'index', None)
 
     @helper_extraction_error
     def _get_class_hierarchy(self) -> List[str]:
@@ -103,21 +149,27 @@ class BaseExtractor(object):
         Returns:
             List[str]: A list of class names in the class hierarchy
         """
-        class_hierarchy = inspect.getmro(self._obj.__class__)
-        # Simplify class names using map
-        simplified_class_names = map(
-            lambda cls: self._simplify_class_name(cls.__name__) if
-            '::' in cls.__name__ else cls.__name__,
-            class_hierarchy)
-
-        # Filter out 'Base' and 'object' using filter
-        filtered_class_names = filter(
-            lambda name: name not in ('Base', 'object'),
-            simplified_class_names
-        )
-
-        # Convert the filter object to a list and return it
-        return list(filtered_class_names)
+        obj_class = self._obj.__class__
+        class_names = _CLASS_HIERARCHY_CACHE.get(obj_class)
+        if class_names is None:
+            class_hierarchy = inspect.getmro(obj_class)
+            # Simplify class names using map
+            simplified_class_names = map(
+                lambda cls: self._simplify_class_name(cls.__name__) if
+                '::' in cls.__name__ else cls.__name__,
+                class_hierarchy)
+
+            # Filter out 'Base' and 'object' using filter
+            filtered_class_names = filter(
+                lambda name: name not in ('Base', 'object'),
+                simplified_class_names
+            )
+
+            class_names = tuple(filtered_class_names)
+            _CLASS_HIERARCHY_CACHE[obj_class] = class_names
+
+        # Return a fresh list so callers can never mutate the cached entry
+        return list(class_names)
 
     def _simplify_class_name(self, class_name: str) -> str:
         """Simplifies the class name by splitting by '::' and taking the last
@@ -135,10 +187,9 @@ class BaseExtractor(object):
     @helper_extraction_error
     def extract_collection_tokens(self, attribute, id_attr='entityToken'):
         """Extracts a list of IDs from a given attribute."""
-        collection = getattr(self._obj, attribute, [])
+        collection = getattr(self._obj, attribute, None)
         if hasattr(collection, "__iter__"):
-            ids = [getattr(item, id_attr, None) for item in collection]
-            return ids
+            return collection_tokens(collection, id_attr)
         return []
 
     def get_first_valid_attribute(self,
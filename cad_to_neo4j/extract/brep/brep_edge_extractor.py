@@ -12,6 +12,9 @@ class BRepEdgeExtractor(BRepEntityExtractor):
     """
     Extractor for BRepEdge data.
     """
+
+    __slots__ = ()
+
     def __init__(self,
                  obj: adsk.fusion.BRepEdge,
                  design_environment_data: Dict[str, Any]):
@@ -40,7 +43,8 @@ class BRepEdgeExtractor(BRepEntityExtractor):
             'tolerance': self.tolerance,
             'faces': self.faces,
         }
-        return {**entity_info, **edge_info}
+        entity_info.update(edge_info)
+        return entity_info
 
     @property
     @helper_extraction_error
@@ -32,6 +32,8 @@ class BRepEntityExtractor(BaseExtractor):
         data from.
     """
 
+    __slots__ = ('_design_environment_data',)
+
     def __init__(self,
                  obj: adsk.fusion.Base,
                  design_environment_data: Dict[str, Any]):
@@ -67,7 +69,9 @@ class BRepEntityExtractor(BaseExtractor):
         if self._design_environment_data is not None:
             brep_entity_info.update(self._design_environment_data)
 
-        return {**base_info, **brep_entity_info}
+        base_info.update(brep_entity_info)
+
+        return base_info
 
     @property
     @helper_extraction_error
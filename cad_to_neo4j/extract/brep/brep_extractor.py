@@ -19,6 +19,9 @@ __all__ = ['BRepBodyExtractor']
 
 class BRepBodyExtractor(BaseExtractor):
     """Extractor for BRepBody data from bodies and features."""
+
+    __slots__ = ()
+
     def __init__(self,
                  obj: adsk.fusion.BRepBody):
         """Initialize the extractor with the BRepBody element."""
@@ -53,16 +56,15 @@ class BRepBodyExtractor(BaseExtractor):
         if bounding_box_info is not None:
             brep_body_info.update(bounding_box_info)
 
-        return {**basic_info, **brep_body_info}
+        basic_info.update(brep_body_info)
+
+        return basic_info
 
     @property
     @helper_extraction_error
     def parent_component(self) -> str:
         """Gets the name of the parent component of the BRepBody."""
-        try:
-            return nested_getattr(self._obj, 'parentComponent.name', None)
-        except AttributeError:
-            return None
+        return nested_getattr(self._obj, 'parentComponent.name', None)
 
     @property
     @helper_extraction_error
@@ -31,6 +31,9 @@ class BRepFaceExtractor(BRepEntityExtractor):
         shell (adsk.fusion.BRepFace): The BRep shell object to extract data
         from.
     """
+
+    __slots__ = ()
+
     def __init__(self,
                  obj: adsk.fusion.BRepFace,
                  design_environment_data: Dict[str, Any]):
@@ -50,7 +53,8 @@ class BRepFaceExtractor(BRepEntityExtractor):
             'edges': self.edges,
 
         }
-        return {**entity_info, **face_info}
+        entity_info.update(face_info)
+        return entity_info
 
     @property
     @helper_extraction_error
@@ -8,6 +8,9 @@ __all__ = ['BRepLumpExtractor']
 
 class BRepLumpExtractor(BRepEntityExtractor):
     """Extractor for BRepLump data."""
+
+    __slots__ = ()
+
     def __init__(self,
                  obj: adsk.fusion.BRepLump,
                  design_environment_data: Dict[str, Any]):
@@ -18,4 +21,5 @@ class BRepLumpExtractor(BRepEntityExtractor):
         """Extract BRepLump data."""
         entity_info = super().extract_info()
         lump_info = {}
-        return {**entity_info, **lump_info}
+        entity_info.update(lump_info)
+        return entity_info
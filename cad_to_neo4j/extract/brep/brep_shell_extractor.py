@@ -28,6 +28,8 @@ class BRepShellExtractor(BRepEntityExtractor):
         from.
     """
 
+    __slots__ = ()
+
     def __init__(self,
                  obj: adsk.fusion.BRepShell,
                  design_environment_data: Dict[str, Any]):
@@ -52,7 +54,9 @@ class BRepShellExtractor(BRepEntityExtractor):
             # 'wire': self.wire,
         }
 
-        return {**base_info, **brep_shell_info}
+        base_info.update(brep_shell_info)
+
+        return base_info
 
     @property
     def lump(self) -> Optional[str]:
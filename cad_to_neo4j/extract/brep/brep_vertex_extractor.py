@@ -9,6 +9,9 @@ class BRepVertexExtractor(BRepEntityExtractor):
     """
     Extractor for BRepVertex data.
     """
+
+    __slots__ = ()
+
     def __init__(self,
                  obj: adsk.fusion.BRepVertex,
                  design_environment_data: Dict[str, Any]):
@@ -36,7 +39,8 @@ class BRepVertexExtractor(BRepEntityExtractor):
             'geometry': self.geometry,
             # 'shell': self.shell,
         }
-        return {**entity_info, **vertex_info}
+        entity_info.update(vertex_info)
+        return entity_info
 
     @property
     def isTolerant(self):
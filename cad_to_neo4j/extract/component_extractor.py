@@ -10,6 +10,7 @@ Classes:
 from typing import Dict, Optional, List, Union
 from adsk.fusion import Component
 from .base_extractor import BaseExtractor
+from ..utils.extraction_utils import point_to_list
 
 __all__ = ['ComponentExtractor']
 
@@ -17,6 +18,8 @@ __all__ = ['ComponentExtractor']
 class ComponentExtractor(BaseExtractor):
     """Extractor for extracting detailed information from Component objects."""
 
+    __slots__ = ()
+
     def __init__(self, obj: Component) -> None:
         """
         Initializes the ComponentExtractor with a Component object.
@@ -53,7 +56,9 @@ class ComponentExtractor(BaseExtractor):
         if self.boundingBox is not None:
             component_info.update(self.boundingBox)
 
-        return {**basic_info, **component_info}
+        basic_info.update(component_info)
+
+        return basic_info
     
     @property
     def id(self) -> str:
@@ -78,8 +83,8 @@ class ComponentExtractor(BaseExtractor):
             bbox = getattr(self._obj, 'boundingBox', None)
             if bbox:
                 return {
-                    'bbMinPoint': [bbox.minPoint.x, bbox.minPoint.y, bbox.minPoint.z],
-                    'bbMaxPoint': [bbox.maxPoint.x, bbox.maxPoint.y, bbox.maxPoint.z]
+                    'bbMinPoint': point_to_list(bbox.minPoint),
+                    'bbMaxPoint': point_to_list(bbox.maxPoint)
                 }
             return None
         except Exception as e:
@@ -27,6 +27,8 @@ class ConstructionAxisExtractor(BaseExtractor):
         axis (ConstructionAxis): The construction axis object to extract data from.
     """
 
+    __slots__ = ()
+
     def __init__(self, obj: ConstructionAxis):
         """Initialises the ConstructionAxisExtractor with a construction axis object.
 
@@ -70,11 +72,7 @@ class ConstructionAxisExtractor(BaseExtractor):
         Returns:
             str: The timeline object entity token, or None if not available.
         """
-        try:
-            return nested_getattr(self._obj, 'timelineObject.entity.entityToken', None)
-        except AttributeError as e:
-            self.logger.error(f'Error extracting timeline object: {e}\n{traceback.format_exc()}')
-            return None
+        return nested_getattr(self._obj, 'timelineObject.entity.entityToken', None)
 
     @property
     def isParametric(self) -> Optional[bool]:
@@ -83,11 +81,7 @@ class ConstructionAxisExtractor(BaseExtractor):
         Returns:
             bool: True if the construction axis is parametric, False otherwise.
         """
-        try:
-            return getattr(self._obj, 'isParametric', None)
-        except AttributeError as e:
-            self.logger.error(f'Error extracting parametric state: {e}\n{traceback.format_exc()}')
-            return None
+        return getattr(self._obj, 'isParametric', None)
 
     @property
     def isVisible(self) -> Optional[bool]:
@@ -96,11 +90,7 @@ class ConstructionAxisExtractor(BaseExtractor):
         Returns:
             bool: True if the construction axis is visible, False otherwise.
         """
-        try:
-            return getattr(self._obj, 'isVisible', None)
-        except AttributeError as e:
-            self.logger.error(f'Error extracting visibility: {e}\n{traceback.format_exc()}')
-            return None
+        return getattr(self._obj, 'isVisible', None)
 
     @property
     def healthState(self) -> Optional[str]:
@@ -109,11 +99,7 @@ class ConstructionAxisExtractor(BaseExtractor):
         Returns:
             str: The health state, or None if not available.
         """
-        try:
-            return getattr(self._obj, 'healthState', None)
-        except AttributeError as e:
-            self.logger.error(f'Error extracting health state: {e}\n{traceback.format_exc()}')
-            return None
+        return getattr(self._obj, 'healthState', None)
 
     @property
     def errorOrWarningMessage(self) -> Optional[str]:
@@ -122,11 +108,7 @@ class ConstructionAxisExtractor(BaseExtractor):
         Returns:
             str: The error or warning message, or None if not available.
         """
-        try:
-            return getattr(self._obj, 'errorOrWarningMessage', None)
-        except AttributeError as e:
-            self.logger.error(f'Error extracting error or warning message: {e}\n{traceback.format_exc()}')
-            return None
+        return getattr(self._obj, 'errorOrWarningMessage', None)
 
     def extract_definition_info(self, definition: ConstructionAxisDefinition) -> Optional[Dict[str, Any]]:
         """Extracts the definition information for the construction axis.
@@ -235,4 +217,6 @@ class ConstructionAxisExtractor(BaseExtractor):
         if definition_info is not None:
             construction_axis_info.update(definition_info)
 
-        return {**base_info, **construction_axis_info}
+        base_info.update(construction_axis_info)
+
+        return base_info
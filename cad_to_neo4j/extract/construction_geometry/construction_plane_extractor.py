@@ -37,6 +37,8 @@ class ConstructionPlaneExtractor(BaseExtractor):
         plane (ConstructionPlane): The construction plane object to extract data from.
     """
 
+    __slots__ = ()
+
     def __init__(self, obj: ConstructionPlane):
         """Initialises the ConstructionPlaneExtractor with a construction plane object.
 
@@ -82,11 +84,7 @@ class ConstructionPlaneExtractor(BaseExtractor):
         Returns:
             List[str]: The timeline object, or an empty list if not available.
         """
-        try:
-            return nested_getattr(self._obj, 'timelineObject.entity.entityToken', None)
-        except AttributeError as e:
-            self.logger.error(f'Error extracting timeline object: {e}\n{traceback.format_exc()}')
-            return None
+        return nested_getattr(self._obj, 'timelineObject.entity.entityToken', None)
 
     @property
     def isParametric(self) -> Optional[bool]:
@@ -95,11 +93,7 @@ class ConstructionPlaneExtractor(BaseExtractor):
         Returns:
             bool: True if the construction plane is parametric, False otherwise.
         """
-        try:
-            return getattr(self._obj, 'isParametric', None)
-        except AttributeError as e:
-            self.logger.error(f'Error extracting parametric state: {e}\n{traceback.format_exc()}')
-            return None
+        return getattr(self._obj, 'isParametric', None)
         
     @property
     def isVisible(self) -> Optional[bool]:
@@ -108,11 +102,7 @@ class ConstructionPlaneExtractor(BaseExtractor):
         Returns:
             bool: True if the construction plane is visible, False otherwise.
         """
-        try:
-            return getattr(self._obj, 'isVisible', None)
-        except AttributeError as e:
-            self.logger.error(f'Error extracting visibility: {e}\n{traceback.format_exc()}')
-            return None
+        return getattr(self._obj, 'isVisible', None)
     
     @property
     def healthState(self) -> Optional[str]:
@@ -121,11 +111,7 @@ class ConstructionPlaneExtractor(BaseExtractor):
         Returns:
             str: The health state, or None if not available.
         """
-        try:
-            return getattr(self._obj, 'healthState', None)
-        except AttributeError as e:
-            self.logger.error(f'Error extracting health state: {e}\n{traceback.format_exc()}')
-            return None
+        return getattr(self._obj, 'healthState', None)
         
     @property
     def errorOrWarningMessage(self) -> Optional[str]:
@@ -134,11 +120,7 @@ class ConstructionPlaneExtractor(BaseExtractor):
         Returns:
             str: The error or warning message, or None if not available.
         """
-        try:
-            return getattr(self._obj, 'errorOrWarningMessage', None)
-        except AttributeError as e:
-            self.logger.error(f'Error extracting error or warning message: {e}\n{traceback.format_exc()}')
-            return None
+        return getattr(self._obj, 'errorOrWarningMessage', None)
 
     @property
     def transform(self) -> Optional[List[float]]:
@@ -180,11 +162,7 @@ class ConstructionPlaneExtractor(BaseExtractor):
         Returns:
             str: The base feature, or None if not available.
         """
-        try:
-            return getattr(self._obj, 'baseFeature', None)
-        except AttributeError as e:
-            self.logger.error(f'Error extracting base feature: {e}\n{traceback.format_exc()}')
-            return None
+        return getattr(self._obj, 'baseFeature', None)
 
         
     def extract_definition_info(self, definition: ConstructionPlaneDefinition) -> Optional[Dict[str, Any]]:
@@ -383,4 +361,6 @@ class ConstructionPlaneExtractor(BaseExtractor):
         if definition_info is not None:
             construction_plane_info.update(definition_info)
 
-        return {**base_info, **construction_plane_info}
+        base_info.update(construction_plane_info)
+
+        return base_info
@@ -18,6 +18,8 @@ __all__ = ['ConstructionPointExtractor']
 class ConstructionPointExtractor(BaseExtractor):
     """Extractor for extracting detailed information from ConstructionPoint objects."""
 
+    __slots__ = ()
+
     def __init__(self, element: ConstructionPoint):
         """Initialize the extractor with the ConstructionPoint element."""
         super().__init__(element)
@@ -48,7 +50,9 @@ class ConstructionPointExtractor(BaseExtractor):
         # if definition_info is not None:
         #     construction_point_info.update(definition_info)
 
-        return {**basic_info, **construction_point_info}
+        basic_info.update(construction_point_info)
+
+        return basic_info
 
     @property
     def geometry(self) -> Optional[List[float]]:
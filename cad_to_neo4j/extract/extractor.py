@@ -34,6 +34,7 @@ import adsk.fusion
 from .base_extractor import BaseExtractor
 from .brep.brep_entity_extractor import BRepEntityExtractor
 from .extractors import EXTRACTORS, ENTITY_MAP
+from ..utils.extraction_utils import materialise
 
 
 __all__ = ['ExtractorOrchestrator']
@@ -146,6 +147,20 @@ class ExtractorOrchestrator(object):
             self._log_extraction_error("extract_data", e)
             return None
 
+    def extract_collection(self, collection: Any) -> None:
+        """
+        Extracts data from every element of a Fusion collection.
+
+        The collection is copied into a list once, so each element is
+        fetched a single time across the API before its extractor runs.
+
+        Args:
+            collection (Any): A Fusion collection (or any iterable) of CAD
+                elements.
+        """
+        for element in materialise(collection):
+            self.extract_data(element)
+
     def add_or_update(self, stored_dict: Dict, other_dict: Dict):
         """Update the existing nodes with new information.
 
@@ -304,17 +319,10 @@ class ExtractorOrchestrator(object):
             for profile in sketch.profiles:
                 self.extract_nested_data(profile)
 
-            for point in sketch.sketchPoints:
-                self.extract_data(point)
-
-            for curve in sketch.sketchCurves:
-                self.extract_data(curve)
-
-            for dimension in sketch.sketchDimensions:
-                self.extract_data(dimension)
-
-            for constraint in sketch.geometricConstraints:
-                self.extract_data(constraint)
+            self.extract_collection(sketch.sketchPoints)
+            self.extract_collection(sketch.sketchCurves)
+            self.extract_collection(sketch.sketchDimensions)
+            self.extract_collection(sketch.geometricConstraints)
         except Exception as e:  # TODO add specific exceptions
             self._log_extraction_error("extract_sketch_entities", e)
 
@@ -440,17 +448,11 @@ class ExtractorOrchestrator(object):
         self.logger.info(brep_extraction_msg)
 
         try:
-            for body in comp.bRepBodies:
+            for body in materialise(comp.bRepBodies):
                 self.extract_data(body)
-
-                for face in body.faces:
-                    self.extract_data(face)
-
-                for edge in body.edges:
-                    self.extract_data(edge)
-
-                for vertex in body.vertices:
-                    self.extract_data(vertex)
+                self.extract_collection(body.faces)
+                self.extract_collection(body.edges)
+                self.extract_collection(body.vertices)
         except Exception as e:  # TODO add specific exceptions
             general_exception_msg: str = f"""
                 Error in extract_brep_entities: {str(e)}\n
@@ -548,7 +550,7 @@ class ExtractorOrchestrator(object):
         if entity_token is not None:
             faces: List[str] = [
                      getattr(face, 'entityToken', None)
-                     for face in getattr(feature, face_attr, [])
+                     for face in getattr(feature, face_attr, ())
                      ]
             if entity_token in nodes and face_attr in nodes[entity_token]:
                 existing_faces = nodes[entity_token][face_attr]
@@ -9,6 +9,8 @@ __all__ = ['BoxFeatureExtractor']
 class BoxFeatureExtractor(FeatureExtractor):
     """Extractor for extracting detailed information from BoxFeature objects."""
 
+    __slots__ = ()
+
     def __init__(self, obj: adsk.fusion.BoxFeature):
         """Initialize the extractor with the BoxFeature element."""
         super().__init__(obj)
@@ -25,7 +27,8 @@ class BoxFeatureExtractor(FeatureExtractor):
             # 'width': self.width,
             # 'height': self.height,
         }             
-        return {**feature_info, **box_info}
+        feature_info.update(box_info)
+        return feature_info
 
     @property
     def length(self) -> Optional[float]:
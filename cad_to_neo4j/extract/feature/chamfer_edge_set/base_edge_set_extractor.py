@@ -17,6 +17,8 @@ __all__ = ['BaseEdgeSetExtractor']
 class BaseEdgeSetExtractor(BaseExtractor):
     """Base extractor for extracting detailed information from ChamferEdgeSet objects."""
 
+    __slots__ = ()
+
     def __init__(self, obj: adsk.fusion.ChamferEdgeSet):
         """Initialize the extractor with the ChamferEdgeSet element."""
         super().__init__(obj)
@@ -40,4 +42,5 @@ class BaseEdgeSetExtractor(BaseExtractor):
         edge_info = {
             'edges': self.edges,
         }
-        return {**edge_set_info, **edge_info}
+        edge_set_info.update(edge_info)
+        return edge_set_info
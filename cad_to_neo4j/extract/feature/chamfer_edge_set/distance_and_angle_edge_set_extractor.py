@@ -17,6 +17,8 @@ __all__ = ['DistanceAndAngleEdgeSetExtractor']
 class DistanceAndAngleEdgeSetExtractor(BaseEdgeSetExtractor):
     """Extractor for extracting detailed information from DistanceAndAngleChamferEdgeSet objects."""
 
+    __slots__ = ()
+
     def __init__(self, obj: adsk.fusion.DistanceAndAngleChamferEdgeSet):
         """Initialize the extractor with the DistanceAndAngleChamferEdgeSet element."""
         super().__init__(obj)
@@ -32,7 +34,8 @@ class DistanceAndAngleEdgeSetExtractor(BaseEdgeSetExtractor):
             'distance': self.distance,
             'angle': self.angle,
         }
-        return {**edge_set_info, **chamfer_info}
+        edge_set_info.update(chamfer_info)
+        return edge_set_info
 
     @property
     def distance(self) -> Optional[float]:
@@ -17,6 +17,8 @@ __all__ = ['EqualDistanceEdgeSetExtractor']
 class EqualDistanceEdgeSetExtractor(BaseEdgeSetExtractor):
     """Extractor for extracting detailed information from EqualDistanceChamferEdgeSet objects."""
 
+    __slots__ = ()
+
     def __init__(self, obj: adsk.fusion.EqualDistanceChamferEdgeSet):
         """Initialize the extractor with the EqualDistanceChamferEdgeSet element."""
         super().__init__(obj)
@@ -31,7 +33,8 @@ class EqualDistanceEdgeSetExtractor(BaseEdgeSetExtractor):
         chamfer_info = {
             'distance': self.distance,
         }
-        return {**edge_set_info, **chamfer_info}
+        edge_set_info.update(chamfer_info)
+        return edge_set_info
 
     @property
     def distance(self) -> Optional[float]:
@@ -17,6 +17,8 @@ __all__ = ['TwoDistancesEdgeSetExtractor']
 class TwoDistancesEdgeSetExtractor(BaseEdgeSetExtractor):
     """Extractor for extracting detailed information from TwoDistancesChamferEdgeSet objects."""
 
+    __slots__ = ()
+
     def __init__(self, obj: TwoDistancesChamferEdgeSet):
         """Initialize the extractor with the TwoDistancesChamferEdgeSet element."""
         super().__init__(obj)
@@ -32,7 +34,8 @@ class TwoDistancesEdgeSetExtractor(BaseEdgeSetExtractor):
             'distanceOne': self.distanceOne,
             'distanceTwo': self.distanceTwo,
         }
-        return {**edge_set_info, **chamfer_info}
+        edge_set_info.update(chamfer_info)
+        return edge_set_info
 
     @property
     def distanceOne(self) -> Optional[float]:
@@ -17,6 +17,8 @@ __all__ = ['ChamferFeatureExtractor']
 class ChamferFeatureExtractor(FeatureExtractor):
     """Extractor for extracting detailed information from ChamferFeature objects."""
 
+    __slots__ = ()
+
     def __init__(self, obj: adsk.fusion.ChamferFeature):
         """Initialize the extractor with the ChamferFeature element."""
         super().__init__(obj)
@@ -31,7 +33,8 @@ class ChamferFeatureExtractor(FeatureExtractor):
         chamfer_info = {
             'edgeSets': self.edgeSets,
         }
-        return {**feature_info, **chamfer_info}
+        feature_info.update(chamfer_info)
+        return feature_info
 
     @property
     def edgeSets(self) -> Optional[List[str]]:
@@ -26,6 +26,8 @@ class CircularPatternFeatureExtractor(FeatureExtractor):
     objects.
     """
 
+    __slots__ = ()
+
     def __init__(self, obj: adsk.fusion.CircularPatternFeature) -> None:
         """
         Initialize the extractor with the CircularPatternFeature object.
@@ -54,7 +56,9 @@ class CircularPatternFeatureExtractor(FeatureExtractor):
             'suppressedElementsIds': self.suppressed_elements_ids,
         }
 
-        return {**feature_info, **circular_pattern_info}
+        feature_info.update(circular_pattern_info)
+
+        return feature_info
 
     @property
     @helper_extraction_error
@@ -26,6 +26,8 @@ class ExtrudeFeatureExtractor(FeatureExtractor):
     """Extractor for extracting detailed information from ExtrudeFeature
     objects."""
 
+    __slots__ = ()
+
     def __init__(self, obj: adsk.fusion.ExtrudeFeature):
         """Initialize the extractor with the ExtrudeFeature element."""
         super().__init__(obj)
@@ -60,7 +62,8 @@ class ExtrudeFeatureExtractor(FeatureExtractor):
             extrude_info.update(extent_two_info)
 
         extrude_info.update(self.start_extent)
-        return {**feature_info, **extrude_info}
+        feature_info.update(extrude_info)
+        return feature_info
 
     @property
     @helper_extraction_error
@@ -244,7 +247,7 @@ class ExtrudeFeatureExtractor(FeatureExtractor):
         """Extracts the list of bodies that will participate in the feature
         when the operation is a cut or intersection."""
         self.roll_timeline_to_before_feature()
-        participant_bodies = getattr(self._obj, 'participantBodies', [])
+        participant_bodies = getattr(self._obj, 'participantBodies', ())
         ids = [body.entityToken for body in participant_bodies]
         self.roll_timeline_to_after_feature()
         return ids
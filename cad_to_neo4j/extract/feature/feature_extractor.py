@@ -19,6 +19,8 @@ __all__ = ['FeatureExtractor']
 class FeatureExtractor(BaseExtractor):
     """Extractor for extracting detailed information from Feature objects."""
 
+    __slots__ = ()
+
     def __init__(self, obj: adsk.fusion.Feature):
         """Initialize the extractor with the Feature element."""
         super().__init__(obj)
@@ -41,7 +43,8 @@ class FeatureExtractor(BaseExtractor):
             'healthState': self.health_state,
             'errorOrWarningMessage': self.error_or_warning_message,
         }
-        return {**basic_info, **feature_info}
+        basic_info.update(feature_info)
+        return basic_info
 
     @property
     @helper_extraction_error
@@ -16,6 +16,8 @@ __all__ = ['BaseEdgeSetExtractor']
 class BaseEdgeSetExtractor(BaseExtractor):
     """Base extractor for extracting detailed information from FilletEdgeSet objects."""
 
+    __slots__ = ()
+
     def __init__(self, element: FilletEdgeSet):
         """Initialize the extractor with the FilletEdgeSet element."""
         super().__init__(element)
@@ -24,7 +26,7 @@ class BaseEdgeSetExtractor(BaseExtractor):
     def edges(self) -> Optional[List[str]]:
         """Extracts the IDs of edges in the fillet edge set."""
         try:
-            edge_collection = getattr(self._obj, 'edges', [])
+            edge_collection = getattr(self._obj, 'edges', ())
             return [edge.entityToken for edge in edge_collection if getattr(edge, 'entityToken', None) is not None]
         except AttributeError as e:
             self.logger.error(f'Error extracting edges: {e}\n{traceback.format_exc()}')
@@ -40,4 +42,5 @@ class BaseEdgeSetExtractor(BaseExtractor):
         edge_set_info = {
             'edges': self.edges,
         }
-        return {**edge_set_info, **base_info}
+        edge_set_info.update(base_info)
+        return edge_set_info
@@ -8,7 +8,6 @@ Classes:
 """
 from typing import Optional, List, Dict
 import adsk.fusion
-import traceback
 from .base_edge_set_extractor import BaseEdgeSetExtractor
 
 __all__ = ['ChordLengthFilletEdgeSetExtractor']
@@ -16,6 +15,8 @@ __all__ = ['ChordLengthFilletEdgeSetExtractor']
 class ChordLengthFilletEdgeSetExtractor(BaseEdgeSetExtractor):
     """Extractor for extracting detailed information from ChordLengthFilletEdgeSet objects."""
 
+    __slots__ = ()
+
     def __init__(self, element: adsk.fusion.ChordLengthFilletEdgeSet):
         """Initialize the extractor with the ChordLengthFilletEdgeSet element."""
         super().__init__(element)
@@ -30,13 +31,10 @@ class ChordLengthFilletEdgeSetExtractor(BaseEdgeSetExtractor):
         chord_length_info = {
             'chord_length': self.chord_length,
         }
-        return {**edge_set_info, **chord_length_info}
+        edge_set_info.update(chord_length_info)
+        return edge_set_info
 
     @property
     def chord_length(self) -> Optional[str]:
         """Extracts the chord length of the fillet edge set."""
-        try:
-            return getattr(self._obj, 'chordLength', None)
-        except AttributeError as e:
-            self.logger.error(f'Error extracting chord length: {e}\n{traceback.format_exc()}')
-            return None
+        return getattr(self._obj, 'chordLength', None)
@@ -8,7 +8,6 @@ Classes:
 """
 from typing import Optional, List, Dict
 import adsk.fusion
-import traceback
 from .base_edge_set_extractor import BaseEdgeSetExtractor
 from ....utils.extraction_utils import nested_getattr
 
@@ -17,6 +16,8 @@ __all__ = ['ConstantRadiusFilletEdgeSetExtractor']
 class ConstantRadiusFilletEdgeSetExtractor(BaseEdgeSetExtractor):
     """Extractor for extracting detailed information from ConstantRadiusFilletEdgeSet objects."""
 
+    __slots__ = ()
+
     def __init__(self, element: adsk.fusion.ConstantRadiusFilletEdgeSet):
         """Initialize the extractor with the ConstantRadiusFilletEdgeSet element."""
         super().__init__(element)
@@ -31,13 +32,10 @@ class ConstantRadiusFilletEdgeSetExtractor(BaseEdgeSetExtractor):
         constant_radius_info = {
             'radius': self.radius,
         }
-        return {**edge_set_info, **constant_radius_info}
+        edge_set_info.update(constant_radius_info)
+        return edge_set_info
 
     @property
     def radius(self) -> Optional[str]:
         """Extracts the radius of the fillet edge set."""
-        try:
-            return nested_getattr(self._obj, 'radius.value', None)
-        except AttributeError as e:
-            self.logger.error(f'Error extracting radius: {e}\n{traceback.format_exc()}')
-            return None
+        return nested_getattr(self._obj, 'radius.value', None)
@@ -16,6 +16,8 @@ __all__ = ['VariableRadiusFilletEdgeSetExtractor']
 class VariableRadiusFilletEdgeSetExtractor(BaseEdgeSetExtractor):
     """Extractor for extracting detailed information from VariableRadiusFilletEdgeSet objects."""
 
+    __slots__ = ()
+
     def __init__(self, element: adsk.fusion.VariableRadiusFilletEdgeSet):
         """Initialize the extractor with the VariableRadiusFilletEdgeSet element."""
         super().__init__(element)
@@ -33,31 +35,24 @@ class VariableRadiusFilletEdgeSetExtractor(BaseEdgeSetExtractor):
             'midRadii': self.midRadii,
             'midPositions': self.midPositions,
         }
-        return {**edge_set_info, **variable_radius_info}
+        edge_set_info.update(variable_radius_info)
+        return edge_set_info
 
     @property
     def startRadius(self) -> Optional[str]:
         """Extracts the start radius of the fillet edge set."""
-        try:
-            return getattr(self._obj, 'startRadius', None)
-        except AttributeError as e:
-            self.logger.error(f'Error extracting start radius: {e}\n{traceback.format_exc()}')
-            return None
+        return getattr(self._obj, 'startRadius', None)
 
     @property
     def endRadius(self) -> Optional[str]:
         """Extracts the end radius of the fillet edge set."""
-        try:
-            return getattr(self._obj, 'endRadius', None)
-        except AttributeError as e:
-            self.logger.error(f'Error extracting end radius: {e}\n{traceback.format_exc()}')
-            return None
+        return getattr(self._obj, 'endRadius', None)
 
     @property
     def midRadii(self) -> Optional[List[str]]:
         """Extracts the mid radii of the fillet edge set."""
         try:
-            return [radius for radius in getattr(self._obj, 'midRadii', [])]
+            return [radius for radius in getattr(self._obj, 'midRadii', ())]
         except AttributeError as e:
             self.logger.error(f'Error extracting mid radii: {e}\n{traceback.format_exc()}')
             return None
@@ -66,7 +61,7 @@ class VariableRadiusFilletEdgeSetExtractor(BaseEdgeSetExtractor):
     def midPositions(self) -> Optional[List[str]]:
         """Extracts the mid positions of the fillet edge set."""
         try:
-            return [position for position in getattr(self._obj, 'midPositions', [])]
+            return [position for position in getattr(self._obj, 'midPositions', ())]
         except AttributeError as e:
             self.logger.error(f'Error extracting mid positions: {e}\n{traceback.format_exc()}')
             return None
@@ -19,6 +19,8 @@ __all__ = ['FilletFeatureExtractor']
 class FilletFeatureExtractor(FeatureExtractor):
     """Extractor for extracting detailed information from FilletFeature objects."""
 
+    __slots__ = ()
+
     def __init__(self, element: FilletFeature):
         """Initialize the extractor with the FilletFeature element."""
         super().__init__(element)
@@ -34,14 +36,15 @@ class FilletFeatureExtractor(FeatureExtractor):
             'filletedEdges': self.filletedEdges,
             'edge_set_id_list': self.edgeSets,
         }
-        return {**feature_info, **fillet_info}
+        feature_info.update(fillet_info)
+        return feature_info
 
     @property
     def filletedEdges(self) -> Optional[List[str]]:
         """Extracts the IDs of edges modified by the fillet feature."""
         try:
             edgeSets = []
-            for edge_set in getattr(self._obj, 'edgeSets', []):
+            for edge_set in getattr(self._obj, 'edgeSets', ()):
                 edges = [getattr(edge,'entityToken', None) for edge in getattr(edge_set, 'edges', None) if edge is not None]
                 edgeSets += edges
             
@@ -55,7 +58,7 @@ class FilletFeatureExtractor(FeatureExtractor):
         """Extracts the edge sets associated with the fillet feature."""
         edge_set_id_list = []
         try:
-            for edge_set in getattr(self._obj,'edgeSets', []):
+            for edge_set in getattr(self._obj,'edgeSets', ()):
                 if edge_set is not None:
                     pass
                     # edge_set_id_list.append(edge_set.entityToken) # TODO find a list of fillets in edgeset
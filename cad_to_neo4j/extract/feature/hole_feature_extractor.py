@@ -26,6 +26,8 @@ class HoleFeatureExtractor(FeatureExtractor):
     Extractor for extracting detailed information from HoleFeature objects.
     """
 
+    __slots__ = ()
+
     def __init__(self, obj: adsk.fusion.HoleFeature):
         """Initialize the extractor with the HoleFeature obj."""
         super().__init__(obj)
@@ -63,7 +65,9 @@ class HoleFeatureExtractor(FeatureExtractor):
         if extent_info is not None:
             hole_info.update(extent_info)
 
-        return {**feature_info, **hole_info}
+        feature_info.update(hole_info)
+
+        return feature_info
 
     @property
     @helper_extraction_error
@@ -16,6 +16,7 @@ import adsk.fusion
 import adsk.core
 
 from .feature_extractor import FeatureExtractor
+from ...utils.extraction_utils import nested_getattr
 
 __all__ = ['PathPatternFeatureExtractor']
 
@@ -24,6 +25,8 @@ class PathPatternFeatureExtractor(FeatureExtractor):
     """Extractor for extracting detailed information from PathPatternFeature
     objects."""
 
+    __slots__ = ()
+
     def __init__(self, obj: adsk.fusion.PathPatternFeature):
         """
         Initialize the extractor with the PathPatternFeature element.
@@ -52,7 +55,8 @@ class PathPatternFeatureExtractor(FeatureExtractor):
             'isSymmetric': self.is_symmetric,
             'isOrientationAlongPath': self.is_orientation_along_path,
         }
-        return {**feature_info, **pattern_info}
+        feature_info.update(pattern_info)
+        return feature_info
 
     @property
     def input_entities(self) -> Optional[List[str]]:
@@ -100,15 +104,7 @@ class PathPatternFeatureExtractor(FeatureExtractor):
         Returns:
             Optional[float]: Number of instances.
         """
-        try:
-            return getattr(self._obj.quantity, 'value', None)
-        except AttributeError as e:
-            attribute_error_msg: str = (
-                f"Error extracting quantity: {e}\n"
-                f"{traceback.format_exc()}"
-            )
-            self.logger.error(attribute_error_msg)
-            return None
+        return nested_getattr(self._obj, 'quantity.value', None)
 
     @property
     def distance(self) -> Optional[float]:
@@ -118,15 +114,7 @@ class PathPatternFeatureExtractor(FeatureExtractor):
         Returns:
             Optional[float]: Distance between instances.
         """
-        try:
-            return getattr(self._obj.distance, 'value', None)
-        except AttributeError as e:
-            attribute_error_msg: str = (
-                f"Error extracting distance: {e}\n"
-                f"{traceback.format_exc()}"
-            )
-            self.logger.error(attribute_error_msg)
-            return None
+        return nested_getattr(self._obj, 'distance.value', None)
 
     @property
     def start_point(self) -> Optional[float]:
@@ -24,6 +24,8 @@ class RectangularPatternFeatureExtractor(FeatureExtractor):
     """Extractor for extracting detailed information from
     RectangularPatternFeature objects."""
 
+    __slots__ = ()
+
     def __init__(self, obj: adsk.fusion.RectangularPatternFeature):
         """
         Initialize the extractor with the RectangularPatternFeature element.
@@ -54,7 +56,9 @@ class RectangularPatternFeatureExtractor(FeatureExtractor):
             # 'patternElements': self.pattern_element_faces,
         }
 
-        return {**feature_info, **pattern_info}
+        feature_info.update(pattern_info)
+
+        return feature_info
 
     @property
     @helper_extraction_error
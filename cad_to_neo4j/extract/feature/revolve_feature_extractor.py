@@ -26,6 +26,8 @@ class RevolveFeatureExtractor(FeatureExtractor):
     Extractor for extracting detailed information from RevolveFeature objects.
     """
 
+    __slots__ = ()
+
     def __init__(self, obj: adsk.fusion.RevolveFeature):
         """Initialize the extractor with the RevolveFeature element."""
         super().__init__(obj)
@@ -55,7 +57,9 @@ class RevolveFeatureExtractor(FeatureExtractor):
         if extent_two_info is not None:
             revolve_info.update(extent_two_info)
 
-        return {**feature_info, **revolve_info}
+        feature_info.update(revolve_info)
+
+        return feature_info
 
     @property
     @helper_extraction_error
@@ -117,7 +121,7 @@ class RevolveFeatureExtractor(FeatureExtractor):
         when the operation is a cut or intersection.
         """
         self.roll_timeline_to_before_feature()
-        participant_bodies = getattr(self._obj, 'participantBodies', [])
+        participant_bodies = getattr(self._obj, 'participantBodies', ())
         ids = [body.entityToken for body in participant_bodies]
         self.roll_timeline_to_after_feature()
         return ids
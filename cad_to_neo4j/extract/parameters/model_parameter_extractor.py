@@ -19,6 +19,8 @@ class ModelParameterExtractor(ParameterExtractor):
     Extractor for extracting detailed information from ModelParameter objects.
     """
 
+    __slots__ = ()
+
     def __init__(self, obj: adsk.fusion.ModelParameter) -> None:
         """
         Initializes the ModelParameterExtractor with a ModelParameter object.
@@ -43,7 +45,8 @@ class ModelParameterExtractor(ParameterExtractor):
             'component': self._obj.component.name,
             'createdBy': self.created_by,
         }
-        return {**basic_info, **model_info}
+        basic_info.update(model_info)
+        return basic_info
 
     @property
     def created_by(self) -> str:
@@ -19,6 +19,8 @@ from ...utils.extraction_utils import helper_extraction_error
 class ParameterExtractor(BaseExtractor):
     """Extractor for extracting detailed information from Parameter objects."""
 
+    __slots__ = ()
+
     def __init__(self, obj: adsk.fusion.Parameter) -> None:
         """
         Initializes the ParameterExtractor with a Parameter object.
@@ -47,7 +49,8 @@ class ParameterExtractor(BaseExtractor):
             'dependencyParameters': self.dependency_parameters,
             'dependentParameters': self.dependent_parameters,
         }
-        return {**base_info, **parameter_info}
+        base_info.update(parameter_info)
+        return base_info
 
     @property
     @helper_extraction_error
@@ -16,6 +16,8 @@ from ....utils.extraction_utils import nested_getattr
 class CircularPatternConstraintExtractor(GeometricConstraintExtractor):
     """Extractor for CircularPatternConstraint objects."""
 
+    __slots__ = ()
+
     def __init__(self, obj: CircularPatternConstraint):
         """
         Initialise the extractor with the CircularPatternConstraint element.
@@ -41,7 +43,8 @@ class CircularPatternConstraintExtractor(GeometricConstraintExtractor):
             'isSymmetric': self.isSymmetric,
             'isSuppressed': self.isSuppressed,
         }
-        return {**base_info, **constraint_info}
+        base_info.update(constraint_info)
+        return base_info
 
     @property
     def entities(self) -> Optional[list]:
@@ -51,7 +54,7 @@ class CircularPatternConstraintExtractor(GeometricConstraintExtractor):
             list: A list of entity tokens of the entities to pattern.
         """
         try:
-            return [nested_getattr(entity, 'entityToken', None) for entity in getattr(self._obj, 'entities', [])]
+            return [nested_getattr(entity, 'entityToken', None) for entity in getattr(self._obj, 'entities', ())]
         except AttributeError as e:
             self.logger.error(f'Error extracting entities: {e}\n{traceback.format_exc()}')
             return None
@@ -64,7 +67,7 @@ class CircularPatternConstraintExtractor(GeometricConstraintExtractor):
             list: A list of entity tokens of the created entities.
         """
         try:
-            return [nested_getattr(entity, 'entityToken', None) for entity in getattr(self._obj, 'createdEntities', [])]
+            return [nested_getattr(entity, 'entityToken', None) for entity in getattr(self._obj, 'createdEntities', ())]
         except AttributeError as e:
             self.logger.error(f'Error extracting createdEntities: {e}\n{traceback.format_exc()}')
             return None
@@ -76,11 +79,7 @@ class CircularPatternConstraintExtractor(GeometricConstraintExtractor):
         Returns:
             str: The entity token of the center point.
         """
-        try:
-            return nested_getattr(self._obj, 'centerPoint.entityToken', None)
-        except AttributeError as e:
-            self.logger.error(f'Error extracting centerPoint: {e}\n{traceback.format_exc()}')
-            return None
+        return nested_getattr(self._obj, 'centerPoint.entityToken', None)
 
     @property
     def quantity(self) -> Optional[str]:
@@ -89,11 +88,7 @@ class CircularPatternConstraintExtractor(GeometricConstraintExtractor):
         Returns:
             str: The entity token of the quantity parameter.
         """
-        try:
-            return nested_getattr(self._obj, 'quantity.entityToken', None)
-        except AttributeError as e:
-            self.logger.error(f'Error extracting quantity: {e}\n{traceback.format_exc()}')
-            return None
+        return nested_getattr(self._obj, 'quantity.entityToken', None)
 
     @property
     def totalAngle(self) -> Optional[str]:
@@ -102,11 +97,7 @@ class CircularPatternConstraintExtractor(GeometricConstraintExtractor):
         Returns:
             str: The entity token of the total angle parameter.
         """
-        try:
-            return nested_getattr(self._obj, 'totalAngle.entityToken', None)
-        except AttributeError as e:
-            self.logger.error(f'Error extracting totalAngle: {e}\n{traceback.format_exc()}')
-            return None
+        return nested_getattr(self._obj, 'totalAngle.entityToken', None)
 
     @property
     def isSymmetric(self) -> Optional[bool]:
@@ -115,11 +106,7 @@ class CircularPatternConstraintExtractor(GeometricConstraintExtractor):
         Returns:
             bool: True if the pattern is symmetric, False otherwise.
         """
-        try:
-            return getattr(self._obj, 'isSymmetric', None)
-        except AttributeError as e:
-            self.logger.error(f'Error extracting isSymmetric: {e}\n{traceback.format_exc()}')
-            return None
+        return getattr(self._obj, 'isSymmetric', None)
 
     @property
     def isSuppressed(self) -> Optional[list]:
@@ -128,8 +115,4 @@ class CircularPatternConstraintExtractor(GeometricConstraintExtractor):
         Returns:
             list: A list of boolean values indicating the suppression status of the pattern instances.
         """
-        try:
-            return getattr(self._obj, 'isSuppressed', None)
-        except AttributeError as e:
-            self.logger.error(f'Error extracting isSuppressed: {e}\n{traceback.format_exc()}')
-            return None
+        return getattr(self._obj, 'isSuppressed', None)
@@ -7,7 +7,6 @@ Classes:
     - CoincidentConstraintExtractor: Extractor for CoincidentConstraint objects.
 """
 from typing import Optional, Dict, Any
-import traceback
 from adsk.fusion import CoincidentConstraint
 from .geometric_constraint_extractor import GeometricConstraintExtractor
 from ....utils.extraction_utils import nested_getattr
@@ -15,6 +14,8 @@ from ....utils.extraction_utils import nested_getattr
 class CoincidentConstraintExtractor(GeometricConstraintExtractor):
     """Extractor for CoincidentConstraint objects."""
 
+    __slots__ = ()
+
     def __init__(self, obj: CoincidentConstraint):
         """
         Initialise the extractor with the CoincidentConstraint element.
@@ -35,7 +36,8 @@ class CoincidentConstraintExtractor(GeometricConstraintExtractor):
             'point': self.point,
             'entity': self.entity,
         }
-        return {**base_info, **constraint_info}
+        base_info.update(constraint_info)
+        return base_info
 
     @property
     def point(self) -> Optional[str]:
@@ -44,11 +46,7 @@ class CoincidentConstraintExtractor(GeometricConstraintExtractor):
         Returns:
             str: The entity token of the point.
         """
-        try:
-            return nested_getattr(self._obj,'point.entityToken',None)
-        except AttributeError as e:
-            self.logger.error(f'Error extracting point: {e}\n{traceback.format_exc()}')
-            return None
+        return nested_getattr(self._obj,'point.entityToken',None)
 
     @property
     def entity(self) -> Optional[str]:
@@ -57,8 +55,4 @@ class CoincidentConstraintExtractor(GeometricConstraintExtractor):
         Returns:
             str: The entity token of the entity.
         """
-        try:
-            return nested_getattr(self._obj,'entity.entityToken', None)
-        except AttributeError as e:
-            self.logger.error(f'Error extracting entity: {e}\n{traceback.format_exc()}')
-            return None
+        return nested_getattr(self._obj,'entity.entityToken', None)
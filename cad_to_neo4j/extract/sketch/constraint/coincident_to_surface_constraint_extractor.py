@@ -8,7 +8,6 @@ Classes:
 """
 
 from typing import Optional, Dict, Any
-import traceback
 from adsk.fusion import CoincidentToSurfaceConstraint
 from .geometric_constraint_extractor import GeometricConstraintExtractor
 from ....utils.extraction_utils import nested_getattr
@@ -16,6 +15,8 @@ from ....utils.extraction_utils import nested_getattr
 class CoincidentToSurfaceConstraintExtractor(GeometricConstraintExtractor):
     """Extractor for CoincidentToSurfaceConstraint objects."""
 
+    __slots__ = ()
+
     def __init__(self, obj: CoincidentToSurfaceConstraint):
         """
         Initialise the extractor with the CoincidentToSurfaceConstraint element.
@@ -36,7 +37,8 @@ class CoincidentToSurfaceConstraintExtractor(GeometricConstraintExtractor):
             'point': self.point,
             'surface': self.surface,
         }
-        return {**base_info, **constraint_info}
+        base_info.update(constraint_info)
+        return base_info
 
     @property
     def point(self) -> Optional[str]:
@@ -45,11 +47,7 @@ class CoincidentToSurfaceConstraintExtractor(GeometricConstraintExtractor):
         Returns:
             str: The entity token of the point.
         """
-        try:
-            return nested_getattr(self._obj, 'point.entityToken', None)
-        except AttributeError as e:
-            self.logger.error(f'Error extracting point: {e}\n{traceback.format_exc()}')
-            return None
+        return nested_getattr(self._obj, 'point.entityToken', None)
 
     @property
     def surface(self) -> Optional[str]:
@@ -58,8 +56,4 @@ class CoincidentToSurfaceConstraintExtractor(GeometricConstraintExtractor):
         Returns:
             str: The entity token of the surface.
         """
-        try:
-            return nested_getattr(self._obj, 'surface.entityToken', None)
-        except AttributeError as e:
-            self.logger.error(f'Error extracting surface: {e}\n{traceback.format_exc()}')
-            return None
+        return nested_getattr(self._obj, 'surface.entityToken', None)
@@ -8,7 +8,6 @@ Classes:
 """
 
 from typing import Optional, Dict, Any
-import traceback
 from adsk.fusion import CollinearConstraint
 from .geometric_constraint_extractor import GeometricConstraintExtractor
 from ....utils.extraction_utils import nested_getattr
@@ -16,6 +15,8 @@ from ....utils.extraction_utils import nested_getattr
 class CollinearConstraintExtractor(GeometricConstraintExtractor):
     """Extractor for CollinearConstraint objects."""
 
+    __slots__ = ()
+
     def __init__(self, obj: CollinearConstraint):
         """
         Initialise the extractor with the CollinearConstraint element.
@@ -36,7 +37,8 @@ class CollinearConstraintExtractor(GeometricConstraintExtractor):
             'lineOne': self.lineOne,
             'lineTwo': self.lineTwo,
         }
-        return {**base_info, **constraint_info}
+        base_info.update(constraint_info)
+        return base_info
 
     @property
     def lineOne(self) -> Optional[str]:
@@ -45,11 +47,7 @@ class CollinearConstraintExtractor(GeometricConstraintExtractor):
         Returns:
             str: The entity token of the first line.
         """
-        try:
-            return nested_getattr(self._obj, 'lineOne.entityToken', None)
-        except AttributeError as e:
-            self.logger.error(f'Error extracting lineOne: {e}\n{traceback.format_exc()}')
-            return None
+        return nested_getattr(self._obj, 'lineOne.entityToken', None)
 
     @property
     def lineTwo(self) -> Optional[str]:
@@ -58,8 +56,4 @@ class CollinearConstraintExtractor(GeometricConstraintExtractor):
         Returns:
             str: The entity token of the second line.
         """
-        try:
-            return nested_getattr(self._obj, 'lineTwo.entityToken', None)
-        except AttributeError as e:
-            self.logger.error(f'Error extracting lineTwo: {e}\n{traceback.format_exc()}')
-            return None
+        return nested_getattr(self._obj, 'lineTwo.entityToken', None)
@@ -8,7 +8,6 @@ Classes:
 """
 
 from typing import Optional, Dict, Any
-import traceback
 from adsk.fusion import ConcentricConstraint
 from .geometric_constraint_extractor import GeometricConstraintExtractor
 from ....utils.extraction_utils import nested_getattr
@@ -16,6 +15,8 @@ from ....utils.extraction_utils import nested_getattr
 class ConcentricConstraintExtractor(GeometricConstraintExtractor):
     """Extractor for ConcentricConstraint objects."""
 
+    __slots__ = ()
+
     def __init__(self, obj: ConcentricConstraint):
         """
         Initialise the extractor with the ConcentricConstraint element.
@@ -36,7 +37,8 @@ class ConcentricConstraintExtractor(GeometricConstraintExtractor):
             'entityOne': self.entityOne,
             'entityTwo': self.entityTwo,
         }
-        return {**base_info, **constraint_info}
+        base_info.update(constraint_info)
+        return base_info
 
     @property
     def entityOne(self) -> Optional[str]:
@@ -45,11 +47,7 @@ class ConcentricConstraintExtractor(GeometricConstraintExtractor):
         Returns:
             str: The entity token of the first entity.
         """
-        try:
-            return nested_getattr(self._obj, 'entityOne.entityToken', None)
-        except AttributeError as e:
-            self.logger.error(f'Error extracting entityOne: {e}\n{traceback.format_exc()}')
-            return None
+        return nested_getattr(self._obj, 'entityOne.entityToken', None)
 
     @property
     def entityTwo(self) -> Optional[str]:
@@ -58,8 +56,4 @@ class ConcentricConstraintExtractor(GeometricConstraintExtractor):
         Returns:
             str: The entity token of the second entity.
         """
-        try:
-            return nested_getattr(self._obj, 'entityTwo.entityToken', None)
-        except AttributeError as e:
-            self.logger.error(f'Error extracting entityTwo: {e}\n{traceback.format_exc()}')
-            return None
+        return nested_getattr(self._obj, 'entityTwo.entityToken', None)
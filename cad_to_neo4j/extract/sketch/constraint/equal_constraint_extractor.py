@@ -8,14 +8,15 @@ Classes:
 """
 
 from typing import Optional, Dict, Any
-import traceback
 from adsk.fusion import EqualConstraint
 from .geometric_constraint_extractor import GeometricConstraintExtractor
 from ....utils.extraction_utils import nested_getattr
 
 class EqualConstraintExtractor(GeometricConstraintExtractor):
     """Extractor for EqualConstraint objects."""
-    
+
+    __slots__ = ()
+
     def __init__(self, obj: EqualConstraint):
         """
         Initialise the extractor with the EqualConstraint element.
@@ -36,7 +37,8 @@ class EqualConstraintExtractor(GeometricConstraintExtractor):
             'curveOne': self.curveOne,
             'curveTwo': self.curveTwo,
         }
-        return {**base_info, **constraint_info}
+        base_info.update(constraint_info)
+        return base_info
 
     @property
     def curveOne(self) -> Optional[str]:
@@ -45,11 +47,7 @@ class EqualConstraintExtractor(GeometricConstraintExtractor):
         Returns:
             str: The entity token of the first curve.
         """
-        try:
-            return nested_getattr(self._obj, 'curveOne.entityToken', None)
-        except AttributeError as e:
-            self.logger.error(f'Error extracting curveOne: {e}\n{traceback.format_exc()}')
-            return None
+        return nested_getattr(self._obj, 'curveOne.entityToken', None)
 
     @property
     def curveTwo(self) -> Optional[str]:
@@ -58,8 +56,4 @@ class EqualConstraintExtractor(GeometricConstraintExtractor):
         Returns:
             str: The entity token of the second curve.
         """
-        try:
-            return nested_getattr(self._obj, 'curveTwo.entityToken', None)
-        except AttributeError as e:
-            self.logger.error(f'Error extracting curveTwo: {e}\n{traceback.format_exc()}')
-            return None
+        return nested_getattr(self._obj, 'curveTwo.entityToken', None)
@@ -18,6 +18,8 @@ __all__ = ['GeometricConstraintExtractor']
 class GeometricConstraintExtractor(BaseExtractor):
     """Extractor for extracting detailed information from GeometricConstraint objects."""
 
+    __slots__ = ()
+
     def __init__(self, element: GeometricConstraint):
         """Initialize the extractor with the GeometricConstraint element."""
         super().__init__(element)
@@ -34,7 +36,8 @@ class GeometricConstraintExtractor(BaseExtractor):
             'parentSketch': self.parentSketch,
             # 'assemblyContext': self.assemblyContext,
         }
-        return {**base_info, **constraint_info}
+        base_info.update(constraint_info)
+        return base_info
 
     @property
     def isDeletable(self) -> Optional[bool]:
@@ -56,11 +59,7 @@ class GeometricConstraintExtractor(BaseExtractor):
         Returns:
             str: The entity token of the parent sketch.
         """
-        try:
-            return nested_getattr(self._obj,'parentSketch.entityToken',None)
-        except AttributeError as e:
-            self.logger.error(f'Error extracting parentSketch: {e}\n{traceback.format_exc()}')
-            return None
+        return nested_getattr(self._obj,'parentSketch.entityToken',None)
         
 
 
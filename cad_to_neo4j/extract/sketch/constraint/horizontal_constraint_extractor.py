@@ -7,7 +7,6 @@ Classes:
     - HorizontalConstraintExtractor: Extractor for HorizontalConstraint objects.
 """
 from typing import Optional, Dict, Any
-import traceback
 from adsk.fusion import HorizontalConstraint
 from .geometric_constraint_extractor import GeometricConstraintExtractor
 from ....utils.extraction_utils import nested_getattr
@@ -15,6 +14,9 @@ from ....utils.extraction_utils import nested_getattr
 class HorizontalConstraintExtractor(GeometricConstraintExtractor):
     
     """Extractor for HorizontalConstraint objects."""
+
+    __slots__ = ()
+
     def __init__(self, obj: HorizontalConstraint):
         """
         Initialise the extractor with the HorizontalConstraint element.
@@ -34,7 +36,8 @@ class HorizontalConstraintExtractor(GeometricConstraintExtractor):
         constraint_info = {
             'line': self.line,
         }
-        return {**base_info, **constraint_info}
+        base_info.update(constraint_info)
+        return base_info
 
     @property
     def line(self) -> Optional[str]:
@@ -43,8 +46,4 @@ class HorizontalConstraintExtractor(GeometricConstraintExtractor):
         Returns:
             str: The entity token of the line.
         """
-        try:
-            return nested_getattr(self._obj, 'line.entityToken', None)
-        except AttributeError as e:
-            self.logger.error(f'Error extracting line: {e}\n{traceback.format_exc()}')
-            return None
\ No newline at end of file
+        return nested_getattr(self._obj, 'line.entityToken', None)
\ No newline at end of file
@@ -8,14 +8,15 @@ Classes:
 """
 
 from typing import Optional, Dict, Any
-import traceback
 from adsk.fusion import HorizontalPointsConstraint
 from .geometric_constraint_extractor import GeometricConstraintExtractor
 from ....utils.extraction_utils import nested_getattr
 
 class HorizontalPointsConstraintExtractor(GeometricConstraintExtractor):
     """Extractor for HorizontalPointsConstraint objects."""
-    
+
+    __slots__ = ()
+
     def __init__(self, obj: HorizontalPointsConstraint):
         """
         Initialise the extractor with the HorizontalPointsConstraint element.
@@ -36,7 +37,8 @@ class HorizontalPointsConstraintExtractor(GeometricConstraintExtractor):
             'point_one': self.point_one,
             'point_two': self.point_two,
         }
-        return {**base_info, **constraint_info}
+        base_info.update(constraint_info)
+        return base_info
 
     @property
     def point_one(self) -> Optional[str]:
@@ -45,11 +47,7 @@ class HorizontalPointsConstraintExtractor(GeometricConstraintExtractor):
         Returns:
             str: The entity token of the first point.
         """
-        try:
-            return nested_getattr(self._obj, 'pointOne.entityToken', None)
-        except AttributeError as e:
-            self.logger.error(f'Error extracting pointOne: {e}\n{traceback.format_exc()}')
-            return None
+        return nested_getattr(self._obj, 'pointOne.entityToken', None)
 
     @property
     def point_two(self) -> Optional[str]:
@@ -58,8 +56,4 @@ class HorizontalPointsConstraintExtractor(GeometricConstraintExtractor):
         Returns:
             str: The entity token of the second point.
         """
-        try:
-            return nested_getattr(self._obj, 'pointTwo.entityToken', None)
-        except AttributeError as e:
-            self.logger.error(f'Error extracting pointTwo: {e}\n{traceback.format_exc()}')
-            return None
+        return nested_getattr(self._obj, 'pointTwo.entityToken', None)
@@ -8,7 +8,6 @@ Classes:
 """
 
 from typing import Optional, Dict, Any
-import traceback
 from adsk.fusion import LineOnPlanarSurfaceConstraint
 from .geometric_constraint_extractor import GeometricConstraintExtractor
 from ....utils.extraction_utils import nested_getattr
@@ -16,6 +15,8 @@ from ....utils.extraction_utils import nested_getattr
 class LineOnPlanarSurfaceConstraintExtractor(GeometricConstraintExtractor):
     """Extractor for LineOnPlanarSurfaceConstraint objects."""
 
+    __slots__ = ()
+
     def __init__(self, obj: LineOnPlanarSurfaceConstraint):
         """
         Initialise the extractor with the LineOnPlanarSurfaceConstraint element.
@@ -36,7 +37,8 @@ class LineOnPlanarSurfaceConstraintExtractor(GeometricConstraintExtractor):
             'line': self.line,
             'planarSurface': self.planarSurface,
         }
-        return {**base_info, **constraint_info}
+        base_info.update(constraint_info)
+        return base_info
 
     @property
     def line(self) -> Optional[str]:
@@ -45,11 +47,7 @@ class LineOnPlanarSurfaceConstraintExtractor(GeometricConstraintExtractor):
         Returns:
             str: The entity token of the line.
         """
-        try:
-            return nested_getattr(self._obj, 'line.entityToken', None)
-        except AttributeError as e:
-            self.logger.error(f'Error extracting line: {e}\n{traceback.format_exc()}')
-            return None
+        return nested_getattr(self._obj, 'line.entityToken', None)
 
     @property
     def planarSurface(self) -> Optional[str]:
@@ -58,8 +56,4 @@ class LineOnPlanarSurfaceConstraintExtractor(GeometricConstraintExtractor):
         Returns:
             str: The entity token of the planar surface.
         """
-        try:
-            return nested_getattr(self._obj, 'planarSurface.entityToken', None)
-        except AttributeError as e:
-            self.logger.error(f'Error extracting planarSurface: {e}\n{traceback.format_exc()}')
-            return None
+        return nested_getattr(self._obj, 'planarSurface.entityToken', None)
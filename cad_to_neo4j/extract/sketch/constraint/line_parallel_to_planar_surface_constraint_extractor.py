@@ -8,7 +8,6 @@ Classes:
 """
 
 from typing import Optional, Dict, Any
-import traceback
 from adsk.fusion import LineParallelToPlanarSurfaceConstraint
 from .geometric_constraint_extractor import GeometricConstraintExtractor
 from ....utils.extraction_utils import nested_getattr
@@ -16,6 +15,8 @@ from ....utils.extraction_utils import nested_getattr
 class LineParallelToPlanarSurfaceConstraintExtractor(GeometricConstraintExtractor):
     """Extractor for LineParallelToPlanarSurfaceConstraint objects."""
 
+    __slots__ = ()
+
     def __init__(self, obj: LineParallelToPlanarSurfaceConstraint):
         """
         Initialise the extractor with the LineParallelToPlanarSurfaceConstraint element.
@@ -32,11 +33,7 @@ class LineParallelToPlanarSurfaceConstraintExtractor(GeometricConstraintExtracto
         Returns:
             str: The entity token of the line.
         """
-        try:
-            return nested_getattr(self._obj, 'line.entityToken', None)
-        except AttributeError as e:
-            self.logger.error(f'Error extracting line: {e}\n{traceback.format_exc()}')
-            return None
+        return nested_getattr(self._obj, 'line.entityToken', None)
 
     @property
     def planarSurface(self) -> Optional[str]:
@@ -45,11 +42,7 @@ class LineParallelToPlanarSurfaceConstraintExtractor(GeometricConstraintExtracto
         Returns:
             str: The entity token of the planar surface.
         """
-        try:
-            return nested_getattr(self._obj, 'planarSurface.entityToken', None)
-        except AttributeError as e:
-            self.logger.error(f'Error extracting planarSurface: {e}\n{traceback.format_exc()}')
-            return None
+        return nested_getattr(self._obj, 'planarSurface.entityToken', None)
 
     def extract_info(self) -> Dict[str, Optional[Any]]:
         """Extract all information from the LineParallelToPlanarSurfaceConstraint element.
@@ -62,4 +55,5 @@ class LineParallelToPlanarSurfaceConstraintExtractor(GeometricConstraintExtracto
             'line': self.line,
             'planarSurface': self.planarSurface,
         }
-        return {**base_info, **constraint_info}
+        base_info.update(constraint_info)
+        return base_info
@@ -7,12 +7,13 @@ Classes:
     - MidPointConstraintExtractor: Extractor for MidPointConstraint objects.
 """
 from typing import Optional, Dict, Any
-import traceback
 from .geometric_constraint_extractor import GeometricConstraintExtractor
 from ....utils.extraction_utils import nested_getattr
 class MidPointConstraintExtractor(GeometricConstraintExtractor):
     """Extractor for MidPointConstraint objects."""
 
+    __slots__ = ()
+
     @property
     def point(self) -> Optional[str]:
         """Extracts the point of the mid point constraint.
@@ -20,11 +21,7 @@ class MidPointConstraintExtractor(GeometricConstraintExtractor):
         Returns:
             str: The entity token of the point.
         """
-        try:
-            return nested_getattr(self._obj,'point.entityToken', None)
-        except AttributeError as e:
-            self.logger.error(f'Error extracting point: {e}\n{traceback.format_exc()}')
-            return None
+        return nested_getattr(self._obj,'point.entityToken', None)
 
     @property
     def midPointCurve(self) -> Optional[str]:
@@ -33,11 +30,7 @@ class MidPointConstraintExtractor(GeometricConstraintExtractor):
         Returns:
             str: The entity token of the mid point curve.
         """
-        try:
-            return nested_getattr(self._obj,'midPointCurve.entityToken', None)
-        except AttributeError as e:
-            self.logger.error(f'Error extracting midPointCurve: {e}\n{traceback.format_exc()}')
-            return None
+        return nested_getattr(self._obj,'midPointCurve.entityToken', None)
 
     def extract_info(self) -> Dict[str, Optional[Any]]:
         """Extract all information from the MidPointConstraint element.
@@ -50,4 +43,5 @@ class MidPointConstraintExtractor(GeometricConstraintExtractor):
             'point': self.point,
             'midPointCurve': self.midPointCurve,
         }
-        return {**base_info, **constraint_info}
\ No newline at end of file
+        base_info.update(constraint_info)
+        return base_info
\ No newline at end of file
@@ -15,6 +15,8 @@ from ....utils.extraction_utils import nested_getattr
 class OffsetConstraintExtractor(GeometricConstraintExtractor):
     """Extractor for OffsetConstraint objects."""
 
+    __slots__ = ()
+
     def __init__(self, obj: OffsetConstraint):
         """
         Initialise the extractor with the OffsetConstraint element.
@@ -34,7 +36,7 @@ class OffsetConstraintExtractor(GeometricConstraintExtractor):
         try:
             return [
                 getattr(curve, 'entityToken', None) 
-                for curve in getattr(self._obj, 'parentCurves', []) 
+                for curve in getattr(self._obj, 'parentCurves', ()) 
                 if getattr(curve, 'entityToken', None) is not None
             ]
         except AttributeError as e:
@@ -51,7 +53,7 @@ class OffsetConstraintExtractor(GeometricConstraintExtractor):
         try:
             return [
                 getattr(curve, 'entityToken', None) 
-                for curve in getattr(self._obj, 'childCurves', []) 
+                for curve in getattr(self._obj, 'childCurves', ()) 
                 if getattr(curve, 'entityToken', None) is not None
             ]
         except AttributeError as e:
@@ -65,11 +67,7 @@ class OffsetConstraintExtractor(GeometricConstraintExtractor):
         Returns:
             float: The distance of the offset constraint.
         """
-        try:
-            return getattr(self._obj,'distance', None)
-        except AttributeError as e:
-            self.logger.error(f'Error extracting distance: {e}\n{traceback.format_exc()}')
-            return None
+        return getattr(self._obj,'distance', None)
 
     @property
     def dimension(self) -> Optional[str]:
@@ -78,11 +76,7 @@ class OffsetConstraintExtractor(GeometricConstraintExtractor):
         Returns:
             str: The entity token of the dimension.
         """
-        try:
-            return nested_getattr(self._obj,'dimension.entityToken', None)
-        except AttributeError as e:
-            self.logger.error(f'Error extracting dimension: {e}\n{traceback.format_exc()}')
-            return None
+        return nested_getattr(self._obj,'dimension.entityToken', None)
 
     def extract_info(self) -> Dict[str, Optional[Any]]:
         """Extract all information from the OffsetConstraint element.
@@ -97,4 +91,5 @@ class OffsetConstraintExtractor(GeometricConstraintExtractor):
             'distance': self.distance,
             'dimension': self.dimension,
         }
-        return {**base_info, **constraint_info}
+        base_info.update(constraint_info)
+        return base_info
@@ -7,7 +7,6 @@ Classes:
     - ParallelConstraintExtractor: Extractor for ParallelConstraint objects.
 """
 from typing import Optional, Dict, Any
-import traceback
 from adsk.fusion import ParallelConstraint
 from .geometric_constraint_extractor import GeometricConstraintExtractor
 from ....utils.extraction_utils import nested_getattr
@@ -15,6 +14,8 @@ from ....utils.extraction_utils import nested_getattr
 class ParallelConstraintExtractor(GeometricConstraintExtractor):
     """Extractor for ParallelConstraint objects."""
 
+    __slots__ = ()
+
     def __init__(self, obj: ParallelConstraint):
         """
         Initialise the extractor with the ParallelConstraint element.
@@ -31,11 +32,7 @@ class ParallelConstraintExtractor(GeometricConstraintExtractor):
         Returns:
             str: The entity token of the first line.
         """
-        try:
-            return nested_getattr(self._obj, 'lineOne.entityToken', None)
-        except AttributeError as e:
-            self.logger.error(f'Error extracting lineOne: {e}\n{traceback.format_exc()}')
-            return None
+        return nested_getattr(self._obj, 'lineOne.entityToken', None)
 
     @property
     def lineTwo(self) -> Optional[str]:
@@ -44,11 +41,7 @@ class ParallelConstraintExtractor(GeometricConstraintExtractor):
         Returns:
             str: The entity token of the second line.
         """
-        try:
-            return nested_getattr(self._obj, 'lineTwo.entityToken', None)
-        except AttributeError as e:
-            self.logger.error(f'Error extracting lineTwo: {e}\n{traceback.format_exc()}')
-            return None
+        return nested_getattr(self._obj, 'lineTwo.entityToken', None)
 
     def extract_info(self) -> Dict[str, Optional[Any]]:
         """Extract all information from the ParallelConstraint element.
@@ -61,4 +54,5 @@ class ParallelConstraintExtractor(GeometricConstraintExtractor):
             'lineOne': self.lineOne,
             'lineTwo': self.lineTwo,
         }
-        return {**base_info, **constraint_info}
+        base_info.update(constraint_info)
+        return base_info
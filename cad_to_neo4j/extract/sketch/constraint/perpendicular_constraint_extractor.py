@@ -8,7 +8,6 @@ Classes:
     - PerpendicularConstraintExtractor: Extractor for PerpendicularConstraint objects.
 """
 from typing import Optional, Dict, Any
-import traceback
 from adsk.fusion import PerpendicularConstraint
 from .geometric_constraint_extractor import GeometricConstraintExtractor
 from ....utils.extraction_utils import nested_getattr
@@ -16,6 +15,8 @@ from ....utils.extraction_utils import nested_getattr
 class PerpendicularConstraintExtractor(GeometricConstraintExtractor):
     """Extractor for PerpendicularConstraint objects."""
 
+    __slots__ = ()
+
     def __init__(self, obj: PerpendicularConstraint):
         """
         Initialise the extractor with the PerpendicularConstraint element.
@@ -32,11 +33,7 @@ class PerpendicularConstraintExtractor(GeometricConstraintExtractor):
         Returns:
             str: The entity token of the first line.
         """
-        try:
-            return nested_getattr(self._obj, 'lineOne.entityToken', None)
-        except AttributeError as e:
-            self.logger.error(f'Error extracting lineOne: {e}\n{traceback.format_exc()}')
-            return None
+        return nested_getattr(self._obj, 'lineOne.entityToken', None)
 
     @property
     def lineTwo(self) -> Optional[str]:
@@ -45,11 +42,7 @@ class PerpendicularConstraintExtractor(GeometricConstraintExtractor):
         Returns:
             str: The entity token of the second line.
         """
-        try:
-            return nested_getattr(self._obj, 'lineTwo.entityToken', None)
-        except AttributeError as e:
-            self.logger.error(f'Error extracting lineTwo: {e}\n{traceback.format_exc()}')
-            return None
+        return nested_getattr(self._obj, 'lineTwo.entityToken', None)
 
     def extract_info(self) -> Dict[str, Optional[Any]]:
         """Extract all information from the PerpendicularConstraint element.
@@ -62,4 +55,5 @@ class PerpendicularConstraintExtractor(GeometricConstraintExtractor):
             'lineOne': self.lineOne,
             'lineTwo': self.lineTwo,
         }
-        return {**base_info, **constraint_info}
\ No newline at end of file
+        base_info.update(constraint_info)
+        return base_info
\ No newline at end of file
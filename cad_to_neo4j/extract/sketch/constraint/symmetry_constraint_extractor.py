@@ -7,7 +7,6 @@ Classes:
     - SymmetryConstraintExtractor: Extractor for SymmetryConstraint objects.
 """
 from typing import Optional, Dict, Any
-import traceback
 from adsk.fusion import SymmetryConstraint
 from .geometric_constraint_extractor import GeometricConstraintExtractor
 from ....utils.extraction_utils import nested_getattr
@@ -15,6 +14,8 @@ from ....utils.extraction_utils import nested_getattr
 class SymmetryConstraintExtractor(GeometricConstraintExtractor):
     """Extractor for SymmetryConstraint objects."""
 
+    __slots__ = ()
+
     def __init__(self, obj: SymmetryConstraint):
         """
         Initialise the extractor with the SymmetryConstraint element.
@@ -31,11 +32,7 @@ class SymmetryConstraintExtractor(GeometricConstraintExtractor):
         Returns:
             str: The entity token of the first entity.
         """
-        try:
-            return nested_getattr(self._obj, 'entityOne.entityToken', None)
-        except AttributeError as e:
-            self.logger.error(f'Error extracting entityOne: {e}\n{traceback.format_exc()}')
-            return None
+        return nested_getattr(self._obj, 'entityOne.entityToken', None)
 
     @property
     def entityTwo(self) -> Optional[str]:
@@ -44,11 +41,7 @@ class SymmetryConstraintExtractor(GeometricConstraintExtractor):
         Returns:
             str: The entity token of the second entity.
         """
-        try:
-            return nested_getattr(self._obj, 'entityTwo.entityToken', None)
-        except AttributeError as e:
-            self.logger.error(f'Error extracting entityTwo: {e}\n{traceback.format_exc()}')
-            return None
+        return nested_getattr(self._obj, 'entityTwo.entityToken', None)
 
     @property
     def symmetry_line(self) -> Optional[str]:
@@ -57,11 +50,7 @@ class SymmetryConstraintExtractor(GeometricConstraintExtractor):
         Returns:
             str: The entity token of the symmetry line.
         """
-        try:
-            return nested_getattr(self._obj, 'symmetryLine.entityToken', None)
-        except AttributeError as e:
-            self.logger.error(f'Error extracting symmetryLine: {e}\n{traceback.format_exc()}')
-            return None
+        return nested_getattr(self._obj, 'symmetryLine.entityToken', None)
 
     def extract_info(self) -> Dict[str, Optional[Any]]:
         """Extract all information from the SymmetryConstraint element.
@@ -75,4 +64,5 @@ class SymmetryConstraintExtractor(GeometricConstraintExtractor):
             'entityTwo': self.entityTwo,
             'symmetry_line': self.symmetry_line,
         }
-        return {**base_info, **constraint_info}
+        base_info.update(constraint_info)
+        return base_info
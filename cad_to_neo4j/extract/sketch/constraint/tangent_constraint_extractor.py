@@ -7,7 +7,6 @@ Classes:
     - TangentConstraintExtractor: Extractor for TangentConstraint objects.
 """
 from typing import Optional, Dict, Any
-import traceback
 from adsk.fusion import TangentConstraint
 from .geometric_constraint_extractor import GeometricConstraintExtractor
 from ....utils.extraction_utils import nested_getattr
@@ -15,6 +14,8 @@ from ....utils.extraction_utils import nested_getattr
 class TangentConstraintExtractor(GeometricConstraintExtractor):
     """Extractor for TangentConstraint objects."""
 
+    __slots__ = ()
+
     def __init__(self, obj: TangentConstraint):
         """
         Initialise the extractor with the TangentConstraint element.
@@ -35,7 +36,8 @@ class TangentConstraintExtractor(GeometricConstraintExtractor):
             'curveOne': self.curveOne,
             'curveTwo': self.curveTwo,
         }
-        return {**base_info, **constraint_info}
+        base_info.update(constraint_info)
+        return base_info
 
     @property
     def curveOne(self) -> Optional[str]:
@@ -44,11 +46,7 @@ class TangentConstraintExtractor(GeometricConstraintExtractor):
         Returns:
             str: The entity token of the first curve.
         """
-        try:
-            return nested_getattr(self._obj, 'curveOne.entityToken', None)
-        except AttributeError as e:
-            self.logger.error(f'Error extracting curveOne: {e}\n{traceback.format_exc()}')
-            return None
+        return nested_getattr(self._obj, 'curveOne.entityToken', None)
 
     @property
     def curveTwo(self) -> Optional[str]:
@@ -57,8 +55,4 @@ class TangentConstraintExtractor(GeometricConstraintExtractor):
         Returns:
             str: The entity token of the second curve.
         """
-        try:
-            return nested_getattr(self._obj, 'curveTwo.entityToken', None)
-        except AttributeError as e:
-            self.logger.error(f'Error extracting curveTwo: {e}\n{traceback.format_exc()}')
-            return None
+        return nested_getattr(self._obj, 'curveTwo.entityToken', None)
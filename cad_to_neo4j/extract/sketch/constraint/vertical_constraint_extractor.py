@@ -7,7 +7,6 @@ Classes:
 """
 
 from typing import Optional, Dict, Any
-import traceback
 from adsk.fusion import VerticalConstraint
 from .geometric_constraint_extractor import GeometricConstraintExtractor
 from ....utils.extraction_utils import nested_getattr
@@ -15,6 +14,8 @@ from ....utils.extraction_utils import nested_getattr
 class VerticalConstraintExtractor(GeometricConstraintExtractor):
     """Extractor for VerticalConstraint objects."""
 
+    __slots__ = ()
+
     def __init__(self, obj: VerticalConstraint):
         """
         Initialise the extractor with the VerticalConstraint element.
@@ -31,11 +32,7 @@ class VerticalConstraintExtractor(GeometricConstraintExtractor):
         Returns:
             str: The entity token of the line.
         """
-        try:
-            return nested_getattr(self._obj, 'line.entityToken', None)
-        except AttributeError as e:
-            self.logger.error(f'Error extracting line: {e}\n{traceback.format_exc()}')
-            return None
+        return nested_getattr(self._obj, 'line.entityToken', None)
 
     def extract_info(self) -> Dict[str, Optional[Any]]:
         """Extract all information from the VerticalConstraint element.
@@ -47,4 +44,5 @@ class VerticalConstraintExtractor(GeometricConstraintExtractor):
         constraint_info = {
             'line': self.line,
         }
-        return {**base_info, **constraint_info}
\ No newline at end of file
+        base_info.update(constraint_info)
+        return base_info
\ No newline at end of file
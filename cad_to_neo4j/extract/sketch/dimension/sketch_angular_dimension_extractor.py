@@ -7,8 +7,9 @@ Classes:
     - SketchAngularDimensionExtractor: Extractor for SketchAngularDimension objects.
 """
 
-from typing import Optional, Dict, Any
-from adsk.fusion import SketchAngularDimension
+from typing import TYPE_CHECKING, Optional, Dict, Any
+if TYPE_CHECKING:
+    from adsk.fusion import SketchAngularDimension
 from .sketch_dimension_extractor import SketchDimensionExtractor
 from ....utils.extraction_utils import nested_getattr
 
@@ -17,7 +18,9 @@ __all__ = ['SketchAngularDimensionExtractor']
 class SketchAngularDimensionExtractor(SketchDimensionExtractor):
     """Extractor for extracting detailed information from SketchAngularDimension objects."""
 
-    def __init__(self, obj: SketchAngularDimension):
+    __slots__ = ()
+
+    def __init__(self, obj: 'SketchAngularDimension'):
         """
         Initialize the extractor with the SketchAngularDimension element.
 
@@ -39,7 +42,7 @@ class SketchAngularDimensionExtractor(SketchDimensionExtractor):
             'lineTwo': self.lineTwo,
         }
 
-        return {**basic_info, **dimension_info}
+        return self._update_entities(basic_info, dimension_info)
 
     @property
     def lineOne(self) -> Optional[str]:
@@ -49,10 +52,7 @@ class SketchAngularDimensionExtractor(SketchDimensionExtractor):
         Returns:
             str: The entity token of the first line, or None if not available.
         """
-        try:
-            return nested_getattr(self._obj,'lineOne.entityToken', None)
-        except AttributeError:
-            return None
+        return nested_getattr(self._obj,'lineOne.entityToken', None)
 
     @property
     def lineTwo(self) -> Optional[str]:
@@ -62,7 +62,4 @@ class SketchAngularDimensionExtractor(SketchDimensionExtractor):
         Returns:
             str: The entity token of the second line, or None if not available.
         """
-        try:
-            return nested_getattr(self._obj,'lineTwo.entityToken', None)
-        except AttributeError:
-            return None
+        return nested_getattr(self._obj,'lineTwo.entityToken', None)
@@ -7,8 +7,9 @@ Classes:
     - SketchConcentricCircleDimensionExtractor: Extractor for SketchConcentricCircleDimension objects.
 """
 
-from typing import Optional, Dict, Any
-from adsk.fusion import SketchConcentricCircleDimension
+from typing import TYPE_CHECKING, Optional, Dict, Any
+if TYPE_CHECKING:
+    from adsk.fusion import SketchConcentricCircleDimension
 from .sketch_dimension_extractor import SketchDimensionExtractor
 from ....utils.extraction_utils import nested_getattr
 
@@ -17,7 +18,9 @@ __all__ = ['SketchConcentricCircleDimensionExtractor']
 class SketchConcentricCircleDimensionExtractor(SketchDimensionExtractor):
     """Extractor for extracting detailed information from SketchConcentricCircleDimension objects."""
 
-    def __init__(self, obj: SketchConcentricCircleDimension):
+    __slots__ = ()
+
+    def __init__(self, obj: 'SketchConcentricCircleDimension'):
         """
         Initialize the extractor with the SketchConcentricCircleDimension element.
 
@@ -39,7 +42,7 @@ class SketchConcentricCircleDimensionExtractor(SketchDimensionExtractor):
             'circleTwo': self.circleTwo,
         }
 
-        return {**basic_info, **dimension_info}
+        return self._update_entities(basic_info, dimension_info)
 
     @property
     def circleOne(self) -> Optional[str]:
@@ -49,10 +52,7 @@ class SketchConcentricCircleDimensionExtractor(SketchDimensionExtractor):
         Returns:
             str: The entity token of the first concentric circle or arc, or None if not available.
         """
-        try:
-            return nested_getattr(self._obj,'circleOne.entityToken', None)
-        except AttributeError:
-            return None
+        return nested_getattr(self._obj,'circleOne.entityToken', None)
 
     @property
     def circleTwo(self) -> Optional[str]:
@@ -62,7 +62,4 @@ class SketchConcentricCircleDimensionExtractor(SketchDimensionExtractor):
         Returns:
             str: The entity token of the second concentric circle or arc, or None if not available.
         """
-        try:
-            return nested_getattr(self._obj,'circleTwo.entityToken', None)
-        except AttributeError:
-            return None
+        return nested_getattr(self._obj,'circleTwo.entityToken', None)
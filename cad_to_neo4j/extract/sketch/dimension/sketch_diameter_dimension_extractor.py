@@ -7,8 +7,9 @@ Classes:
     - SketchDiameterDimensionExtractor: Extractor for SketchDiameterDimension objects.
 """
 
-from typing import Optional, Dict, Any
-from adsk.fusion import SketchDiameterDimension
+from typing import TYPE_CHECKING, Optional, Dict, Any
+if TYPE_CHECKING:
+    from adsk.fusion import SketchDiameterDimension
 from .sketch_dimension_extractor import SketchDimensionExtractor
 from ....utils.extraction_utils import nested_getattr
 
@@ -17,7 +18,9 @@ __all__ = ['SketchDiameterDimensionExtractor']
 class SketchDiameterDimensionExtractor(SketchDimensionExtractor):
     """Extractor for extracting detailed information from SketchDiameterDimension objects."""
 
-    def __init__(self, obj: SketchDiameterDimension):
+    __slots__ = ()
+
+    def __init__(self, obj: 'SketchDiameterDimension'):
         """
         Initialize the extractor with the SketchDiameterDimension element.
 
@@ -34,10 +37,7 @@ class SketchDiameterDimensionExtractor(SketchDimensionExtractor):
         Returns:
             str: The entity token of the arc or circle, or None if not available.
         """
-        try:
-            return nested_getattr(self._obj,'entity.entityToken', None)
-        except AttributeError:
-            return None
+        return nested_getattr(self._obj,'entity.entityToken', None)
 
     def extract_info(self) -> Dict[str, Any]:
         """
@@ -51,4 +51,4 @@ class SketchDiameterDimensionExtractor(SketchDimensionExtractor):
             'entity': self.entity,
         }
 
-        return {**basic_info, **dimension_info}
+        return self._update_entities(basic_info, dimension_info)
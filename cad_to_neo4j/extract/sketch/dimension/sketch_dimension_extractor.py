@@ -6,8 +6,9 @@ This module provides an extractor class for extracting information from SketchDi
 Classes:
     - SketchDimensionExtractor: Extractor for SketchDimension objects.
 """
-from typing import Optional, Dict, Any
-import adsk.fusion
+from typing import TYPE_CHECKING, Optional, Dict, Any
+if TYPE_CHECKING:
+    import adsk.fusion
 from ...base_extractor import BaseExtractor
 from ....utils.extraction_utils import nested_getattr
 
@@ -17,7 +18,9 @@ __all__ = ['SketchDimensionExtractor']
 class SketchDimensionExtractor(BaseExtractor):
     """Extractor for extracting detailed information from SketchDimension objects."""
 
-    def __init__(self, obj: adsk.fusion.SketchDimension):
+    __slots__ = ()
+
+    def __init__(self, obj: 'adsk.fusion.SketchDimension'):
         """Initialize the extractor with the SketchDimension element."""
         super().__init__(obj)
 
@@ -34,25 +37,42 @@ class SketchDimensionExtractor(BaseExtractor):
             'associatedModelParameter': self.associatedModelParameter,
         }
 
-        return {**basic_info, **dimension_info}
+        basic_info.update(dimension_info)
+        return basic_info
+
+    @staticmethod
+    def _update_entities(
+            basic_info: Dict[str, Any],
+            entities: Dict[str, Optional[str]]) -> Dict[str, Any]:
+        """Add the constrained entity tokens to the extracted information.
+
+        Orphaned dimensions resolve none of their entities, so their all-None
+        keys are left out.
+
+        Args:
+            basic_info (dict): The information extracted so far.
+            entities (dict): The entity tokens, keyed by property name.
+
+        Returns:
+            dict: basic_info, updated with the entities if any resolved.
+        """
+        for token in entities.values():
+            if token is not None:
+                basic_info.update(entities)
+                break
+        return basic_info
 
     @property
     def dimensionValue(self) -> Optional[float]:
         """Extract the value of the sketch dimension."""
-        try:
-            return getattr(self._obj, 'value', None)
-        except AttributeError:
-            return None
+        return getattr(self._obj, 'value', None)
 
     @property
     def parentSketch(self) -> Optional[str]:
         """
         Returns the parent sketch.
         """
-        try:
-            return nested_getattr(self._obj, 'parentSketch.entityToken', None)
-        except AttributeError:
-            return None
+        return nested_getattr(self._obj, 'parentSketch.entityToken', None)
 
     @property
     def associatedModelParameter(self) -> Optional[str]:
@@ -7,8 +7,9 @@ Classes:
     - SketchDistanceBetweenLineAndPlanarSurfaceDimensionExtractor: Extractor for SketchDistanceBetweenLineAndPlanarSurfaceDimension objects.
 """
 
-from typing import Optional, Dict, Any
-from adsk.fusion import SketchDistanceBetweenLineAndPlanarSurfaceDimension
+from typing import TYPE_CHECKING, Optional, Dict, Any
+if TYPE_CHECKING:
+    from adsk.fusion import SketchDistanceBetweenLineAndPlanarSurfaceDimension
 from .sketch_dimension_extractor import SketchDimensionExtractor
 from ....utils.extraction_utils import nested_getattr
 
@@ -17,7 +18,9 @@ __all__ = ['SketchDistanceBetweenLineAndPlanarSurfaceDimensionExtractor']
 class SketchDistanceBetweenLineAndPlanarSurfaceDimensionExtractor(SketchDimensionExtractor):
     """Extractor for extracting detailed information from SketchDistanceBetweenLineAndPlanarSurfaceDimension objects."""
 
-    def __init__(self, obj: SketchDistanceBetweenLineAndPlanarSurfaceDimension):
+    __slots__ = ()
+
+    def __init__(self, obj: 'SketchDistanceBetweenLineAndPlanarSurfaceDimension'):
         """
         Initialize the extractor with the SketchDistanceBetweenLineAndPlanarSurfaceDimension element.
 
@@ -39,7 +42,7 @@ class SketchDistanceBetweenLineAndPlanarSurfaceDimensionExtractor(SketchDimensio
             'planarSurface': self.planarSurface,
         }
 
-        return {**basic_info, **dimension_info}
+        return self._update_entities(basic_info, dimension_info)
 
     @property
     def line(self) -> Optional[str]:
@@ -49,10 +52,7 @@ class SketchDistanceBetweenLineAndPlanarSurfaceDimensionExtractor(SketchDimensio
         Returns:
             str: The entity token of the sketch line, or None if not available.
         """
-        try:
-            return nested_getattr(self._obj,'line.entityToken', None)
-        except AttributeError:
-            return None
+        return nested_getattr(self._obj,'line.entityToken', None)
 
     @property
     def planarSurface(self) -> Optional[str]:
@@ -62,7 +62,4 @@ class SketchDistanceBetweenLineAndPlanarSurfaceDimensionExtractor(SketchDimensio
         Returns:
             str: The entity token of the planar surface, or None if not available.
         """
-        try:
-            return nested_getattr(self._obj, 'planarSurface.entityToken', None)
-        except AttributeError:
-            return None
+        return nested_getattr(self._obj, 'planarSurface.entityToken', None)
@@ -7,8 +7,9 @@ Classes:
     - SketchDistanceBetweenPointAndSurfaceDimensionExtractor: Extractor for SketchDistanceBetweenPointAndSurfaceDimension objects.
 """
 
-from typing import Optional, Dict, Any
-from adsk.fusion import SketchDistanceBetweenPointAndSurfaceDimension
+from typing import TYPE_CHECKING, Optional, Dict, Any
+if TYPE_CHECKING:
+    from adsk.fusion import SketchDistanceBetweenPointAndSurfaceDimension
 from .sketch_dimension_extractor import SketchDimensionExtractor
 from ....utils.extraction_utils import nested_getattr
 
@@ -17,7 +18,9 @@ __all__ = ['SketchDistanceBetweenPointAndSurfaceDimensionExtractor']
 class SketchDistanceBetweenPointAndSurfaceDimensionExtractor(SketchDimensionExtractor):
     """Extractor for extracting detailed information from SketchDistanceBetweenPointAndSurfaceDimension objects."""
 
-    def __init__(self, obj: SketchDistanceBetweenPointAndSurfaceDimension):
+    __slots__ = ()
+
+    def __init__(self, obj: 'SketchDistanceBetweenPointAndSurfaceDimension'):
         """
         Initialize the extractor with the SketchDistanceBetweenPointAndSurfaceDimension element.
 
@@ -39,7 +42,7 @@ class SketchDistanceBetweenPointAndSurfaceDimensionExtractor(SketchDimensionExtr
             'surface': self.surface,
         }
 
-        return {**basic_info, **dimension_info}
+        return self._update_entities(basic_info, dimension_info)
 
     @property
     def point(self) -> Optional[str]:
@@ -49,10 +52,7 @@ class SketchDistanceBetweenPointAndSurfaceDimensionExtractor(SketchDimensionExtr
         Returns:
             str: The entity token of the sketch point, or None if not available.
         """
-        try:
-            return nested_getattr(self._obj,'point.entityToken', None)
-        except AttributeError:
-            return None
+        return nested_getattr(self._obj,'point.entityToken', None)
 
     @property
     def surface(self) -> Optional[str]:
@@ -62,7 +62,4 @@ class SketchDistanceBetweenPointAndSurfaceDimensionExtractor(SketchDimensionExtr
         Returns:
             str: The entity token of the surface, or None if not available.
         """
-        try:
-            return nested_getattr(self._obj, 'surface.entityToken', None)
-        except AttributeError:
-            return None
+        return nested_getattr(self._obj, 'surface.entityToken', None)
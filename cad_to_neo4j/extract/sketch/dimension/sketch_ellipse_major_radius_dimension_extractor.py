@@ -7,8 +7,9 @@ Classes:
     - SketchEllipseMajorRadiusDimensionExtractor: Extractor for SketchEllipseMajorRadiusDimension objects.
 """
 
-from typing import Optional, Dict, Any
-from adsk.fusion import SketchEllipseMajorRadiusDimension
+from typing import TYPE_CHECKING, Optional, Dict, Any
+if TYPE_CHECKING:
+    from adsk.fusion import SketchEllipseMajorRadiusDimension
 from .sketch_dimension_extractor import SketchDimensionExtractor
 from ....utils.extraction_utils import nested_getattr
 
@@ -17,7 +18,9 @@ __all__ = ['SketchEllipseMajorRadiusDimensionExtractor']
 class SketchEllipseMajorRadiusDimensionExtractor(SketchDimensionExtractor):
     """Extractor for extracting detailed information from SketchEllipseMajorRadiusDimension objects."""
 
-    def __init__(self, obj: SketchEllipseMajorRadiusDimension):
+    __slots__ = ()
+
+    def __init__(self, obj: 'SketchEllipseMajorRadiusDimension'):
         """
         Initialize the extractor with the SketchEllipseMajorRadiusDimension element.
 
@@ -38,7 +41,7 @@ class SketchEllipseMajorRadiusDimensionExtractor(SketchDimensionExtractor):
             'ellipse': self.ellipse,
         }
 
-        return {**basic_info, **dimension_info}
+        return self._update_entities(basic_info, dimension_info)
 
     @property
     def ellipse(self) -> Optional[str]:
@@ -48,7 +51,4 @@ class SketchEllipseMajorRadiusDimensionExtractor(SketchDimensionExtractor):
         Returns:
             str: The entity token of the ellipse or elliptical arc, or None if not available.
         """
-        try:
-            return nested_getattr(self._obj,'ellipse.entityToken', None)
-        except AttributeError:
-            return None
+        return nested_getattr(self._obj,'ellipse.entityToken', None)
@@ -7,8 +7,9 @@ Classes:
     - SketchEllipseMinorRadiusDimensionExtractor: Extractor for SketchEllipseMinorRadiusDimension objects.
 """
 
-from typing import Optional, Dict, Any
-from adsk.fusion import SketchEllipseMinorRadiusDimension
+from typing import TYPE_CHECKING, Optional, Dict, Any
+if TYPE_CHECKING:
+    from adsk.fusion import SketchEllipseMinorRadiusDimension
 from .sketch_dimension_extractor import SketchDimensionExtractor
 from ....utils.extraction_utils import nested_getattr
 
@@ -17,7 +18,9 @@ __all__ = ['SketchEllipseMinorRadiusDimensionExtractor']
 class SketchEllipseMinorRadiusDimensionExtractor(SketchDimensionExtractor):
     """Extractor for extracting detailed information from SketchEllipseMinorRadiusDimension objects."""
 
-    def __init__(self, obj: SketchEllipseMinorRadiusDimension):
+    __slots__ = ()
+
+    def __init__(self, obj: 'SketchEllipseMinorRadiusDimension'):
         """
         Initialize the extractor with the SketchEllipseMinorRadiusDimension element.
 
@@ -38,7 +41,7 @@ class SketchEllipseMinorRadiusDimensionExtractor(SketchDimensionExtractor):
             'ellipse': self.ellipse,
         }
 
-        return {**basic_info, **dimension_info}
+        return self._update_entities(basic_info, dimension_info)
 
     @property
     def ellipse(self) -> Optional[str]:
@@ -48,7 +51,4 @@ class SketchEllipseMinorRadiusDimensionExtractor(SketchDimensionExtractor):
         Returns:
             str: The entity token of the ellipse or elliptical arc, or None if not available.
         """
-        try:
-            return nested_getattr(self._obj,'ellipse.entityToken', None)
-        except AttributeError:
-            return None
+        return nested_getattr(self._obj,'ellipse.entityToken', None)
@@ -7,8 +7,9 @@ Classes:
     - SketchLinearDimensionExtractor: Extractor for SketchLinearDimension objects.
 """
 
-from typing import Optional, Dict, Any
-from adsk.fusion import SketchLinearDimension
+from typing import TYPE_CHECKING, Optional, Dict, Any
+if TYPE_CHECKING:
+    from adsk.fusion import SketchLinearDimension
 from .sketch_dimension_extractor import SketchDimensionExtractor
 from ....utils.extraction_utils import nested_getattr
 
@@ -17,7 +18,9 @@ __all__ = ['SketchLinearDimensionExtractor']
 class SketchLinearDimensionExtractor(SketchDimensionExtractor):
     """Extractor for extracting detailed information from SketchLinearDimension objects."""
 
-    def __init__(self, obj: SketchLinearDimension):
+    __slots__ = ()
+
+    def __init__(self, obj: 'SketchLinearDimension'):
         """
         Initialize the extractor with the SketchLinearDimension element.
 
@@ -34,10 +37,7 @@ class SketchLinearDimensionExtractor(SketchDimensionExtractor):
         Returns:
             str: The entity token of the first entity, or None if not available.
         """
-        try:
-            return nested_getattr(self._obj,'entityOne.entityToken', None)
-        except AttributeError:
-            return None
+        return nested_getattr(self._obj,'entityOne.entityToken', None)
 
     def extract_info(self) -> Dict[str, Any]:
         """
@@ -52,7 +52,7 @@ class SketchLinearDimensionExtractor(SketchDimensionExtractor):
             'entityTwo': self.entityTwo,
         }
 
-        return {**basic_info, **dimension_info}
+        return self._update_entities(basic_info, dimension_info)
 
     @property
     def entityTwo(self) -> Optional[str]:
@@ -62,7 +62,4 @@ class SketchLinearDimensionExtractor(SketchDimensionExtractor):
         Returns:
             str: The entity token of the second entity, or None if not available.
         """
-        try:
-            return nested_getattr(self._obj,'entityTwo.entityToken', None)
-        except AttributeError:
-            return None
+        return nested_getattr(self._obj,'entityTwo.entityToken', None)
@@ -7,8 +7,9 @@ Classes:
     - SketchOffsetCurvesDimensionExtractor: Extractor for SketchOffsetCurvesDimension objects.
 """
 
-from typing import Optional, Dict, Any
-from adsk.fusion import SketchOffsetCurvesDimension
+from typing import TYPE_CHECKING, Optional, Dict, Any
+if TYPE_CHECKING:
+    from adsk.fusion import SketchOffsetCurvesDimension
 from .sketch_dimension_extractor import SketchDimensionExtractor
 from ....utils.extraction_utils import nested_getattr
 
@@ -17,7 +18,9 @@ __all__ = ['SketchOffsetCurvesDimensionExtractor']
 class SketchOffsetCurvesDimensionExtractor(SketchDimensionExtractor):
     """Extractor for extracting detailed information from SketchOffsetCurvesDimension objects."""
 
-    def __init__(self, obj: SketchOffsetCurvesDimension):
+    __slots__ = ()
+
+    def __init__(self, obj: 'SketchOffsetCurvesDimension'):
         """
         Initialize the extractor with the SketchOffsetCurvesDimension element.
 
@@ -38,7 +41,7 @@ class SketchOffsetCurvesDimensionExtractor(SketchDimensionExtractor):
             'offsetConstraint': self.offsetConstraint,
         }
 
-        return {**basic_info, **dimension_info}
+        return self._update_entities(basic_info, dimension_info)
 
     @property
     def offsetConstraint(self) -> Optional[str]:
@@ -48,7 +51,4 @@ class SketchOffsetCurvesDimensionExtractor(SketchDimensionExtractor):
         Returns:
             str: The entity token of the OffsetConstraint, or None if not available.
         """
-        try:
-            return nested_getattr(self._obj,'offsetConstraint.entityToken', None)
-        except AttributeError:
-            return None
+        return nested_getattr(self._obj,'offsetConstraint.entityToken', None)
@@ -7,8 +7,9 @@ Classes:
     - SketchOffsetDimensionExtractor: Extractor for SketchOffsetDimension objects.
 """
 
-from typing import Optional, Dict, Any
-from adsk.fusion import SketchOffsetDimension
+from typing import TYPE_CHECKING, Optional, Dict, Any
+if TYPE_CHECKING:
+    from adsk.fusion import SketchOffsetDimension
 from .sketch_dimension_extractor import SketchDimensionExtractor
 from ....utils.extraction_utils import nested_getattr
 
@@ -17,7 +18,9 @@ __all__ = ['SketchOffsetDimensionExtractor']
 class SketchOffsetDimensionExtractor(SketchDimensionExtractor):
     """Extractor for extracting detailed information from SketchOffsetDimension objects."""
 
-    def __init__(self, obj: SketchOffsetDimension):
+    __slots__ = ()
+
+    def __init__(self, obj: 'SketchOffsetDimension'):
         """
         Initialize the extractor with the SketchOffsetDimension element.
 
@@ -34,10 +37,7 @@ class SketchOffsetDimensionExtractor(SketchDimensionExtractor):
         Returns:
             str: The entity token of the first line, or None if not available.
         """
-        try:
-            return nested_getattr(self._obj, 'line.entityToken', None)
-        except AttributeError:
-            return None
+        return nested_getattr(self._obj, 'line.entityToken', None)
 
     @property
     def entityTwo(self) -> Optional[str]:
@@ -47,10 +47,7 @@ class SketchOffsetDimensionExtractor(SketchDimensionExtractor):
         Returns:
             str: The entity token of the second entity, or None if not available.
         """
-        try:
-            return nested_getattr(self._obj,'entityTwo.entityToken', None)
-        except AttributeError:
-            return None
+        return nested_getattr(self._obj,'entityTwo.entityToken', None)
 
     def extract_info(self) -> Dict[str, Any]:
         """
@@ -65,4 +62,4 @@ class SketchOffsetDimensionExtractor(SketchDimensionExtractor):
             'entityTwo': self.entityTwo,
         }
 
-        return {**basic_info, **dimension_info}
+        return self._update_entities(basic_info, dimension_info)
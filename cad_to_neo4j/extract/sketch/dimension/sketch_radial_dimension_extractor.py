@@ -7,8 +7,9 @@ Classes:
     - SketchRadialDimensionExtractor: Extractor for SketchRadialDimension objects.
 """
 
-from typing import Optional, Dict, Any
-from adsk.fusion import SketchRadialDimension
+from typing import TYPE_CHECKING, Optional, Dict, Any
+if TYPE_CHECKING:
+    from adsk.fusion import SketchRadialDimension
 from .sketch_dimension_extractor import SketchDimensionExtractor
 from ....utils.extraction_utils import nested_getattr
 
@@ -17,7 +18,9 @@ __all__ = ['SketchRadialDimensionExtractor']
 class SketchRadialDimensionExtractor(SketchDimensionExtractor):
     """Extractor for extracting detailed information from SketchRadialDimension objects."""
 
-    def __init__(self, obj: SketchRadialDimension):
+    __slots__ = ()
+
+    def __init__(self, obj: 'SketchRadialDimension'):
         """
         Initialize the extractor with the SketchRadialDimension element.
 
@@ -38,7 +41,7 @@ class SketchRadialDimensionExtractor(SketchDimensionExtractor):
             'entity': self.entity,
         }
 
-        return {**basic_info, **dimension_info}
+        return self._update_entities(basic_info, dimension_info)
 
     @property
     def entity(self) -> Optional[str]:
@@ -48,7 +51,4 @@ class SketchRadialDimensionExtractor(SketchDimensionExtractor):
         Returns:
             str: The entity token of the arc or circle, or None if not available.
         """
-        try:
-            return nested_getattr(self._obj,'entity.entityToken', None)
-        except AttributeError:
-            return None
+        return nested_getattr(self._obj,'entity.entityToken', None)
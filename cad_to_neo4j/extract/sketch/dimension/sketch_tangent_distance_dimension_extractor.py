@@ -7,8 +7,9 @@ Classes:
     - SketchTangentDistanceDimensionExtractor: Extractor for SketchTangentDistanceDimension objects.
 """
 
-from typing import Optional, Dict, Any
-from adsk.fusion import SketchTangentDistanceDimension
+from typing import TYPE_CHECKING, Optional, Dict, Any
+if TYPE_CHECKING:
+    from adsk.fusion import SketchTangentDistanceDimension
 from .sketch_dimension_extractor import SketchDimensionExtractor
 from ....utils.extraction_utils import nested_getattr
 
@@ -17,7 +18,9 @@ __all__ = ['SketchTangentDistanceDimensionExtractor']
 class SketchTangentDistanceDimensionExtractor(SketchDimensionExtractor):
     """Extractor for extracting detailed information from SketchTangentDistanceDimension objects."""
 
-    def __init__(self, obj: SketchTangentDistanceDimension):
+    __slots__ = ()
+
+    def __init__(self, obj: 'SketchTangentDistanceDimension'):
         """
         Initialize the extractor with the SketchTangentDistanceDimension element.
 
@@ -39,7 +42,7 @@ class SketchTangentDistanceDimensionExtractor(SketchDimensionExtractor):
             'circleOrArc': self.circleOrArc,
         }
 
-        return {**basic_info, **dimension_info}
+        return self._update_entities(basic_info, dimension_info)
     
     @property
     def entityOne(self) -> Optional[str]:
@@ -49,10 +52,7 @@ class SketchTangentDistanceDimensionExtractor(SketchDimensionExtractor):
         Returns:
             str: The entity token of the first entity, or None if not available.
         """
-        try:
-            return nested_getattr(self._obj, 'entityOne.entityToken', None)
-        except AttributeError:
-            return None
+        return nested_getattr(self._obj, 'entityOne.entityToken', None)
 
     @property
     def circleOrArc(self) -> Optional[str]:
@@ -62,7 +62,4 @@ class SketchTangentDistanceDimensionExtractor(SketchDimensionExtractor):
         Returns:
             str: The entity token of the circle or arc, or None if not available.
         """
-        try:
-            return nested_getattr(self._obj, 'circleOrArc.entityToken', None)
-        except AttributeError:
-            return None
\ No newline at end of file
+        return nested_getattr(self._obj, 'circleOrArc.entityToken', None)
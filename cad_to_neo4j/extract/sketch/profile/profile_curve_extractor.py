@@ -9,15 +9,15 @@ Classes:
 
 Functions:
     - extract_info: Extracts information from the ProfileCurve object and returns it as a dictionary.
-    - geometry_type: Property to get the geometry type of the ProfileCurve object.
-    - geometry: Property to get the geometry details (start and end points) of the ProfileCurve object.
+    - geometry_info: Property to get the geometry type and geometry details (start and end points) of the ProfileCurve object.
     - sketch_entity: Property to get the associated sketch entity token of the ProfileCurve object.
 """
-from typing import Dict, Any
-from adsk.fusion import ProfileCurve
+from typing import TYPE_CHECKING, Dict, Any
+if TYPE_CHECKING:
+    from adsk.fusion import ProfileCurve
 from ...base_extractor import BaseExtractor
 
-from ....utils.extraction_utils import nested_getattr
+from ....utils.extraction_utils import point_to_list
 
 class ProfileCurveExtractor(BaseExtractor):
     """
@@ -29,7 +29,10 @@ class ProfileCurveExtractor(BaseExtractor):
     Attributes:
         element (adsk.fusion.ProfileCurve): The ProfileCurve object to extract data from.
     """
-    def __init__(self, obj: ProfileCurve):
+
+    __slots__ = ()
+
+    def __init__(self, obj: 'ProfileCurve'):
         """
         Initialise the extractor with the ProfileCurve object.
 
@@ -46,50 +49,39 @@ class ProfileCurveExtractor(BaseExtractor):
             dict: A dictionary containing the extracted information.
         """
         base_info = super().extract_info()
-        curve_info = {
-            'geometryType': self.geometry_type,
-            'sketchEntity': self.sketch_entity,
-            'tempId' : None,
-        }
-
-        # Add geometry information if available
-        geometry = self.geometry
-        if geometry is not None:
-            curve_info.update(geometry)
-        return {**curve_info,**base_info}
+        curve_info = {'sketchEntity': self.sketch_entity}
 
-    @property
-    def geometry_type(self) -> str:
-        """
-        Get the geometry type of the ProfileCurve object.
-
-        Returns:
-            str: The geometry type.
-        """
-        try:
-            return getattr(self._obj, 'geometryType', None)
-        except:
-            return None
+        # Add geometry type and geometry information
+        curve_info.update(self.geometry_info)
+        curve_info.update(base_info)
+        return curve_info
 
     @property
-    def geometry(self) -> Dict[str, Any]:
+    def geometry_info(self) -> Dict[str, Any]:
         """
-        Get the geometry details of the ProfileCurve object.
+        Get the geometry type and geometry details of the ProfileCurve object.
+
+        The geometry is fetched once and the geometry type is only queried
+        when a geometry is present.
 
         Returns:
-            dict: A dictionary containing the start and end points of the geometry.
+            dict: A dictionary containing the geometry type and the start and
+                end points of the geometry.
         """
-        geom = getattr(self._obj, 'geometry', None)
+        geometry_info: Dict[str, Any] = {'geometryType': None}
         try:
-            if geom:
-                return {
-                    'startPoint': [geom.startPoint.x, geom.startPoint.y, geom.startPoint.z],
-                    'endPoint': [geom.endPoint.x, geom.endPoint.y, geom.endPoint.z]
-                }
-            return {}
-        except:
+            geom = getattr(self._obj, 'geometry', None)
+            if not geom:
+                return geometry_info
+            geometry_info['geometryType'] = getattr(self._obj, 'geometryType', None)
+            start_point = point_to_list(geom.startPoint)
+            end_point = point_to_list(geom.endPoint)
+            geometry_info['startPoint'] = start_point
+            geometry_info['endPoint'] = end_point
+        except Exception:
             # TODO deal with different types of curves which will have different types of geometries
-            return {}
+            pass
+        return geometry_info
 
     @property
     def sketch_entity(self) -> str:
@@ -99,4 +91,5 @@ class ProfileCurveExtractor(BaseExtractor):
         Returns:
             str: The sketch entity token.
         """
-        return nested_getattr(self._obj, 'sketchEntity.entityToken', None)
\ No newline at end of file
+        sketch_entity = getattr(self._obj, 'sketchEntity', None)
+        return getattr(sketch_entity, 'entityToken', None)
\ No newline at end of file
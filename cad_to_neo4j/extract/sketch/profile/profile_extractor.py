@@ -6,17 +6,20 @@ This module provides an extractor class for extracting information from Profile
 Classes:
     - ProfileExtractor: Extractor for Profile objects.
 """
-import uuid
-from typing import Optional, Tuple, Dict, List, Any
-from adsk.fusion import Profile, ProfileLoop
+from itertools import chain
+from typing import TYPE_CHECKING, Optional, Dict, List, Any
+if TYPE_CHECKING:
+    from adsk.fusion import Profile
 import traceback
 
 from .profile_loop_extractor import ProfileLoopExtractor
 from ...base_extractor import BaseExtractor
-from ....utils.extraction_utils import nested_getattr
+from ....utils.extraction_utils import (
+    assign_temp_id, materialise, nested_getattr, point_to_list)
 
 __all__ = ['ProfileExtractor']
 
+
 class ProfileExtractor(BaseExtractor):
     """
     Extractor for extracting detailed information from Profile objects.
@@ -28,7 +31,9 @@ class ProfileExtractor(BaseExtractor):
         element (adsk.fusion.Profile): The Profile object to extract data from.
     """
 
-    def __init__(self, obj: Profile):
+    __slots__ = ()
+
+    def __init__(self, obj: 'Profile'):
         """
         Initialize the extractor with the Profile element.
 
@@ -45,31 +50,23 @@ class ProfileExtractor(BaseExtractor):
             dict: A dictionary containing the extracted information.
         """
         basic_info: Dict[str, Any] = super().extract_info()
-        profile_info: Dict[str, Any] = {
-            'parentSketch': self.parentSketch,
-        }
-
-        # Add plane information if available
-        areaProperties_info = self.areaProperties
-        if areaProperties_info is not None:
-            profile_info.update(areaProperties_info)
-
-        # Add plane information if available
-        plane_info = self.plane
-        if plane_info is not None:
-            profile_info.update(plane_info)
-
-        # Add bounding box information if available
-        bbbox_info = self.boundingBox
-        if bbbox_info is not None:
-            profile_info.update(bbbox_info)
-
-        # Add profileLoops information if available
-        profileLoopInfo = self.profileLoopInfo
-        if profileLoopInfo is not None:
-            profile_info.update(profileLoopInfo)
-
-        return {**basic_info, **profile_info}
+        basic_info['parentSketch'] = self.parentSketch
+
+        # Add area properties, plane, bounding box and profileLoops
+        # information, where available, in a single update. Invalid
+        # profiles skip the geometric queries, which would only fail.
+        if getattr(self._obj, 'isValid', True):
+            optional_info = (
+                self.areaProperties,
+                self.plane,
+                self.boundingBox,
+                self.profileLoopInfo,
+            )
+        else:
+            optional_info = (self.profileLoopInfo,)
+        basic_info.update(chain.from_iterable(
+            info.items() for info in optional_info if info is not None))
+        return basic_info
     
     @property
     def profileLoopInfo(self) -> Optional[Dict[str,List]]:
@@ -80,43 +77,19 @@ class ProfileExtractor(BaseExtractor):
         Returns:
             Optional[List[str]]: List of identity tokens for the profile loops.
         """
-        def process_loop(loop: ProfileLoop) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
-            """
-            Process a single profile loop to extract its information and ensure
-            it has a tempId.
-
-            Args:
-                loop (adsk.fusion.ProfileLoop)  The profile loop to be processed.
-
-            Returns:
-                Tuple[Optional[str], Optional[Dict[str, Any]]]: A tuple containing
-                    the tempId and a dictionary of the loop's information.
-            """
-            info: Optional[Dict[str, Any]] = ProfileLoopExtractor(loop).extract_info()
-            if info is None:
-                return None, None
-
-            if info['tempId'] is None:
-                tempId: str = str(uuid.uuid4())
-                info['tempId'] = tempId
-            else:
-                tempId = info['tempId']
-            
-            return tempId, info
-
         try:
-            profileLoops: List[str] = []
-            profileLoopsEntities: List[Dict[str, Any]] = []
-            TEXT = "\n"
-
-            loops = getattr(self._obj, 'profileLoops', [])
-            processed_loops = map(process_loop, loops)
-
-            for tempId, info in processed_loops:
-                profileLoops.append(tempId)
-                profileLoopsEntities.append(info)
-                TEXT += f"{tempId}    {len(info)}\n"
-            
+            loops = materialise(getattr(self._obj, 'profileLoops', None))
+            loop_count: int = len(loops)
+            profileLoops: List[str] = [None] * loop_count
+            profileLoopsEntities: List[Dict[str, Any]] = [None] * loop_count
+
+            # Extraction may run on worker threads; tempIds are assigned
+            # here so they follow loop order
+            processed_loops = ProfileLoopExtractor.extract_many(loops)
+            for index, info in enumerate(processed_loops):
+                profileLoops[index], profileLoopsEntities[index] = \
+                    assign_temp_id(info)
+
             return {
                 'profileLoopsEntities' : profileLoopsEntities,
                 'profileLoops' : profileLoops,
@@ -139,8 +112,8 @@ class ProfileExtractor(BaseExtractor):
             bbox = getattr(self._obj, 'boundingBox', None)
             if bbox:
                 return {
-                    'bbMinPoint': [bbox.minPoint.x, bbox.minPoint.y, bbox.minPoint.z],
-                    'bbMaxPoint': [bbox.maxPoint.x, bbox.maxPoint.y, bbox.maxPoint.z]
+                    'bbMinPoint': point_to_list(bbox.minPoint),
+                    'bbMaxPoint': point_to_list(bbox.maxPoint)
                 }
             return None
         except Exception as e:
@@ -159,8 +132,8 @@ class ProfileExtractor(BaseExtractor):
             plane = getattr(self._obj, 'plane', None)
             if plane:
                 return {
-                    'origin': [plane.origin.x, plane.origin.y, plane.origin.z],
-                    'normal': [plane.normal.x, plane.normal.y, plane.normal.z]
+                    'origin': point_to_list(plane.origin),
+                    'normal': point_to_list(plane.normal)
                 }
             return None
         except Exception as e:
@@ -180,7 +153,7 @@ class ProfileExtractor(BaseExtractor):
             return {
                 'area': area_props.area,
                 'perimeter': area_props.perimeter,
-                'centroid': [area_props.centroid.x, area_props.centroid.y, area_props.centroid.z]
+                'centroid': point_to_list(area_props.centroid)
             }
         except Exception as e:
             self.logger.error(f"Error extracting area properties: {e}")
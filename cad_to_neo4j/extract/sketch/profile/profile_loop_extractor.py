@@ -12,12 +12,14 @@ Functions:
     - isOuter: Property to get the outer loop status of the ProfileLoop object.
     - curveInfo: Property to get the information about profile curves in the ProfileLoop object.
 """
-import uuid
 import traceback
-from typing import Tuple, List, Dict, Any, Optional
-from adsk.fusion import ProfileLoop, ProfileCurve
+from typing import TYPE_CHECKING, List, Dict, Any, Optional
+if TYPE_CHECKING:
+    from adsk.fusion import ProfileLoop
 from ...base_extractor import BaseExtractor
 from .profile_curve_extractor import ProfileCurveExtractor
+from ....utils.extraction_utils import assign_temp_id, materialise
+
 
 class ProfileLoopExtractor(BaseExtractor):
     """
@@ -29,7 +31,10 @@ class ProfileLoopExtractor(BaseExtractor):
     Attributes:
         element (adsk.fusion.ProfileLoop): The ProfileLoop object to extract data from.
     """
-    def __init__(self, obj: ProfileLoop):
+
+    __slots__ = ()
+
+    def __init__(self, obj: 'ProfileLoop'):
         """
         Initialize the extractor with the ProfileLoop element.
 
@@ -46,17 +51,15 @@ class ProfileLoopExtractor(BaseExtractor):
             Dict[str, Any]: A dictionary containing the extracted information.
         """
         base_info: Dict[str, Any] = super().extract_info()
-        loop_info: Dict[str, Any] = {
-            'isOuter': self.isOuter,
-            'tempId' : None,
-        }
+        loop_info: Dict[str, Any] = {'isOuter': self.isOuter}
 
         # Add curveInfo if available
         curve_info = self.curveInfo
         if curve_info is not None:
             loop_info.update(curve_info)
 
-        return {**base_info, **loop_info}
+        base_info.update(loop_info)
+        return base_info
 
     @property
     def isOuter(self) -> bool:
@@ -76,41 +79,21 @@ class ProfileLoopExtractor(BaseExtractor):
         Returns:
             dict: A dictionary containing profile curve entities and their tempIds.
         """
-        def process_curve(curve: ProfileCurve) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
-            """
-            Process a single profile curve to extract its information and ensure it has a tempId.
-
-            Args:
-                curve (adsk.fusion.ProfileCurve) : The profile curve to be processed.
-
-            Returns:
-                Tuple[Optional[str], Optional[Dict[str, Any]]]: A tuple containing the tempId and a dictionary of the curve's information.
-            """
-            info: Optional[Dict[str, Any]] = ProfileCurveExtractor(curve).extract_info()
-            if info is None:
-                return None, None
-
-            if info['tempId'] is None:
-                tempId: str = str(uuid.uuid4())
-                info['tempId'] = tempId
-            else:
-                tempId = info['tempId']
-            # TODO filter before load impact on speed
-            # info = {k: v for k, v in info.items() if v is not None} 
-            return tempId, info
-
         try:
-            profileCurves: List[str] = []
-            profileCurveEntities: List[Dict[str, Any]] = []
-            curves = getattr(self._obj, 'profileCurves', [])
-    
+            curves = materialise(getattr(self._obj, 'profileCurves', None))
+            curve_count: int = len(curves)
+            profileCurves: List[str] = [None] * curve_count
+            profileCurveEntities: List[Dict[str, Any]] = [None] * curve_count
+
             if not curves:
                 self.logger.info(f"No profileCurves found for ProfileLoop with entityToken: {self._obj.entityToken}")
 
-            processed_curves = map(process_curve, curves)
-            for tempId, info in processed_curves:
-                profileCurves.append(tempId)
-                profileCurveEntities.append(info)
+            # Extraction may run on worker threads; tempIds are assigned
+            # here so they follow curve order
+            processed_curves = ProfileCurveExtractor.extract_many(curves)
+            for index, info in enumerate(processed_curves):
+                profileCurves[index], profileCurveEntities[index] = \
+                    assign_temp_id(info)
 
             return {
                 'profileCurveEntities' : profileCurveEntities,
@@ -6,17 +6,28 @@ This module provides an extractor class for extracting information from SketchAr
 Classes:
     - SketchArcExtractor: Extractor for SketchArc objects.
 """
-from typing import Optional, Dict, Any
-from adsk.fusion import SketchArc
+from typing import TYPE_CHECKING, Optional, Dict, Any
+if TYPE_CHECKING:
+    from adsk.fusion import SketchArc
 from .sketch_curve_extractor import SketchCurveExtractor
-from ...utils.extraction_utils import nested_getattr
+from ...utils.extraction_utils import AttributeBatch, nested_getattr
 
 __all__ = ['SketchArcExtractor']
 
 class SketchArcExtractor(SketchCurveExtractor):
     """Extractor for extracting detailed information from SketchArc objects."""
+
+    __slots__ = ()
+
+    # Attributes read by extract_info, resolved in a single batched lookup
+    _INFO_ATTRIBUTES = AttributeBatch(
+        'centerSketchPoint.entityToken',
+        'geometry.radius',
+        'startSketchPoint.entityToken',
+        'endSketchPoint.entityToken',
+    )
     
-    def __init__(self, obj: SketchArc) -> None:
+    def __init__(self, obj: 'SketchArc') -> None:
         """Initialize the extractor with the SketchArc element."""
         super().__init__(obj)
     
@@ -27,42 +38,32 @@ class SketchArcExtractor(SketchCurveExtractor):
             dict: A dictionary containing the extracted information.
         """
         basic_info = super().extract_info()
+        center_point, radius, start_point, end_point = self._INFO_ATTRIBUTES(self._obj)
         arc_info = {
-            'centerPoint': self.centerSketchPoint,
-            'radius': self.radius,
-            'startPoint': self.startSketchPoint,
-            'endPoint': self.endSketchPoint,
+            'centerPoint': center_point,
+            'radius': radius,
+            'startPoint': start_point,
+            'endPoint': end_point,
         }
-        return {**basic_info, **arc_info}
+        basic_info.update(arc_info)
+        return basic_info
 
     @property
     def centerSketchPoint(self):
         """Extract the center sketch point entity token."""
-        try:
-            return nested_getattr(self._obj, 'centerSketchPoint.entityToken', None)
-        except AttributeError:
-            return None 
+        return nested_getattr(self._obj, 'centerSketchPoint.entityToken', None)
 
     @property
     def radius(self) -> Optional[float]:
         """Extract the radius of the sketch arc."""
-        try:
-            return self._obj.geometry.radius
-        except AttributeError:
-            return None
+        return nested_getattr(self._obj, 'geometry.radius', None)
     
     @property
     def startSketchPoint(self):
         """Extract the starting sketch point entity token."""
-        try:
-            return nested_getattr(self._obj, 'startSketchPoint.entityToken', None)
-        except AttributeError:
-            return None 
+        return nested_getattr(self._obj, 'startSketchPoint.entityToken', None)
 
     @property
     def endSketchPoint(self):
         """Extract the ending sketch point entity token."""
-        try:
-            return nested_getattr(self._obj, 'endSketchPoint.entityToken', None)
-        except AttributeError:
-            return None
\ No newline at end of file
+        return nested_getattr(self._obj, 'endSketchPoint.entityToken', None)
\ No newline at end of file
@@ -6,17 +6,26 @@ This module provides an extractor class for extracting information from SketchCi
 Classes:
     - SketchCircleExtractor: Extractor for SketchCircle objects.
 """
-from typing import Optional, Dict, Any
-from adsk.fusion import SketchCircle
+from typing import TYPE_CHECKING, Optional, Dict, Any
+if TYPE_CHECKING:
+    from adsk.fusion import SketchCircle
 from .sketch_curve_extractor import SketchCurveExtractor
-from ...utils.extraction_utils import nested_getattr
+from ...utils.extraction_utils import AttributeBatch, nested_getattr
 
 __all__ = ['SketchCircleExtractor']
 
 class SketchCircleExtractor(SketchCurveExtractor):
     """Extractor for extracting detailed information from SketchCircle objects."""
+
+    __slots__ = ()
+
+    # Attributes read by extract_info, resolved in a single batched lookup
+    _INFO_ATTRIBUTES = AttributeBatch(
+        'centerSketchPoint.entityToken',
+        'geometry.radius',
+    )
     
-    def __init__(self, obj: SketchCircle) -> None:
+    def __init__(self, obj: 'SketchCircle') -> None:
         """Initialize the extractor with the SketchCircle element."""
         super().__init__(obj)
     
@@ -27,24 +36,20 @@ class SketchCircleExtractor(SketchCurveExtractor):
             dict: A dictionary containing the extracted information.
         """
         basic_info = super().extract_info()
+        center_point, radius = self._INFO_ATTRIBUTES(self._obj)
         circle_info = {
-            'centerPoint': self.centerSketchPoint,
-            'radius': self.radius,
+            'centerPoint': center_point,
+            'radius': radius,
         }
-        return {**basic_info, **circle_info}
+        basic_info.update(circle_info)
+        return basic_info
 
     @property
     def centerSketchPoint(self) -> Optional[str]:
         """Extract the center sketch point entity token."""
-        try:
-            return nested_getattr(self._obj, 'centerSketchPoint.entityToken', None)
-        except AttributeError:
-            return None 
+        return nested_getattr(self._obj, 'centerSketchPoint.entityToken', None)
 
     @property
     def radius(self) -> Optional[float]:
         """Extract the radius of the sketch circle."""
-        try:
-            return nested_getattr(self._obj, "geometry.radius", None)
-        except AttributeError:
-            return None
\ No newline at end of file
+        return nested_getattr(self._obj, "geometry.radius", None)
\ No newline at end of file
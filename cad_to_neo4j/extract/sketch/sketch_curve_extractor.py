@@ -6,8 +6,9 @@ This module provides an extractor class for extracting information from SketchCu
 Classes:
     - SketchCurveExtractor: Extractor for SketchCurve objects.
 """
-from typing import Dict, Any
-from adsk.fusion import SketchCurve
+from typing import TYPE_CHECKING, Dict, Any
+if TYPE_CHECKING:
+    from adsk.fusion import SketchCurve
 from ..base_extractor import BaseExtractor
 from .sketch_entity_extractor import SketchEntityExtractor
 
@@ -15,8 +16,10 @@ __all__ = ['SketchCurveExtractor']
 
 class SketchCurveExtractor(SketchEntityExtractor):
     """Extractor for extracting detailed information from SketchCurve objects."""
-    
-    def __init__(self, obj: SketchCurve) -> None:
+
+    __slots__ = ()
+
+    def __init__(self, obj: 'SketchCurve') -> None:
         """Initialize the extractor with the SketchCurve element."""
         super().__init__(obj)
     
@@ -29,4 +32,5 @@ class SketchCurveExtractor(SketchEntityExtractor):
         basic_info = super().extract_info()
         curve_info = {
         }
-        return {**basic_info, **curve_info}
+        basic_info.update(curve_info)
+        return basic_info
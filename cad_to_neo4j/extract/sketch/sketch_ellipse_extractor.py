@@ -7,18 +7,27 @@ Classes:
     - SketchEllipseExtractor: Extractor for SketchEllipse objects.
 """
 
-from typing import Optional, Dict, Any
-from adsk.core import Vector3D, Ellipse3D
-from adsk.fusion import SketchEllipse
+from typing import TYPE_CHECKING, Optional, Dict, Any
+if TYPE_CHECKING:
+    from adsk.fusion import SketchEllipse
 from .sketch_entity_extractor import SketchEntityExtractor
-from ...utils.extraction_utils import nested_getattr
+from ...utils.extraction_utils import AttributeBatch, nested_getattr
 
 __all__ = ['SketchEllipseExtractor']
 
 class SketchEllipseExtractor(SketchEntityExtractor):
     """Extractor for extracting detailed information from SketchEllipse objects."""
+
+    __slots__ = ()
+
+    # Attributes read by extract_info, resolved in a single batched lookup
+    _INFO_ATTRIBUTES = AttributeBatch(
+        'centerSketchPoint.entityToken',
+        'majorAxisRadius',
+        'minorAxisRadius',
+    )
     
-    def __init__(self, obj: SketchEllipse) -> None:
+    def __init__(self, obj: 'SketchEllipse') -> None:
         """Initialize the extractor with the SketchEllipse element."""
         super().__init__(obj)
     
@@ -29,37 +38,30 @@ class SketchEllipseExtractor(SketchEntityExtractor):
             dict: A dictionary containing the extracted information.
         """
         basic_info = super().extract_info()
+        center_point, major_axis_radius, minor_axis_radius = self._INFO_ATTRIBUTES(self._obj)
         ellipse_info = {
-            'centerPoint': self.centerSketchPoint,
-            'majorAxisRadius': self.majorAxisRadius,
-            'minorAxisRadius': self.minorAxisRadius,
+            'centerPoint': center_point,
+            'majorAxisRadius': major_axis_radius,
+            'minorAxisRadius': minor_axis_radius,
         }
-        return {**basic_info, **ellipse_info}
+        basic_info.update(ellipse_info)
+        return basic_info
 
     @property
     def centerSketchPoint(self) -> Optional[str]:
         """Extract the center sketch point entity token."""
-        try:
-            return nested_getattr(self._obj, 'centerSketchPoint.entityToken', None)
-        except AttributeError:
-            return None 
+        return nested_getattr(self._obj, 'centerSketchPoint.entityToken', None)
 
 
     @property
     def majorAxisRadius(self) -> Optional[float]:
         """Extract the major axis radius of the ellipse."""
-        try:
-            return nested_getattr(self._obj, "majorAxisRadius", None)
-        except AttributeError:
-            return None
+        return nested_getattr(self._obj, "majorAxisRadius", None)
 
     @property
     def minorAxisRadius(self) -> Optional[float]:
         """Extract the minor axis radius of the ellipse."""
-        try:
-            return nested_getattr(self._obj, "minorAxisRadius", None)
-        except AttributeError:
-            return None
+        return nested_getattr(self._obj, "minorAxisRadius", None)
 
     # @property
     # def geometry(self) -> Optional[Ellipse3D]:
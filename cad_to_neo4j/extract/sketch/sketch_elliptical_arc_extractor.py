@@ -7,18 +7,29 @@ Classes:
     - SketchEllipticalArcExtractor: Extractor for SketchEllipticalArc objects.
 """
 
-from typing import Optional, Dict, Any
-from adsk.core import Vector3D, EllipticalArc3D
-from adsk.fusion import SketchEllipticalArc
+from typing import TYPE_CHECKING, Optional, Dict, Any
+if TYPE_CHECKING:
+    from adsk.fusion import SketchEllipticalArc
 from .sketch_entity_extractor import SketchEntityExtractor
-from ...utils.extraction_utils import nested_getattr
+from ...utils.extraction_utils import AttributeBatch, nested_getattr
 
 __all__ = ['SketchEllipticalArcExtractor']
 
 class SketchEllipticalArcExtractor(SketchEntityExtractor):
     """Extractor for extracting detailed information from SketchEllipticalArc objects."""
+
+    __slots__ = ()
+
+    # Attributes read by extract_info, resolved in a single batched lookup
+    _INFO_ATTRIBUTES = AttributeBatch(
+        'centerSketchPoint.entityToken',
+        'startSketchPoint.entityToken',
+        'endSketchPoint.entityToken',
+        'majorAxisRadius',
+        'minorAxisRadius',
+    )
     
-    def __init__(self, obj: SketchEllipticalArc) -> None:
+    def __init__(self, obj: 'SketchEllipticalArc') -> None:
         """Initialize the extractor with the SketchEllipticalArc element."""
         super().__init__(obj)
 
@@ -29,54 +40,41 @@ class SketchEllipticalArcExtractor(SketchEntityExtractor):
             dict: A dictionary containing the extracted information.
         """
         basic_info = super().extract_info()
+        center_point, start_point, end_point, major_axis_radius, minor_axis_radius = self._INFO_ATTRIBUTES(self._obj)
         elliptical_arc_info = {
-            'centerPoint': self.centerSketchPoint,
-            'startPoint': self.startSketchPoint,
-            'endPoint': self.endSketchPoint,
-            'majorAxisRadius': self.majorAxisRadius,
-            'minorAxisRadius': self.minorAxisRadius,
+            'centerPoint': center_point,
+            'startPoint': start_point,
+            'endPoint': end_point,
+            'majorAxisRadius': major_axis_radius,
+            'minorAxisRadius': minor_axis_radius,
         }
-        return {**basic_info, **elliptical_arc_info}
+        basic_info.update(elliptical_arc_info)
+        return basic_info
 
     @property
     def centerSketchPoint(self) -> Optional[str]:
         """Extract the center sketch point entity token."""
-        try:
-            return nested_getattr(self._obj, 'centerSketchPoint.entityToken', None)
-        except AttributeError:
-            return None 
+        return nested_getattr(self._obj, 'centerSketchPoint.entityToken', None)
 
     @property
     def startSketchPoint(self) -> Optional[str]:
         """Extract the start sketch point entity token."""
-        try:
-            return nested_getattr(self._obj, 'startSketchPoint.entityToken', None)
-        except AttributeError:
-            return None
+        return nested_getattr(self._obj, 'startSketchPoint.entityToken', None)
     
     @property
     def endSketchPoint(self) -> Optional[str]:
         """Extract the end sketch point entity token."""
-        try:
-            return nested_getattr(self._obj, 'endSketchPoint.entityToken', None)
-        except AttributeError:
-            return None
+        return nested_getattr(self._obj, 'endSketchPoint.entityToken', None)
     
     @property
     def majorAxisRadius(self) -> Optional[float]:
         """Extract the major axis radius of the elliptical arc."""
-        try:
-            return nested_getattr(self._obj, "majorAxisRadius", None)
-        except AttributeError:
-            return None
+        return nested_getattr(self._obj, "majorAxisRadius", None)
 
     @property
     def minorAxisRadius(self) -> Optional[float]:
         """Extract the minor axis radius of the elliptical arc."""
-        try:
-            return nested_getattr(self._obj, "minorAxisRadius", None)
-        except AttributeError:
-            return None
+        return nested_getattr(self._obj, "minorAxisRadius", None)
 
     # @property
     # def majorAxis(self) -> Optional[Vector3D]:
@@ -13,7 +13,7 @@ from typing import Optional, List, Dict, Any
 import adsk.fusion
 
 from ..base_extractor import BaseExtractor
-from ...utils.extraction_utils import nested_getattr
+from ...utils.extraction_utils import collection_tokens, nested_getattr
 from ...utils.extraction_utils import helper_extraction_error
 
 
@@ -23,6 +23,8 @@ __all__ = ['SketchEntityExtractor']
 class SketchEntityExtractor(BaseExtractor):
     """Parent Class for other Sketch Entities"""
 
+    __slots__ = ('_is_reference',)
+
     def __init__(self, obj: adsk.fusion.SketchEntity):
         """Initialize the extractor with the Sketch Entities."""
         super().__init__(obj)
@@ -47,7 +49,8 @@ class SketchEntityExtractor(BaseExtractor):
             'isLinked': self.is_linked,
             'parentSketch': self.parent_sketch,
         }
-        return {**basic_info, **sketch_entity_info}
+        basic_info.update(sketch_entity_info)
+        return basic_info
 
     @property
     @helper_extraction_error
@@ -58,8 +61,7 @@ class SketchEntityExtractor(BaseExtractor):
             Optional[List[SketchDimension]]: List of Sketch dimensions that
             are attached to this object.
         """
-        sketchDimensions = getattr(self._obj, 'sketchDimensions', [])
-        return [getattr(dim, 'entityToken', None) for dim in sketchDimensions]
+        return collection_tokens(getattr(self._obj, 'sketchDimensions', None))
 
     @property
     @helper_extraction_error
@@ -70,10 +72,8 @@ class SketchEntityExtractor(BaseExtractor):
             Optional[List[str]]: List of entity tokens for geometric
             constraints that are attached to this object.
         """
-        geometric_constraints = getattr(
-            self._obj, 'geometricConstraints', [])
-        return [nested_getattr(gc, 'entityToken', None)
-                for gc in geometric_constraints]
+        return collection_tokens(
+            getattr(self._obj, 'geometricConstraints', None))
 
     @property
     @helper_extraction_error
@@ -91,11 +91,18 @@ class SketchEntityExtractor(BaseExtractor):
     def is_reference(self) -> Optional[bool]:
         """Indicates if this geometry is a reference.
 
+        The value is cached in the ``_is_reference`` slot because
+        referenced_entity also depends on it.
+
         Returns:
             Optional[bool]: True if the geometry is a reference,
                 False otherwise.
         """
-        return getattr(self._obj, 'isReference', None)
+        try:
+            return self._is_reference
+        except AttributeError:
+            self._is_reference = getattr(self._obj, 'isReference', None)
+            return self._is_reference
 
     @property
     @helper_extraction_error
@@ -170,4 +177,5 @@ class SketchEntityExtractor(BaseExtractor):
         """
         Returns the parent sketch.
         """
-        return nested_getattr(self._obj, 'parentSketch.entityToken', None)
+        parent_sketch = getattr(self._obj, 'parentSketch', None)
+        return getattr(parent_sketch, 'entityToken', None)
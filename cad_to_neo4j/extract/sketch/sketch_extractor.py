@@ -12,16 +12,24 @@ from typing import Optional, Dict, List, Any
 import adsk.core
 import adsk.fusion
 
-from ...utils.extraction_utils import nested_getattr
+from ...utils.extraction_utils import nested_getattr, point_to_list
 from ...utils.extraction_utils import helper_extraction_error
 from .sketch_entity_extractor import SketchEntityExtractor
 
 __all__ = ['SketchExtractor']
 
+# Health states for which errorOrWarningMessage is not worth fetching
+_HEALTHY_STATES = (
+    None,
+    adsk.fusion.FeatureHealthStates.HealthyFeatureHealthState,
+)
+
 
 class SketchExtractor(SketchEntityExtractor):
     """Extractor for extracting detailed information from Sketch objects."""
 
+    __slots__ = ()
+
     def __init__(self, obj: adsk.fusion.Sketch):
         """Initialize the extractor with the Sketch object."""
         super().__init__(obj)
@@ -32,23 +40,27 @@ class SketchExtractor(SketchEntityExtractor):
         Returns:
             dict: A dictionary containing the extracted information.
         """
+        # name, timelineIndex, isVisible and isFullyConstrained have already
+        # been read by the base extractors, so they are not fetched again
         basic_info = super().extract_info()
+        health_state = self.health_state
+        # Healthy sketches, by far the common case, carry no message
+        error_or_warning_message: Optional[str] = None
+        if health_state not in _HEALTHY_STATES:
+            error_or_warning_message = self.error_or_warning_message
         sketch_info = {
-            'timelineIndex': self.timeline_index,
             'reference_plane_entity_token': self.reference_plane_entity_token,
-            'name': self.name,
             'isParametric': self.is_parametric,
-            'isVisible': self.is_visible,
             'are_dimensions_shown': self.are_dimensions_shown,
             'are_profiles_shown': self.are_profiles_shown,
             'origin': self.origin,
             'x_direction': self.x_direction,
             'y_direction': self.y_direction,
             'origin_point': self.origin_point,
-            'is_fully_constrained': self.is_fully_constrained,
+            'is_fully_constrained': basic_info.get('isFullyConstrained'),
             'base_or_form_feature': self.base_or_form_feature,
-            'healthState': self.health_state,
-            'errorOrWarningMessage': self.error_or_warning_message,
+            'healthState': health_state,
+            'errorOrWarningMessage': error_or_warning_message,
             'parentComponent': self.parent_component,
             # 'transform': self.transform, # AttributeError: 'Matrix3D' object
             # has no attribute 'getAsArray'
@@ -59,7 +71,9 @@ class SketchExtractor(SketchEntityExtractor):
         if bbbox is not None:
             sketch_info.update(bbbox)
 
-        return {**basic_info, **sketch_info}
+        basic_info.update(sketch_info)
+
+        return basic_info
 
     @property
     @helper_extraction_error
@@ -70,7 +84,8 @@ class SketchExtractor(SketchEntityExtractor):
             int: The timeline index of the Sketch object, or None if not
                 available.
         """
-        return nested_getattr(self._obj, 'timelineObject.index', None)
+        timeline_object = getattr(self._obj, 'timelineObject', None)
+        return getattr(timeline_object, 'index', None)
 
     @property
     @helper_extraction_error
@@ -87,9 +102,8 @@ class SketchExtractor(SketchEntityExtractor):
             Optional[str]: The entity token of the reference plane, or None if
                 not available.
         """
-        if hasattr(self._obj, 'referencePlane'):
-            return nested_getattr(
-                self._obj, 'referencePlane.entityToken', None)
+        reference_plane = getattr(self._obj, 'referencePlane', None)
+        return getattr(reference_plane, 'entityToken', None)
 
     @property
     @helper_extraction_error
@@ -101,24 +115,8 @@ class SketchExtractor(SketchEntityExtractor):
         """
         transform = nested_getattr(self._obj, 'transform', None)
         if transform:
-            return [
-                transform.asArray()[0],   # 'm11'
-                transform.asArray()[1],   # 'm12'
-                transform.asArray()[2],   # 'm13'
-                transform.asArray()[3],   # 'm14'
-                transform.asArray()[4],   # 'm21'
-                transform.asArray()[5],   # 'm22'
-                transform.asArray()[6],   # 'm23'
-                transform.asArray()[7],   # 'm24'
-                transform.asArray()[8],   # 'm31'
-                transform.asArray()[9],   # 'm32'
-                transform.asArray()[10],  # 'm33'
-                transform.asArray()[11],  # 'm34'
-                transform.asArray()[12],  # 'm41'
-                transform.asArray()[13],  # 'm42'
-                transform.asArray()[14],  # 'm43'
-                transform.asArray()[15],  # 'm44'
-            ]
+            # Row-major m11..m44, fetched with a single API call
+            return list(transform.asArray())
         return None
 
     @property
@@ -171,11 +169,7 @@ class SketchExtractor(SketchEntityExtractor):
         """
         origin = nested_getattr(self._obj, 'origin', None)
         if origin:
-            return [
-                origin.x,  # 'x'
-                origin.y,  # 'y'
-                origin.z,  # 'z'
-            ]
+            return point_to_list(origin)
         return None
 
     @property
@@ -188,11 +182,7 @@ class SketchExtractor(SketchEntityExtractor):
         """
         x_direction = nested_getattr(self._obj, 'xDirection', None)
         if x_direction:
-            return [
-                x_direction.x,  # 'x'
-                x_direction.y,  # 'y'
-                x_direction.z,  # 'z'
-            ]
+            return point_to_list(x_direction)
         return None
 
     @property
@@ -205,11 +195,7 @@ class SketchExtractor(SketchEntityExtractor):
         """
         y_direction = nested_getattr(self._obj, 'yDirection', None)
         if y_direction:
-            return [
-                y_direction.x,  # 'x'
-                y_direction.y,  # 'y'
-                y_direction.z,  # 'z'
-            ]
+            return point_to_list(y_direction)
         return None
 
     @property
@@ -223,10 +209,8 @@ class SketchExtractor(SketchEntityExtractor):
         bbox = getattr(self._obj, 'boundingBox', None)
         if bbox:
             return {
-                'bbMinPoint':
-                    [bbox.minPoint.x, bbox.minPoint.y, bbox.minPoint.z],
-                'bbMaxPoint':
-                    [bbox.maxPoint.x, bbox.maxPoint.y, bbox.maxPoint.z]
+                'bbMinPoint': point_to_list(bbox.minPoint),
+                'bbMaxPoint': point_to_list(bbox.maxPoint)
             }
         return None
 
@@ -238,7 +222,8 @@ class SketchExtractor(SketchEntityExtractor):
         Returns:
             str: The origin point of the Sketch object.
         """
-        return nested_getattr(self._obj, 'originPoint.entityToken', None)
+        origin_point = getattr(self._obj, 'originPoint', None)
+        return getattr(origin_point, 'entityToken', None)
 
     @property
     @helper_extraction_error
@@ -258,7 +243,8 @@ class SketchExtractor(SketchEntityExtractor):
         Returns:
             str: The base or form feature of the Sketch object.
         """
-        return nested_getattr(self._obj, 'baseOrFormFeature.entityToken', None)
+        base_or_form_feature = getattr(self._obj, 'baseOrFormFeature', None)
+        return getattr(base_or_form_feature, 'entityToken', None)
 
     @property
     @helper_extraction_error
@@ -286,4 +272,5 @@ class SketchExtractor(SketchEntityExtractor):
         """
         Returns the parent component.
         """
-        return nested_getattr(self._obj, 'parentComponent.entityToken', None)
+        parent_component = getattr(self._obj, 'parentComponent', None)
+        return getattr(parent_component, 'entityToken', None)
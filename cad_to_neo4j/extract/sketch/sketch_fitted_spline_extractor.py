@@ -7,18 +7,27 @@ Classes:
     - SketchFittedSplineExtractor: Extractor for SketchFittedSpline objects.
 """
 
-from typing import Optional, Dict, Any, List
-from adsk.core import NurbsCurve3D
-from adsk.fusion import SketchFittedSpline
+from typing import TYPE_CHECKING, Optional, Dict, Any, List
+if TYPE_CHECKING:
+    from adsk.fusion import SketchFittedSpline
 from .sketch_entity_extractor import SketchEntityExtractor
-from ...utils.extraction_utils import nested_getattr
+from ...utils.extraction_utils import AttributeBatch, collection_tokens
 
 __all__ = ['SketchFittedSplineExtractor']
 
 class SketchFittedSplineExtractor(SketchEntityExtractor):
     """Extractor for extracting detailed information from SketchFittedSpline objects."""
-    
-    def __init__(self, obj: SketchFittedSpline) -> None:
+
+    __slots__ = ()
+
+    # Attributes read by extract_info, resolved in a single batched lookup
+    _INFO_ATTRIBUTES = AttributeBatch(
+        'startSketchPoint.entityToken',
+        'endSketchPoint.entityToken',
+        'isClosed',
+    )
+
+    def __init__(self, obj: 'SketchFittedSpline') -> None:
         """Initialize the extractor with the SketchFittedSpline element."""
         super().__init__(obj)
     
@@ -29,46 +38,37 @@ class SketchFittedSplineExtractor(SketchEntityExtractor):
             dict: A dictionary containing the extracted information.
         """
         basic_info = super().extract_info()
+        start_point, end_point, is_closed = self._INFO_ATTRIBUTES(self._obj)
         spline_info = {
-            'startPoint': self.startSketchPoint,
-            'endPoint': self.endSketchPoint,
+            'startPoint': start_point,
+            'endPoint': end_point,
             'fitPoints': self.fitPoints,
-            'isClosed': self.isClosed,
+            'isClosed': is_closed,
         }
-        return {**basic_info, **spline_info}
+        basic_info.update(spline_info)
+        return basic_info
 
     @property
     def startSketchPoint(self) -> Optional[str]:
         """Extract the start sketch point entity token."""
-        try:
-            return nested_getattr(self._obj, 'startSketchPoint.entityToken', None)
-        except AttributeError:
-            return None
+        start_sketch_point = getattr(self._obj, 'startSketchPoint', None)
+        return getattr(start_sketch_point, 'entityToken', None)
 
     @property
     def endSketchPoint(self) -> Optional[str]:
         """Extract the end sketch point entity token."""
-        try:
-            return nested_getattr(self._obj, 'endSketchPoint.entityToken', None)
-        except AttributeError:
-            return None
+        end_sketch_point = getattr(self._obj, 'endSketchPoint', None)
+        return getattr(end_sketch_point, 'entityToken', None)
 
     @property
     def fitPoints(self) -> Optional[List[str]]:
         """Extract the fit points entity tokens."""
-        try:
-            fit_points = getattr(self._obj, 'fitPoints', [])
-            return [nested_getattr(point, 'entityToken', None) for point in fit_points]
-        except AttributeError:
-            return None
+        return collection_tokens(getattr(self._obj, 'fitPoints', None))
 
     @property
     def isClosed(self) -> Optional[bool]:
         """Extract the closed status of the spline."""
-        try:
-            return getattr(self._obj, 'isClosed', None)
-        except AttributeError:
-            return None
+        return getattr(self._obj, 'isClosed', None)
     
     # @property
     # def geometry(self) -> Optional[NurbsCurve3D]:
@@ -7,18 +7,30 @@ Classes:
     - SketchFixedSplineExtractor: Extractor for SketchFixedSpline objects.
 """
 
-from typing import Optional, Dict, Any
-from adsk.core import NurbsCurve3D, CurveEvaluator3D
-from adsk.fusion import SketchFixedSpline
+from typing import TYPE_CHECKING, Optional, Dict, Any
+if TYPE_CHECKING:
+    from adsk.core import NurbsCurve3D, CurveEvaluator3D
+    from adsk.fusion import SketchFixedSpline
 from .sketch_entity_extractor import SketchEntityExtractor
-from ...utils.extraction_utils import nested_getattr
+from ...utils.extraction_utils import AttributeBatch, nested_getattr
 
 __all__ = ['SketchFixedSplineExtractor']
 
 class SketchFixedSplineExtractor(SketchEntityExtractor):
     """Extractor for extracting detailed information from SketchFixedSpline objects."""
-    
-    def __init__(self, obj: SketchFixedSpline) -> None:
+
+    __slots__ = ()
+
+    # Attributes read by extract_info, resolved in a single batched lookup
+    _INFO_ATTRIBUTES = AttributeBatch(
+        'startSketchPoint.entityToken',
+        'endSketchPoint.entityToken',
+        'geometry',
+        'worldGeometry',
+        'evaluator',
+    )
+
+    def __init__(self, obj: 'SketchFixedSpline') -> None:
         """Initialize the extractor with the SketchFixedSpline element."""
         super().__init__(obj)
     
@@ -29,51 +41,41 @@ class SketchFixedSplineExtractor(SketchEntityExtractor):
             dict: A dictionary containing the extracted information.
         """
         basic_info = super().extract_info()
+        start_point, end_point, geometry, world_geometry, evaluator = \
+            self._INFO_ATTRIBUTES(self._obj)
         fixed_spline_info = {
-            'startPoint': self.startSketchPoint,
-            'endPoint': self.endSketchPoint,
-            'geometry': self.geometry,
-            'worldGeometry': self.worldGeometry,
-            'evaluator': self.evaluator,
+            'startPoint': start_point,
+            'endPoint': end_point,
+            'geometry': geometry,
+            'worldGeometry': world_geometry,
+            'evaluator': evaluator,
         }
-        return {**basic_info, **fixed_spline_info}
+        basic_info.update(fixed_spline_info)
+        return basic_info
 
     @property
     def startSketchPoint(self) -> Optional[str]:
         """Extract the start sketch point entity token."""
-        try:
-            return nested_getattr(self._obj, 'startSketchPoint.entityToken', None)
-        except AttributeError:
-            return None
+        start_sketch_point = getattr(self._obj, 'startSketchPoint', None)
+        return getattr(start_sketch_point, 'entityToken', None)
 
     @property
     def endSketchPoint(self) -> Optional[str]:
         """Extract the end sketch point entity token."""
-        try:
-            return nested_getattr(self._obj, 'endSketchPoint.entityToken', None)
-        except AttributeError:
-            return None
+        end_sketch_point = getattr(self._obj, 'endSketchPoint', None)
+        return getattr(end_sketch_point, 'entityToken', None)
 
     @property
-    def geometry(self) -> Optional[NurbsCurve3D]:
+    def geometry(self) -> Optional['NurbsCurve3D']:
         """Extract the transient geometry of the fixed spline."""
-        try:
-            return nested_getattr(self._obj, "geometry", None)
-        except AttributeError:
-            return None
+        return nested_getattr(self._obj, "geometry", None)
 
     @property
-    def worldGeometry(self) -> Optional[NurbsCurve3D]:
+    def worldGeometry(self) -> Optional['NurbsCurve3D']:
         """Extract the world geometry of the fixed spline."""
-        try:
-            return nested_getattr(self._obj, "worldGeometry", None)
-        except AttributeError:
-            return None
+        return nested_getattr(self._obj, "worldGeometry", None)
 
     @property
-    def evaluator(self) -> Optional[CurveEvaluator3D]:
+    def evaluator(self) -> Optional['CurveEvaluator3D']:
         """Extract the evaluator for the fixed spline."""
-        try:
-            return nested_getattr(self._obj, "evaluator", None)
-        except AttributeError:
-            return None
\ No newline at end of file
+        return nested_getattr(self._obj, "evaluator", None)
\ No newline at end of file
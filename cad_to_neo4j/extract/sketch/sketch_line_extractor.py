@@ -6,17 +6,26 @@ This module provides an extractor class for extracting information from SketchLi
 Classes:
     - SketchLineExtractor: Extractor for SketchLine objects.
 """
-from typing import Optional, Dict, Any
-from adsk.fusion import SketchLine
+from typing import TYPE_CHECKING, Optional, Dict, Any
+if TYPE_CHECKING:
+    from adsk.fusion import SketchLine
 from .sketch_curve_extractor import SketchCurveExtractor
-from ...utils.extraction_utils import nested_getattr
+from ...utils.extraction_utils import AttributeBatch
 
 __all__ = ['SketchLineExtractor']
 
 class SketchLineExtractor(SketchCurveExtractor):
     """Extractor for extracting detailed information from SketchLine objects."""
-    
-    def __init__(self, obj: SketchLine) -> None:
+
+    __slots__ = ()
+
+    # Attributes read by extract_info, resolved in a single batched lookup
+    _INFO_ATTRIBUTES = AttributeBatch(
+        'startSketchPoint.entityToken',
+        'endSketchPoint.entityToken',
+    )
+
+    def __init__(self, obj: 'SketchLine') -> None:
         """Initialize the extractor with the SketchLine element."""
         super().__init__(obj)
 
@@ -27,24 +36,22 @@ class SketchLineExtractor(SketchCurveExtractor):
             dict: A dictionary containing the extracted information.
         """
         basic_info = super().extract_info()
+        start_point, end_point = self._INFO_ATTRIBUTES(self._obj)
         line_info = {
-            'startPoint': self.startSketchPoint,
-            'endPoint': self.endSketchPoint,
+            'startPoint': start_point,
+            'endPoint': end_point,
         }
-        return {**basic_info, **line_info}
+        basic_info.update(line_info)
+        return basic_info
     
     @property
     def startSketchPoint(self) -> Optional[str]:
         """Extract the starting sketch point entity token."""
-        try:
-            return nested_getattr(self._obj, 'startSketchPoint.entityToken', None)
-        except AttributeError:
-            return None 
+        start_sketch_point = getattr(self._obj, 'startSketchPoint', None)
+        return getattr(start_sketch_point, 'entityToken', None)
 
     @property
     def endSketchPoint(self) -> Optional[str]:
         """Extract the ending sketch point entity token."""
-        try:
-            return nested_getattr(self._obj, 'endSketchPoint.entityToken', None)
-        except AttributeError:
-            return None
\ No newline at end of file
+        end_sketch_point = getattr(self._obj, 'endSketchPoint', None)
+        return getattr(end_sketch_point, 'entityToken', None)
\ No newline at end of file
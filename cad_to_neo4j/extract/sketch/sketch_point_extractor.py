@@ -11,7 +11,7 @@ from typing import Optional, Dict, List, Any
 import adsk.fusion
 
 from .sketch_entity_extractor import SketchEntityExtractor
-from ...utils.extraction_utils import nested_getattr
+from ...utils.extraction_utils import collection_tokens, point_to_list
 from ...utils.extraction_utils import helper_extraction_error
 
 __all__ = ['SketchPointExtractor']
@@ -22,6 +22,8 @@ class SketchPointExtractor(SketchEntityExtractor):
     Extractor for extracting detailed information from Sketch Point objects.
     """
 
+    __slots__ = ()
+
     def __init__(self, obj: adsk.fusion.SketchPoint) -> None:
         """Initialize the extractor with the SketchPoint element."""
         super().__init__(obj)
@@ -36,24 +38,22 @@ class SketchPointExtractor(SketchEntityExtractor):
         point_info = {
             'connectedEntities': self.connected_entities,
         }
-        return {**basic_info, **point_info}
+        basic_info.update(point_info)
+        return basic_info
 
     @property
     @helper_extraction_error
     def coordinates(self) -> Optional[List[float]]:
         """Extract the coordinates of the sketch point."""
-        return nested_getattr(self._obj, "geometry.asArray", None)
+        geometry = getattr(self._obj, 'geometry', None)
+        if geometry is None:
+            return None
+        return point_to_list(geometry)
 
     @property
     @helper_extraction_error
     def connected_entities(self) -> Optional[List[str]]:
         """Extract the entities connected to the sketch point."""
-        connected_entities = getattr(self._obj, 'connectedEntities', [])
-        if connected_entities is None:
-            connected_entities = []
-        entity_tokens = []
-        for e in connected_entities:
-            token = getattr(e, 'entityToken', None)
-            if token is not None:
-                entity_tokens.append(token)
-        return entity_tokens
+        tokens = collection_tokens(
+            getattr(self._obj, 'connectedEntities', None))
+        return [token for token in tokens if token is not None]
@@ -9,13 +9,102 @@ Functions:
     - load_data: Loads extracted data into the Neo4j database.
 """
 
-from ..utils.neo4j_utils import Neo4jTransactionManager
-from typing import Dict, List, Union
+from ..utils.neo4j_utils import (
+    ENTITY_CONSTRAINT_QUERY, ENTITY_LABEL, Neo4jTransactionManager)
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
 import logging
-import traceback
+import re
 
 __all__ = ['Neo4jLoader']
 
+# First Neo4j version supporting CALL { ... } IN CONCURRENT TRANSACTIONS
+CONCURRENT_TRANSACTIONS_VERSION: Tuple[int, int] = (5, 21)
+
+# Labels and relationship types are written into the query text, so only
+# plain identifiers are accepted
+IDENTIFIER_PATTERN = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*$')
+
+# Number of server-side batches sent per query by load_data
+BATCHES_PER_QUERY: int = 10
+
+# Cypher queries are kept as module constants (or built once per label set
+# and cached) so every call sends the identical string and hits the
+# server's query plan cache
+SERVER_VERSION_QUERY = "CALL dbms.components() YIELD versions RETURN versions[0] AS version"
+
+CLEAR_QUERY = """
+MATCH (n) DETACH DELETE n
+"""
+
+CREATE_NODES_TEMPLATE = """
+UNWIND $nodes AS node
+CALL {{
+    WITH node
+    CREATE (n{labels})
+    SET n = node
+}} {transactions_clause}
+"""
+
+CREATE_RELATIONSHIPS_TEMPLATE = """
+UNWIND range(0, size($from_ids) - 1) AS i
+CALL {{
+    WITH i
+    MATCH (a:{entity_label} {{entityToken: $from_ids[i]}}), (b:{entity_label} {{entityToken: $to_ids[i]}})
+    CREATE (a)-[:`{rel_type}`]->(b)
+}} IN TRANSACTIONS OF $batch ROWS
+"""
+
+
+@lru_cache(maxsize=None)
+def _create_nodes_query(labels: Tuple[str, ...], transactions_clause: str) -> str:
+    """Builds the node creation query for a set of (validated) labels.
+
+    Args:
+        labels (tuple): The labels of the nodes.
+        transactions_clause (str): The IN TRANSACTIONS clause to use.
+
+    Returns:
+        str: The Cypher query.
+    """
+    label_expression = ''.join(f':`{label}`' for label in labels)
+    return CREATE_NODES_TEMPLATE.format(labels=label_expression, transactions_clause=transactions_clause)
+
+
+@lru_cache(maxsize=None)
+def _create_relationships_query(rel_type: str) -> str:
+    """Builds the relationship creation query for a (validated) type.
+
+    Args:
+        rel_type (str): The relationship type.
+
+    Returns:
+        str: The Cypher query.
+    """
+    return CREATE_RELATIONSHIPS_TEMPLATE.format(entity_label=ENTITY_LABEL, rel_type=rel_type)
+
+
+def _chunks(rows: Iterable[Dict], size: int) -> Iterator[List[Dict]]:
+    """Splits an iterable into lists of at most `size` rows.
+
+    Args:
+        rows (iterable): The rows to split.
+        size (int): The maximum number of rows per chunk.
+
+    Yields:
+        list: The next chunk of rows.
+    """
+    rows = iter(rows)
+    while True:
+        chunk = list(islice(rows, size))
+        if not chunk:
+            return
+        yield chunk
+
+
 class Neo4jLoader(Neo4jTransactionManager):
     """
     A class to handle loading data into a Neo4j graph database.
@@ -23,14 +112,15 @@ class Neo4jLoader(Neo4jTransactionManager):
     Attributes:
         driver (neo4j.GraphDatabase.driver): The Neo4j driver for database connections.
         _batch_size (int): The size of batches for bulk data loading.
+        _concurrency (int): The number of batches the server may commit concurrently, or None for the server default. On servers without concurrent transactions, the number of client threads writing nodes.
         logger (logging.Logger): The logger for logging messages and errors.
     
     Methods:
-        create_nodes(tx, nodes): Creates multiple nodes in the Neo4j database in a batch.
-        create_relationships(tx, relationships): Creates multiple relationships in the Neo4j database in a batch.
+        create_nodes(nodes): Creates multiple nodes in the Neo4j database in server-side batches.
+        create_relationships(relationships): Creates multiple relationships in the Neo4j database in server-side batches.
         load_data(nodes, relationships=None): Loads extracted data into the Neo4j database.
     """
-    def __init__(self, uri: str, user: str, password: str, logger: logging.Logger = None, max_retries: int = 5, timeout: int = 5):
+    def __init__(self, uri: str, user: str, password: str, logger: logging.Logger = None, max_retries: int = 5, timeout: int = 5, database: str = 'neo4j'):
         """
         Initialises the Neo4jLoader with the provided database credentials.
 
@@ -41,9 +131,13 @@ class Neo4jLoader(Neo4jTransactionManager):
             logger (logging.Logger, optional): The logger for logging messages and errors.
             max_retries (int, optional): The maximum number of retries for connecting to the database. Defaults to 5.
             timeout (int, optional): The timeout in seconds between retries. Defaults to 5.
+            database (str, optional): The database to load into. Defaults to 'neo4j'.
         """
-        super().__init__(uri, user, password, logger, max_retries, timeout)
+        super().__init__(uri, user, password, logger, max_retries, timeout, database)
         self._batch_size: int = 1000  
+        self._concurrency: Optional[int] = None
+        self._server_version: Optional[Tuple[int, ...]] = None
+        self._schema_ready: bool = False
 
     @property
     def batch_size(self):
@@ -58,83 +152,214 @@ class Neo4jLoader(Neo4jTransactionManager):
         else:
             raise ValueError("Batch size must be a positive integer")
 
+    @property
+    def concurrency(self) -> Optional[int]:
+        """Gets the number of node batches the server may commit concurrently."""
+        return self._concurrency
+
+    @concurrency.setter
+    def concurrency(self, value: Optional[int]):
+        """Sets the number of node batches the server may commit concurrently (None for the server default)."""
+        if value is None or value > 0:
+            self._concurrency = value
+        else:
+            raise ValueError("Concurrency must be a positive integer or None")
+
+    @property
+    def server_version(self) -> Tuple[int, ...]:
+        """Gets the version of the connected Neo4j server, queried once per loader."""
+        if self._server_version is None:
+            try:
+                record = self.session.run(SERVER_VERSION_QUERY).single()
+                version = record["version"].split('-')[0]
+                self._server_version = tuple(int(part) for part in version.split('.'))
+            except Exception as e:
+                self.logger.warning(f"Could not determine Neo4j server version: {e}")
+                self._server_version = ()
+        return self._server_version
+
+    @property
+    def supports_concurrent_transactions(self) -> bool:
+        """Whether the server supports CALL { ... } IN CONCURRENT TRANSACTIONS."""
+        return self.server_version >= CONCURRENT_TRANSACTIONS_VERSION
+
+    def _node_transactions_clause(self) -> str:
+        """Builds the IN TRANSACTIONS clause used when creating nodes.
+
+        Node rows are independent, so on servers that support it their
+        batches are committed concurrently.
+
+        Returns:
+            str: The clause following the CALL subquery.
+        """
+        if not self.supports_concurrent_transactions:
+            return "IN TRANSACTIONS OF $batch ROWS"
+        if self._concurrency is None:
+            return "IN CONCURRENT TRANSACTIONS OF $batch ROWS"
+        return f"IN {int(self._concurrency)} CONCURRENT TRANSACTIONS OF $batch ROWS"
+
     def clear(self):
         """Clears all nodes and relationships in the Neo4j database."""
         try:
-            with self.driver.session() as session:
-                query = """
-                MATCH (n) DETACH DELETE n
-                """
-                session.write_transaction(lambda tx: tx.run(query))
-                self.logger.info("Cleared Database")
-        except Exception as e:
-            self.logger.error(f"Failed to clear database:\n{traceback.format_exc()}")
-
-    def create_nodes(self, tx, nodes: List[Dict]):
-        """Creates multiple nodes in the Neo4j database in a batch.
+            self.session.execute_write(lambda tx: tx.run(CLEAR_QUERY).consume())
+            self.logger.info("Cleared Database")
+        except Exception:
+            self.logger.error("Failed to clear database", exc_info=True)
+
+    def _ensure_schema(self):
+        """Creates the entityToken uniqueness constraint, once per loader."""
+        if self._schema_ready:
+            return
+        try:
+            self.session.run(ENTITY_CONSTRAINT_QUERY).consume()
+            self._schema_ready = True
+        except Exception:
+            self.logger.error("Failed to create entityToken constraint", exc_info=True)
+
+    def create_nodes(self, nodes: List[Dict]):
+        """Creates multiple nodes in the Neo4j database.
+
+        Nodes are grouped by type and each group is created with a native
+        CREATE using the type's class names as labels. Each group is sent in
+        a single query and committed server-side in transactions of
+        `batch_size` rows, concurrently on Neo4j 5.21+. On older servers,
+        a `concurrency` above 1 writes the groups from that many client
+        threads instead.
+        `CALL ... IN TRANSACTIONS` is not allowed inside an explicit
+        transaction, so the query is run in an auto-commit transaction.
+
+        The `type` key is removed from each node dictionary, as it is only
+        stored as the node's labels.
 
         Args:
-            tx: The transaction object.
             nodes (list): List of node dictionaries.
         """
-        try:
-            query = """
-            UNWIND $nodes AS node
-            CALL apoc.create.node(node.type, node) YIELD node AS created_node
-            RETURN created_node
-            """
-            tx.run(query, nodes=nodes)
-            self.logger.info(f"Created {len(nodes)} nodes")
-        except Exception as e:
-            if self.logger:
-                self.logger.error(f"Failed:\n{traceback.format_exc()}")
-
-    def create_relationships(self, tx, relationships: List[Dict]):
-        """Creates multiple relationships in the Neo4j database in a batch.
+        groups: Dict[Tuple[str, ...], List[Dict]] = defaultdict(list)
+        for node in nodes:
+            # The type is stored as labels only, not repeated as a property
+            node_type = node.pop('type', None) or ()
+            if isinstance(node_type, str):
+                node_type = (node_type,)
+            groups[tuple(node_type)].append(node)
+
+        transactions_clause = self._node_transactions_clause()
+        items = list(groups.items())
+        workers = min(self._concurrency or 1, len(items))
+        if workers <= 1 or self.supports_concurrent_transactions:
+            self._write_node_groups(self.session, transactions_clause, items)
+            return
+
+        # Without server-side concurrent transactions, the type groups
+        # (which never share nodes) are split across client threads, each
+        # with its own session as sessions are not thread safe
+        def write_bucket(bucket):
+            session = self.open_session()
+            try:
+                self._write_node_groups(session, transactions_clause, bucket)
+            finally:
+                session.close()
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(write_bucket, (items[i::workers] for i in range(workers))))
+
+    def _write_node_groups(self, session, transactions_clause: str, groups: List[Tuple[Tuple[str, ...], List[Dict]]]):
+        """Creates the nodes of each type group on a session.
+
+        Each group is created with a native CREATE carrying its labels, so
+        the labels are checked against IDENTIFIER_PATTERN before they are
+        written into the query.
+
+        Args:
+            session (neo4j.Session): The session to run the queries on.
+            transactions_clause (str): The IN TRANSACTIONS clause to use.
+            groups (list): (type, rows) pairs of nodes grouped by type.
+        """
+        batch_size = self._batch_size
+        log_info = self.logger.isEnabledFor(logging.INFO)
+        for node_type, rows in groups:
+            labels = node_type + (ENTITY_LABEL,)
+            invalid = [label for label in labels if not IDENTIFIER_PATTERN.match(label)]
+            if invalid:
+                self.logger.error(f"Skipping {len(rows)} nodes with invalid labels {invalid!r}")
+                continue
+            try:
+                query = _create_nodes_query(labels, transactions_clause)
+                session.run(query, nodes=rows, batch=batch_size).consume()
+                if log_info:
+                    self.logger.info(f"Created {len(rows)} {':'.join(node_type)} nodes")
+            except Exception:
+                self.logger.error(f"Failed to create {':'.join(node_type)} nodes", exc_info=True)
+
+    def create_relationships(self, relationships: List[Dict]):
+        """Creates multiple relationships in the Neo4j database.
+
+        Relationships are grouped by type and each group is created with a
+        native CREATE, as Cypher does not accept a relationship type as a
+        parameter. Each group is sent in a single query and committed
+        server-side in transactions of `batch_size` rows. These batches are
+        not run concurrently: relationships in different batches share end
+        nodes and would deadlock on their locks.
 
         Args:
-            tx: The transaction object.
             relationships (list): List of relationship dictionaries.
         """
-        try:
-            query = """
-            UNWIND $relationships AS rel
-            MATCH (a {entityToken: rel.from_id}), (b {entityToken: rel.to_id})
-            CALL apoc.create.relationship(a, rel.rel_type, {}, b) YIELD rel as created_rel
-            RETURN created_rel
-            """
-            tx.run(query, relationships=relationships)
-            if self.logger:
-                self.logger.info(f"Created {len(relationships)} relationships")
-        except Exception as e:
-            if self.logger:
-                self.logger.error(f"Failed:\n{traceback.format_exc()}")
+        # Each type's endpoints are sent as two parallel id lists rather
+        # than a list of row maps
+        groups: Dict[str, Tuple[List[str], List[str]]] = defaultdict(lambda: ([], []))
+        for rel in relationships:
+            from_ids, to_ids = groups[rel['rel_type']]
+            from_ids.append(rel['from_id'])
+            to_ids.append(rel['to_id'])
+
+        batch_size = self._batch_size
+        log_info = self.logger.isEnabledFor(logging.INFO)
+        for rel_type, (from_ids, to_ids) in groups.items():
+            if not IDENTIFIER_PATTERN.match(rel_type):
+                self.logger.error(f"Skipping {len(from_ids)} relationships with invalid type {rel_type!r}")
+                continue
+            try:
+                query = _create_relationships_query(rel_type)
+                self.session.run(query, from_ids=from_ids, to_ids=to_ids, batch=batch_size).consume()
+                if log_info:
+                    self.logger.info(f"Created {len(from_ids)} {rel_type} relationships")
+            except Exception:
+                self.logger.error(f"Failed to create {rel_type} relationships", exc_info=True)
         
-    def load_data(self, nodes: Union[Dict, List[Dict]], relationships: List[Dict] = None):
+    def load_data(self, nodes: Union[Dict, Iterable[Dict]], relationships: Iterable[Dict] = None):
         """Loads extracted data into the Neo4j database.
 
+        Nodes and relationships may be any iterable, including generators.
+        They are consumed in chunks of `BATCHES_PER_QUERY * batch_size` rows,
+        so only one chunk is held in memory at a time. Each chunk is sent in
+        a single query and committed server-side in batches (see
+        `create_nodes`).
+
         Args:
-            nodes (list): The extracted node data.
-            relationships (list): The extracted relationship data.
+            nodes (iterable): The extracted node data.
+            relationships (iterable): The extracted relationship data.
         """
         if isinstance(nodes, dict):
             nodes = [nodes]
 
         try:
-            # Create nodes in batches
+            self._ensure_schema()
+            batch_size = self._batch_size
+            chunk_size = BATCHES_PER_QUERY * batch_size
+            log_info = self.logger.isEnabledFor(logging.INFO)
+
             if nodes:
-                for i in range(0, len(nodes), self.batch_size):
-                    self.logger.info(f"Loading batch {i // self.batch_size + 1} with {len(nodes[i:i + self.batch_size])} nodes")
-                    self.session.write_transaction(self.create_nodes, nodes[i:i + self.batch_size])
+                for chunk in _chunks(nodes, chunk_size):
+                    if log_info:
+                        self.logger.info(f"Loading {len(chunk)} nodes in batches of {batch_size}")
+                    self.create_nodes(chunk)
 
-            # Create relationships in batches
             if relationships:
-                for i in range(0, len(relationships), self.batch_size):
-                    self.logger.info(f"Loading batch {i // self.batch_size + 1} with {len(relationships[i:i + self.batch_size])} relationships")
-                    self.session.write_transaction(self.create_relationships, relationships[i:i + self.batch_size])
-        except Exception as e:
-            if self.logger:
-                self.logger.error(f"Failed:\n{traceback.format_exc()}")
+                for chunk in _chunks(relationships, chunk_size):
+                    if log_info:
+                        self.logger.info(f"Loading {len(chunk)} relationships in batches of {batch_size}")
+                    self.create_relationships(chunk)
+        except Exception:
+            self.logger.error("Failed to load data", exc_info=True)
 
 # Usage example
 if __name__ == "__main__":
@@ -18,6 +18,8 @@ class BaseTransformer:
 
     Attributes:
         logger (logging.Logger): The logger for logging messages and errors.
+        _batch_size (int): The number of rows committed per server-side
+            transaction by batched transformations.
 
     Methods:
         __init__(logger): Initialises the transformer with an optional logger.
@@ -33,6 +35,20 @@ class BaseTransformer:
             and errors. Defaults to None.
         """
         self.logger = logger if logger else logging.getLogger(__name__)
+        self._batch_size: int = 1000
+
+    @property
+    def batch_size(self):
+        """Gets the batch size for batched transformations."""
+        return self._batch_size
+
+    @batch_size.setter
+    def batch_size(self, value: int):
+        """Sets the batch size for batched transformations."""
+        if value > 0:
+            self._batch_size = value
+        else:
+            raise ValueError("Batch size must be a positive integer")
 
     def transform(self, execute_query):
         """
@@ -6,8 +6,25 @@ This module provides the transformation logic for BRep relationships.
 Classes:
     - BRepTransformer: A class to handle BRep-based transformations.
 """
+from itertools import combinations
+from typing import List, Set, Tuple
+
 from ..base_transformer import BaseTransformer
 from ....utils.cypher_utils import helper_cypher_error
+from ....utils.neo4j_utils import ENTITY_LABEL
+
+# Maximum number of adjacency pairs sent in a single query
+MAX_PAIRS_PER_QUERY = 10000
+
+CREATE_ADJACENCIES_QUERY = f"""
+    UNWIND $pairs AS pair
+    CALL {{
+        WITH pair
+        MATCH (a:{ENTITY_LABEL} {{entityToken: pair[0]}}),
+              (b:{ENTITY_LABEL} {{entityToken: pair[1]}})
+        MERGE (a)-[:ADJACENT]->(b)
+    }} IN TRANSACTIONS OF $batch ROWS
+    """
 
 
 class BRepTransformer(BaseTransformer):
@@ -157,38 +174,65 @@ class BRepTransformer(BaseTransformer):
         Creates 'ADJACENT' relationships between BRep faces sharing the same
         edge and BRep edges sharing the same vertex.
 
+        The members of each shared entity are fetched once and the pairs are
+        built client-side, so each unordered pair is merged only once
+        however many entities it shares. Adjacency is symmetric, so each
+        pair gets a single relationship, directed from the lower to the
+        higher entityToken. Read it undirected, e.g.
+        MATCH (a)-[:ADJACENT]-(b).
+
         Args:
             execute_query (function): Function to execute a Cypher query.
 
         Returns:
-            list: The result values from the query execution.
+            list: The number of adjacent face pairs and edge pairs.
         """
-        queries = [
-            # Query to create ADJACENT relationships between faces sharing the
-            # same edge
-            """
-            MATCH (e:`BRepEdge`)<-[:CONTAINS]-(f1:`BRepFace`),
-                  (e)<-[:CONTAINS]-(f2:`BRepFace`)
-            WHERE id(f1) <> id(f2)
-            MERGE (f1)-[:ADJACENT]->(f2)
-            MERGE (f2)-[:ADJACENT]->(f1)
-            RETURN f1.entityToken AS face1_id, f2.entityToken AS face2_id
-            """,
-            # Query to create ADJACENT relationships between edges sharing the
-            # ssame vertex
-            """
-            MATCH (v:`BRepVertex`)<-[:CONTAINS]-(e1:`BRepEdge`),
-                  (v)<-[:CONTAINS]-(e2:`BRepEdge`)
-            WHERE id(e1) <> id(e2)
-            MERGE (e1)-[:ADJACENT]->(e2)
-            MERGE (e2)-[:ADJACENT]->(e1)
-            RETURN e1.entityToken AS edge1_id,
-                collect(e2.entityToken) AS adjacent_edge_ids
-            """
+        # (shared entity label, member label) pairs
+        adjacencies = [
+            # Faces sharing the same edge
+            ('BRepEdge', 'BRepFace'),
+            # Edges sharing the same vertex
+            ('BRepVertex', 'BRepEdge'),
         ]
 
         results = []
         self.logger.info('Creating BRep adjacencies')
-        for query in queries:
-            results.extend(execute_query(query))
+        for shared_label, member_label in adjacencies:
+            pairs = self._adjacent_pairs(
+                execute_query, shared_label, member_label)
+            for start in range(0, len(pairs), MAX_PAIRS_PER_QUERY):
+                execute_query(
+                    CREATE_ADJACENCIES_QUERY,
+                    {
+                        'pairs': pairs[start:start + MAX_PAIRS_PER_QUERY],
+                        'batch': self.batch_size,
+                    })
+            results.append(len(pairs))
         return results
+
+    def _adjacent_pairs(
+            self,
+            execute_query,
+            shared_label: str,
+            member_label: str) -> List[List[str]]:
+        """
+        Builds the unique pairs of members contained by the same entity.
+
+        Args:
+            execute_query (function): Function to execute a Cypher query.
+            shared_label (str): The label of the shared entities.
+            member_label (str): The label of the entities containing them.
+
+        Returns:
+            List[List[str]]: [lower, higher] entityToken pairs.
+        """
+        query = f"""
+            MATCH (s:`{shared_label}`)<-[:CONTAINS]-(m:`{member_label}`)
+            WHERE m.entityToken IS NOT NULL
+            WITH s, collect(DISTINCT m.entityToken) AS members
+            RETURN members
+            """
+        pairs: Set[Tuple[str, str]] = set()
+        for (members,) in execute_query(query):
+            pairs.update(combinations(sorted(members), 2))
+        return [list(pair) for pair in pairs]
@@ -55,6 +55,10 @@ class FeatureTransformer(BaseTransformer):
         Creates 'USES_PROFILE' relationships between feature and profiles based
         on the profileTokens list.
 
+        Profiles are looked up through the entityToken constraint on the
+        Entity label, and the (feature, profile) pairs are merged in
+        server-side transactions of `batch_size` rows.
+
         Args:
             execute_query (function): Function to execute a Cypher query.
 
@@ -66,18 +70,22 @@ class FeatureTransformer(BaseTransformer):
             MATCH (f:Feature)
             WHERE f.profileTokens IS NOT NULL
             UNWIND f.profileTokens AS profile_token
-            MATCH (p:Profile)
-            WHERE p.entityToken = profile_token
-            MERGE (f)-[:USES_PROFILE]->(p)
+            CALL {
+                WITH f, profile_token
+                MATCH (p:Entity {entityToken: profile_token})
+                WHERE p:Profile
+                MERGE (f)-[:USES_PROFILE]->(p)
+                RETURN p.entityToken AS profile_id
+            } IN TRANSACTIONS OF $batch ROWS
             RETURN
                 f.entityToken AS feature_id,
-                collect(p.entityToken) AS profile_ids
+                collect(profile_id) AS profile_ids
             """,
             ]
         results = []
         self.logger.info('Creating profile/feature relationships')
         for query in queries:
-            results.extend(execute_query(query))
+            results.extend(execute_query(query, {'batch': self.batch_size}))
         return results
 
     @helper_cypher_error
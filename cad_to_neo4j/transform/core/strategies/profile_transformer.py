@@ -44,11 +44,14 @@ class ProfileTransformer(BaseTransformer):
         """
         Creates relationships between profiles and their loops.
 
+        Loops are matched by label and tempId, and the relationships are
+        merged in server-side transactions of `batch_size` rows.
+
         Args:
             execute_query (function): Function to execute a Cypher query.
 
         Returns:
-            list: The result values from the query execution.
+            list: The number of relationships processed.
         """
         self.logger.info(
             "Creating relationships between profiles and profile loops")
@@ -56,22 +59,28 @@ class ProfileTransformer(BaseTransformer):
             MATCH (p:Profile)
             WHERE p.profileLoops IS NOT NULL
             UNWIND p.profileLoops as profileLoopId
-            MATCH (pl) WHERE pl.tempId = profileLoopId
-            MERGE (p) -[:CONTAINS]->(pl)
-            RETURN pl, p
+            CALL {
+                WITH p, profileLoopId
+                MATCH (pl:ProfileLoop {tempId: profileLoopId})
+                MERGE (p) -[:CONTAINS]->(pl)
+            } IN TRANSACTIONS OF $batch ROWS
+            RETURN count(*) AS relationships
         """
-        return execute_query(query)
+        return execute_query(query, {'batch': self.batch_size})
 
     @helper_cypher_error
     def create_profile_curves_relationships(self, execute_query):
         """
         Creates relationships between profile loops and their curves.
 
+        Curves are matched by label and tempId, and the relationships are
+        merged in server-side transactions of `batch_size` rows.
+
         Args:
             execute_query (function): Function to execute a Cypher query.
 
         Returns:
-            list: The result values from the query execution.
+            list: The number of relationships processed.
         """
         self.logger.info(
             "Creating relationships between profile loops and profile curves")
@@ -79,30 +88,38 @@ class ProfileTransformer(BaseTransformer):
             MATCH (pl:ProfileLoop)
             WHERE pl.profileCurves IS NOT NULL
             UNWIND pl.profileCurves as pc_id
-            MATCH (pc) WHERE pc.tempId = pc_id
-            MERGE (pl) -[:CONTAINS]->(pc)
-            RETURN pl, pc
+            CALL {
+                WITH pl, pc_id
+                MATCH (pc:ProfileCurve {tempId: pc_id})
+                MERGE (pl) -[:CONTAINS]->(pc)
+            } IN TRANSACTIONS OF $batch ROWS
+            RETURN count(*) AS relationships
         """
-        return execute_query(query)
+        return execute_query(query, {'batch': self.batch_size})
 
     @helper_cypher_error
     def link_profile_curves_to_sketch_entities(self, execute_query):
         """
         Links profile curves to their defining sketch entities.
 
+        Sketch entities are looked up through the entityToken constraint on
+        the Entity label, in server-side transactions of `batch_size` rows.
+
         Args:
             execute_query (function): Function to execute a Cypher query.
 
         Returns:
-            list: The result values from the query execution.
+            list: The number of relationships processed.
         """
         self.logger.info("Linking profile curves to sketch entities")
         query = """
             MATCH (sc:ProfileCurve)
             WHERE sc.sketchEntity IS NOT NULL
-            MATCH (se)
-            WHERE se.entityToken = sc.sketchEntity
-            MERGE (sc)-[:DEFINED_BY]->(se)
-            RETURN sc, se
+            CALL {
+                WITH sc
+                MATCH (se:Entity {entityToken: sc.sketchEntity})
+                MERGE (sc)-[:DEFINED_BY]->(se)
+            } IN TRANSACTIONS OF $batch ROWS
+            RETURN count(*) AS relationships
         """
-        return execute_query(query)
+        return execute_query(query, {'batch': self.batch_size})
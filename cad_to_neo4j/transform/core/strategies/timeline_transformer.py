@@ -41,22 +41,29 @@ class TimelineTransformer(BaseTransformer):
         """
         Creates relationships between nodes based on their timeline index.
 
+        Consecutive pairs are merged in server-side transactions of
+        `batch_size` rows, in timeline order, so a long timeline is not
+        written in a single transaction.
+
         Args:
             execute_query (function): Function to execute a Cypher query.
 
         Returns:
-            list: The result values from the query execution.
+            list: The number of timeline pairs processed.
         """
         cypher_query = """
-        MATCH (n)
+        MATCH (n:Entity)
         WHERE n.timelineIndex IS NOT NULL
         WITH n
         ORDER BY n.timelineIndex ASC
         WITH collect(n) AS nodes
         UNWIND range(0, size(nodes) - 2) AS i
-        WITH nodes[i] AS node1, nodes[i + 1] AS node2
-        MERGE (node1)-[:NEXT_ON_TIMELINE]->(node2)
-        RETURN node1, node2
+        CALL {
+            WITH nodes, i
+            WITH nodes[i] AS node1, nodes[i + 1] AS node2
+            MERGE (node1)-[:NEXT_ON_TIMELINE]->(node2)
+        } IN TRANSACTIONS OF $batch ROWS
+        RETURN count(*) AS pairs
         """
         self.logger.info('Creating timeline relationships')
-        return execute_query(cypher_query)
+        return execute_query(cypher_query, {'batch': self.batch_size})
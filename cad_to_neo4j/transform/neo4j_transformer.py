@@ -9,7 +9,8 @@ Classes:
       database.
 """
 
-from ..utils.neo4j_utils import Neo4jTransactionManager
+from ..utils.neo4j_utils import (
+    ENTITY_CONSTRAINT_QUERY, ENTITY_LABEL, Neo4jTransactionManager)
 import logging
 
 from ..utils.cypher_utils import helper_cypher_error
@@ -28,6 +29,24 @@ from .core.strategies import (
 
 __all__ = ['Neo4jTransformerOrchestrator']
 
+# Idempotent schema statements backing the lookups and MERGEs made by the
+# transformation strategies
+SCHEMA_QUERIES = [
+    ENTITY_CONSTRAINT_QUERY,
+    f"""
+    CREATE INDEX entity_timeline_index IF NOT EXISTS
+    FOR (n:{ENTITY_LABEL}) ON (n.timelineIndex)
+    """,
+    """
+    CREATE INDEX profile_loop_temp_id IF NOT EXISTS
+    FOR (n:ProfileLoop) ON (n.tempId)
+    """,
+    """
+    CREATE INDEX profile_curve_temp_id IF NOT EXISTS
+    FOR (n:ProfileCurve) ON (n.tempId)
+    """,
+]
+
 
 class Neo4jTransformerOrchestrator(Neo4jTransactionManager):
     """
@@ -43,6 +62,8 @@ class Neo4jTransformerOrchestrator(Neo4jTransactionManager):
         __init__(uri, user, password, logger): Initialises the transformer
             with database credentials and sub-transformers.
         execute_query(query): Executes a Cypher query on the Neo4j database.
+        ensure_schema(): Creates the constraints and indexes used by the
+            transformations, once per orchestrator.
         execute(): Runs all transformation methods to create relationships in
             the model.
     """
@@ -53,7 +74,8 @@ class Neo4jTransformerOrchestrator(Neo4jTransactionManager):
             password: str,
             logger: logging.Logger = None,
             max_retries: int = 5,
-            timeout: int = 5):
+            timeout: int = 5,
+            database: str = 'neo4j'):
         """
         Initializes the Neo4jTransformer with the provided database
         credentials.
@@ -68,8 +90,11 @@ class Neo4jTransformerOrchestrator(Neo4jTransactionManager):
                 connecting to the database. Defaults to 5.
             timeout (int, optional): The timeout in seconds between retries.
                 Defaults to 5.
+            database (str, optional): The database to transform. Defaults
+                to 'neo4j'.
         """
-        super().__init__(uri, user, password, logger, max_retries, timeout)
+        super().__init__(
+            uri, user, password, logger, max_retries, timeout, database)
         self.transformers = [
             BRepTransformer(self.logger),
             ComponentTransformer(self.logger),
@@ -81,6 +106,29 @@ class Neo4jTransformerOrchestrator(Neo4jTransactionManager):
             ParameterTransformer(self.logger),
             BRepChangeTransformer(self.logger),
         ]
+        self._schema_ready = False
+
+    def ensure_schema(self):
+        """
+        Creates the constraints and indexes used by the transformations.
+
+        Every statement is idempotent and they only run once per
+        orchestrator, so that no lookup or MERGE falls back to a label scan.
+        A failed statement is logged and the transformations still run; it
+        is retried on the next call.
+        """
+        if self._schema_ready:
+            return
+        schema_ready = True
+        for query in SCHEMA_QUERIES:
+            try:
+                self.execute_query(query)
+            except Exception:
+                self.logger.error(
+                    "Failed to create schema index or constraint",
+                    exc_info=True)
+                schema_ready = False
+        self._schema_ready = schema_ready
 
     @helper_cypher_error
     def execute(self):
@@ -92,6 +140,7 @@ class Neo4jTransformerOrchestrator(Neo4jTransactionManager):
         """
         results = {}
         self.logger.info('Running all transformations...')
+        self.ensure_schema()
 
         # Execute timeline transformations
         for t in self.transformers:
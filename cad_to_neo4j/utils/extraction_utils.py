@@ -6,17 +6,66 @@ simplify operations during extraction processes in the project. It includes
 functions for retrieving nested attributes from objects and error handling in
 extraction methods.
 
+Classes:
+--------
+- `AttributeBatch`: Resolves several (nested) attributes in a single call.
+
 Functions and Decorators:
 -------------------------
 - `nested_getattr`: Recursively get nested attributes from an object.
 - `nested_hasattr`: Recursively check if nested attributes exist on an object.
 - `helper_extraction_error`: A decorator to handle errors during extraction.
+- `next_temp_id`: Generates a run-unique temporary id for entities without an
+    entity token.
+- `assign_temp_id`: Ensures an extracted info dict carries a tempId.
+- `materialise`: Copies a Fusion collection into a Python list.
+- `collection_tokens`: Extracts the entity tokens of a Fusion collection.
+- `point_to_list`: Converts a Point3D/Vector3D into an [x, y, z] list.
+- `parallel_map`: Maps an extraction function over a collection, optionally
+    fanning out across threads when `PARALLEL_EXTRACT` is enabled.
 """
-from functools import wraps
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, wraps
+import itertools
+from operator import attrgetter
 import traceback
-from typing import Optional, Any
+import uuid
+from typing import Optional, Any, Dict, List, Tuple
+
+__all__ = [
+    'AttributeBatch',
+    'nested_getattr',
+    'nested_hasattr',
+    'helper_extraction_error',
+    'next_temp_id',
+    'assign_temp_id',
+    'materialise',
+    'collection_tokens',
+    'point_to_list',
+    'parallel_map',
+]
+
+# The Fusion API is only guaranteed to be safe on the main thread, so fanning
+# extraction out across threads is opt-in.
+PARALLEL_EXTRACT: bool = False
+PARALLEL_EXTRACT_WORKERS: int = 4
+# Below this many items the thread pool costs more than it overlaps.
+PARALLEL_EXTRACT_THRESHOLD: int = 16
+
+# Temporary ids only need to be unique within an extraction run, so a single
+# random prefix per process plus a counter avoids a uuid4() per entity.
+_TEMP_ID_PREFIX: str = uuid.uuid4().hex
+_temp_id_counter = itertools.count()
+
+# Sentinel for attribute lookups, so a single getattr replaces the
+# hasattr/getattr pair on every hop of a dotted path.
+_MISSING = object()
 
-__all__ = ['nested_getattr', 'nested_hasattr', 'helper_extraction_error']
+
+@lru_cache(maxsize=None)
+def _split_path(attr: str) -> Tuple[str, ...]:
+    """Split a dotted attribute path once and reuse the result."""
+    return tuple(attr.split('.'))
 
 
 def nested_getattr(
@@ -49,16 +98,59 @@ def nested_getattr(
         value
     """
     try:
-        for key in attr.split('.'):
-            if hasattr(obj, key):
-                obj = getattr(obj, key)
-            else:
+        for key in _split_path(attr):
+            obj = getattr(obj, key, _MISSING)
+            if obj is _MISSING:
                 return default
         return obj
     except AttributeError:
         return default
 
 
+class AttributeBatch(object):
+    """
+    Resolves a fixed set of (nested) attributes from an object in one call.
+
+    The lookups are dispatched through a single `operator.attrgetter`, which
+    walks every dotted path in C. If any path cannot be resolved, each path is
+    resolved individually with `nested_getattr` so the remaining values are
+    still returned and only the missing ones fall back to the default.
+
+    Example:
+        _INFO_ATTRIBUTES = AttributeBatch(
+            'centerSketchPoint.entityToken', 'geometry.radius')
+        center, radius = _INFO_ATTRIBUTES(obj)
+    """
+
+    __slots__ = ('paths', '_getter')
+
+    def __init__(self, *paths: str):
+        """
+        Args:
+            *paths (str): The attribute paths to resolve, separated by dots.
+        """
+        self.paths: Tuple[str, ...] = paths
+        self._getter = attrgetter(*paths)
+
+    def __call__(self, obj: object, default: Optional[Any] = None) -> Tuple:
+        """
+        Resolve all attribute paths on the given object.
+
+        Args:
+            obj: The object from which to get the attributes.
+            default: The value used for any path that cannot be resolved.
+
+        Returns:
+            Tuple: The resolved values, in the order the paths were given.
+        """
+        try:
+            values = self._getter(obj)
+        except AttributeError:
+            return tuple(
+                nested_getattr(obj, path, default) for path in self.paths)
+        return values if len(self.paths) > 1 else (values,)
+
+
 def nested_hasattr(obj, attr: str) -> bool:
     """
     Recursively check if the nested attribute exists.
@@ -71,10 +163,10 @@ def nested_hasattr(obj, attr: str) -> bool:
         bool: True if the nested attribute exists, False otherwise.
     """
     try:
-        for key in attr.split('.'):
-            if not hasattr(obj, key):
+        for key in _split_path(attr):
+            obj = getattr(obj, key, _MISSING)
+            if obj is _MISSING:
                 return False
-            obj = getattr(obj, key)
         return True
     except AttributeError:
         return False
@@ -119,3 +211,139 @@ def helper_extraction_error(func):
             logger.error(error_message)
             return None
     return wrapper
+
+
+def next_temp_id() -> str:
+    """
+    Generate a temporary id for entities that do not expose an entityToken
+    (e.g. profile loops and profile curves).
+
+    Returns:
+        str: An id unique within the current process.
+    """
+    return f"{_TEMP_ID_PREFIX}-{next(_temp_id_counter)}"
+
+
+def assign_temp_id(
+        info: Optional[Dict[str, Any]]
+        ) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+    """
+    Ensure an extracted info dictionary has a tempId.
+
+    This is kept out of the (optionally threaded) extraction calls so that
+    ids are always handed out serially, in collection order.
+
+    Args:
+        info (Optional[Dict[str, Any]]): The extracted information.
+
+    Returns:
+        Tuple[Optional[str], Optional[Dict[str, Any]]]: The tempId and the
+            info dictionary, or (None, None) if nothing was extracted.
+    """
+    if info is None:
+        return None, None
+    temp_id: Optional[str] = info.get('tempId')
+    if temp_id is None:
+        temp_id = info['tempId'] = next_temp_id()
+    return temp_id, info
+
+
+def materialise(collection: Any) -> List[Any]:
+    """
+    Copy a Fusion collection into a Python list.
+
+    Fusion collections are read with one `count` call and one `item(i)` call
+    per element, so the collection is only walked across the API once.
+    Lists are returned as they are, and other objects without
+    `count`/`item` (including plain Python iterables) are copied with
+    `list()`.
+
+    Args:
+        collection: The Fusion collection or iterable to copy.
+
+    Returns:
+        List[Any]: The items of the collection, or an empty list for None.
+    """
+    if collection is None:
+        return []
+    if isinstance(collection, list):
+        return collection
+    count = getattr(collection, 'count', None)
+    item = getattr(collection, 'item', None)
+    if count is None or item is None:
+        return list(collection)
+    return [item(index) for index in range(count)]
+
+
+def collection_tokens(
+        collection: Any, id_attr: str = 'entityToken') -> List[Optional[str]]:
+    """
+    Extract the id of every item of a Fusion collection.
+
+    Args:
+        collection: The Fusion collection or iterable to read.
+        id_attr (str): The id attribute to read from each item.
+
+    Returns:
+        List[Optional[str]]: The ids, with None for items that lack one.
+    """
+    items = materialise(collection)
+    try:
+        # attrgetter runs the whole loop in C
+        return list(map(_id_getter(id_attr), items))
+    except AttributeError:
+        return [getattr(item, id_attr, None) for item in items]
+
+
+@lru_cache(maxsize=None)
+def _id_getter(id_attr: str) -> attrgetter:
+    """Build the attrgetter for an id attribute once and reuse it."""
+    return attrgetter(id_attr)
+
+
+def point_to_list(point: Any) -> List[float]:
+    """
+    Convert a Fusion Point3D or Vector3D into an [x, y, z] list.
+
+    Uses `getData()` so the three coordinates are fetched with a single API
+    call, falling back to the individual x, y and z attributes for objects
+    that do not provide it.
+
+    Args:
+        point: The Point3D or Vector3D to convert.
+
+    Returns:
+        List[float]: The x, y and z coordinates.
+    """
+    get_data = getattr(point, 'getData', None)
+    if get_data is not None:
+        success, x, y, z = get_data()
+        if success:
+            return [x, y, z]
+    return [point.x, point.y, point.z]
+
+
+def parallel_map(func, iterable):
+    """
+    Map an extraction function over a collection of independent objects.
+
+    When `PARALLEL_EXTRACT` is False (the default) this is a plain lazy
+    `map`. Otherwise, collections of at least `PARALLEL_EXTRACT_THRESHOLD`
+    items are distributed over a thread pool of `PARALLEL_EXTRACT_WORKERS`
+    threads, so the latency of each API call overlaps with the others.
+    Results are returned in input order.
+
+    Args:
+        func (function): The function to apply to each item.
+        iterable: The items to process.
+
+    Returns:
+        Iterable: The results, in the same order as the input.
+    """
+    if not PARALLEL_EXTRACT:
+        return map(func, iterable)
+    items = iterable if isinstance(iterable, list) else list(iterable)
+    if len(items) < PARALLEL_EXTRACT_THRESHOLD:
+        return map(func, items)
+    with ThreadPoolExecutor(max_workers=PARALLEL_EXTRACT_WORKERS) as executor:
+        return list(executor.map(func, items))
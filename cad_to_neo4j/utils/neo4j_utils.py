@@ -8,11 +8,31 @@ Classes:
     - Neo4jTransactionManager: Manages Neo4j transactions and driver lifecycle.
 """
 
-from neo4j import GraphDatabase, exceptions
+from neo4j import GraphDatabase, WRITE_ACCESS, exceptions
 import logging
 import time
 
-__all__ = ['Neo4jTransactionManager']
+__all__ = ['Neo4jTransactionManager', 'ENTITY_LABEL', 'ENTITY_CONSTRAINT_QUERY']
+
+# Label added to every loaded node so lookups by entityToken use the
+# uniqueness constraint's index instead of scanning all nodes
+ENTITY_LABEL: str = 'Entity'
+
+# Shared by the loader and the transformer, so the constraint they both
+# ensure under this name always has the same definition
+ENTITY_CONSTRAINT_QUERY = f"""
+CREATE CONSTRAINT entity_token IF NOT EXISTS
+FOR (n:{ENTITY_LABEL}) REQUIRE n.entityToken IS UNIQUE
+"""
+
+# Driver settings shared by every manager: keep pooled connections alive
+# between batches and check idle ones before reuse, so large loads do not
+# fail on (and retry after) stale sockets.
+DRIVER_CONFIG = {
+    'keep_alive': True,
+    'liveness_check_timeout': 30,
+    'connection_acquisition_timeout': 60,
+}
 
 
 class Neo4jTransactionManager(object):
@@ -22,14 +42,15 @@ class Neo4jTransactionManager(object):
 
     Attributes:
         driver (neo4j.GraphDatabase.driver): The Neo4j driver for database connections.
+        session (neo4j.Session): The session reused for every query inside the runtime context.
 
     Methods:
-        close(): Closes the Neo4j driver connection.
+        close(): Closes the session and the Neo4j driver connection.
         __enter__(): Enters the runtime context related to this object.
         __exit__(exc_type, exc_value, traceback): Exits the runtime context related to this object.
         execute_query(query, parameters=None): Executes a Cypher query and returns the results.
     """
-    def __init__(self, uri: str, user: str, password: str, logger: logging.Logger = None, max_retries: int = 5, timeout: int = 5):
+    def __init__(self, uri: str, user: str, password: str, logger: logging.Logger = None, max_retries: int = 5, timeout: int = 5, database: str = 'neo4j'):
         """
         Initialises the Neo4jTransactionManager with the provided database credentials.
 
@@ -40,20 +61,38 @@ class Neo4jTransactionManager(object):
             logger (logging.Logger, optional): The logger for logging messages and errors. Defaults to None.
             max_retries (int, optional): The maximum number of retries for connecting to the database. Defaults to 5.
             timeout (int, optional): The timeout in seconds between retries. Defaults to 5.
+            database (str, optional): The database every session is bound to, which spares the server a home database lookup per transaction. Defaults to 'neo4j'.
         """
         self.logger = logger if logger else logging.getLogger(__name__)
         self.max_retries = max_retries
         self.timeout = timeout
+        self._database = database
         self.driver = None
+        self.session = None
         self.connect(uri, user, password)
 
     def close(self):
         """
-        Closes the Neo4j driver connection.
+        Closes the session, if open, and the Neo4j driver connection.
         """
+        if self.session:
+            self.session.close()
+            self.session = None
         if self.driver:
             self.driver.close()
 
+    def open_session(self):
+        """
+        Opens a write session bound to the configured database.
+
+        Returns:
+            neo4j.Session: The new session.
+        """
+        return self.driver.session(
+            database=self._database,
+            default_access_mode=WRITE_ACCESS,
+            fetch_size=1000)
+
     def __enter__(self):
         """
         Enters the runtime context related to this object.
@@ -61,17 +100,16 @@ class Neo4jTransactionManager(object):
         Returns:
             Neo4jTransactionManager: The instance of Neo4jTransactionManager.
         """
-        self.session = self.driver.session()
+        self.session = self.open_session()
         return self
 
     def __exit__(self, *args):
         """
-        Exits the runtime context related to this object, ensuring the driver connection is closed.
+        Exits the runtime context related to this object, ensuring the session and driver connection are closed.
 
         Args:
             *args: The exception type, value, and traceback.
         """
-        self.session.close()
         self.close()
 
     def connect(self, uri: str, user: str, password: str):
@@ -86,7 +124,7 @@ class Neo4jTransactionManager(object):
         retries = 0
         while retries < self.max_retries:
             try:
-                self.driver = GraphDatabase.driver(uri, auth=(user, password))
+                self.driver = GraphDatabase.driver(uri, auth=(user, password), **DRIVER_CONFIG)
                 self.logger.info("Successfully connected to Neo4j")
                 return
             except exceptions.ServiceUnavailable as e: